@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_chat', '0002_chatmessage_chat_messag_session_597c4e_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedChatSession',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_id', models.BigIntegerField(unique=True)),
+                ('title', models.CharField(blank=True, max_length=200)),
+                ('message_count', models.PositiveIntegerField(default=0)),
+                ('messages', models.JSONField(default=list, help_text='Messages with their feedback, oldest first')),
+                ('created_at', models.DateTimeField()),
+                ('last_activity_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_chat_sessions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Archived Chat Session',
+                'verbose_name_plural': 'Archived Chat Sessions',
+                'db_table': 'archived_chat_sessions',
+                'indexes': [models.Index(fields=['user', '-created_at'], name='archived_ch_user_id_300612_idx')],
+            },
+        ),
+    ]
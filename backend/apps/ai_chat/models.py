@@ -20,6 +20,9 @@ class ChatSession(BaseModel):
         verbose_name = 'Chat Session'
         verbose_name_plural = 'Chat Sessions'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
 
     def __str__(self):
         return f"Chat Session {self.id} - {self.user.get_full_name()}"
@@ -53,6 +56,10 @@ class ChatMessage(BaseModel):
         verbose_name = 'Chat Message'
         verbose_name_plural = 'Chat Messages'
         ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['session', 'created_at']),
+            models.Index(fields=['session', 'message_type', 'created_at']),
+        ]
 
     def __str__(self):
         return f"{self.message_type.title()} message in {self.session}"
@@ -111,4 +118,30 @@ class ChatFeedback(BaseModel):
         unique_together = ['message', 'user']  # One feedback per user per message
 
     def __str__(self):
-        return f"Feedback {self.rating}/5 for message {self.message.id}"
\ No newline at end of file
+        return f"Feedback {self.rating}/5 for message {self.message.id}"
+
+
+class ArchivedChatSession(models.Model):
+    """
+    Compact copy of an idle chat session with its messages stored inline as JSON.
+    Written by `manage.py apply_retention`.
+    """
+    original_id = models.BigIntegerField(unique=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_chat_sessions')
+    title = models.CharField(max_length=200, blank=True)
+    message_count = models.PositiveIntegerField(default=0)
+    messages = models.JSONField(default=list, help_text="Messages with their feedback, oldest first")
+    created_at = models.DateTimeField()
+    last_activity_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'archived_chat_sessions'
+        verbose_name = 'Archived Chat Session'
+        verbose_name_plural = 'Archived Chat Sessions'
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"Archived chat session {self.original_id}"
@@ -0,0 +1,73 @@
+"""
+Cached JWT authentication for KindBite.
+
+The stock simplejwt authenticator loads the User row by primary key on every
+request. CachedJWTAuthentication keeps the authenticated user in the cache
+for a short TTL under a versioned key (`auth:user:<id>:<version>`). Saving or
+deleting a user bumps the version, so a password change, deactivation or role
+change is seen on the next request by every process sharing the Redis cache
+(with the development local-memory cache, other processes see it within
+CACHE_LOCAL_MAX_SECONDS). Code that changes users with QuerySet.update() must
+call invalidate_user() itself.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+VERSION_KEY = 'auth:user-version:{user_id}'
+USER_KEY = 'auth:user:{user_id}:{version}'
+
+
+def _user_key(user_id):
+    version = cache.get(VERSION_KEY.format(user_id=user_id), 0)
+    return USER_KEY.format(user_id=user_id, version=version)
+
+
+def invalidate_user(user_id):
+    """
+    Retire every cached copy of a user by moving to a new version,
+    now and again once the current transaction commits.
+    """
+    def bump():
+        cache.set(VERSION_KEY.format(user_id=user_id), uuid.uuid4().hex, settings.CACHE_VERSION_TIMEOUT)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def get_cached_user(user_model, user_id):
+    """Return the user from the cache, loading and caching it on a miss."""
+    key = _user_key(user_id)
+    user = cache.get(key)
+    if user is None:
+        user = user_model.objects.get(**{api_settings.USER_ID_FIELD: user_id})
+        cache.set(key, user, settings.AUTH_USER_CACHE_TIMEOUT)
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that serves request.user from the versioned user cache.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        try:
+            user = get_cached_user(self.user_model, user_id)
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        return user
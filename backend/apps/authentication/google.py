@@ -0,0 +1,153 @@
+"""
+Google OAuth (OpenID Connect) client for the social login callback.
+
+All calls go through one pooled requests.Session with explicit timeouts. The
+discovery document and Google's signing keys (JWKS) are cached, and the
+ID token returned by the code exchange is verified locally, so a login costs
+a single round trip to Google (the token exchange). The userinfo endpoint is
+only called when the token response carries no ID token.
+
+Endpoints come from GOOGLE_OAUTH['DISCOVERY_URL']; point it at
+`manage.py run_google_stub` to exercise the flow without Google.
+"""
+import re
+import threading
+
+import jwt
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+
+DISCOVERY_CACHE_KEY = 'google-oauth:discovery'
+JWKS_CACHE_KEY = 'google-oauth:jwks'
+MAX_AGE = re.compile(r'max-age=(\d+)')
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class GoogleOAuthError(Exception):
+    """Raised when Google rejects the exchange or returns an unusable token."""
+
+
+def get_session():
+    """Process-wide HTTP session with a keep-alive connection pool."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=settings.GOOGLE_OAUTH['POOL_SIZE'],
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def _get_json(url):
+    try:
+        response = get_session().get(url, timeout=settings.GOOGLE_OAUTH['TIMEOUT'])
+        response.raise_for_status()
+        return response, response.json()
+    except (requests.RequestException, ValueError) as e:
+        raise GoogleOAuthError(f'Could not fetch {url}: {e}') from e
+
+
+def _max_age(response, default):
+    match = MAX_AGE.search(response.headers.get('Cache-Control', ''))
+    return int(match.group(1)) if match else default
+
+
+def discovery():
+    """The OpenID configuration (endpoints, issuer), cached for a day or its max-age."""
+    document = cache.get(DISCOVERY_CACHE_KEY)
+    if document is None:
+        response, document = _get_json(settings.GOOGLE_OAUTH['DISCOVERY_URL'])
+        cache.set(DISCOVERY_CACHE_KEY, document, _max_age(response, 86400))
+    return document
+
+
+def _jwks(refresh=False):
+    keys = None if refresh else cache.get(JWKS_CACHE_KEY)
+    if keys is None:
+        response, keys = _get_json(discovery()['jwks_uri'])
+        cache.set(JWKS_CACHE_KEY, keys, _max_age(response, settings.GOOGLE_OAUTH['JWKS_CACHE_SECONDS']))
+    return keys
+
+
+def signing_key(kid):
+    """
+    Public key for a key id. An unknown kid refetches the JWKS once, since
+    Google rotates its keys.
+    """
+    for refresh in (False, True):
+        for key in _jwks(refresh=refresh).get('keys', []):
+            if key.get('kid') == kid:
+                return jwt.PyJWK(key).key
+    raise GoogleOAuthError('ID token is signed with an unknown key')
+
+
+def verify_id_token(id_token):
+    """Verify an ID token's signature, audience, issuer and expiry; return its claims."""
+    try:
+        header = jwt.get_unverified_header(id_token)
+        issuer = discovery()['issuer']
+        claims = jwt.decode(
+            id_token,
+            signing_key(header.get('kid')),
+            algorithms=['RS256'],
+            audience=settings.GOOGLE_OAUTH['CLIENT_ID'],
+            issuer=[issuer, issuer.removeprefix('https://')],
+            leeway=settings.GOOGLE_OAUTH['CLOCK_SKEW_SECONDS'],
+        )
+    except jwt.PyJWTError as e:
+        raise GoogleOAuthError(f'Invalid ID token: {e}') from e
+
+    if not claims.get('email') or claims.get('email_verified') is False:
+        raise GoogleOAuthError('Google account has no verified email.')
+    return claims
+
+
+def exchange_code(code):
+    """
+    Exchange an authorization code and return the user's claims
+    (email, given_name, family_name, picture).
+    """
+    config = settings.GOOGLE_OAUTH
+    try:
+        response = get_session().post(
+            discovery()['token_endpoint'],
+            data={
+                'code': code,
+                'client_id': config['CLIENT_ID'],
+                'client_secret': config['CLIENT_SECRET'],
+                'redirect_uri': config['REDIRECT_URI'],
+                'grant_type': 'authorization_code',
+            },
+            timeout=config['TIMEOUT'],
+        )
+        response.raise_for_status()
+        tokens = response.json()
+    except (requests.RequestException, ValueError) as e:
+        raise GoogleOAuthError(f'Failed to exchange the authorization code: {e}') from e
+
+    if tokens.get('id_token'):
+        return verify_id_token(tokens['id_token'])
+
+    access_token = tokens.get('access_token')
+    if not access_token:
+        raise GoogleOAuthError('Failed to get access token from Google.')
+    try:
+        response = get_session().get(
+            discovery()['userinfo_endpoint'],
+            headers={'Authorization': f'Bearer {access_token}'},
+            timeout=config['TIMEOUT'],
+        )
+        response.raise_for_status()
+        return response.json()
+    except (requests.RequestException, ValueError) as e:
+        raise GoogleOAuthError(f'Failed to fetch the Google profile: {e}') from e
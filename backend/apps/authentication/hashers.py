@@ -0,0 +1,28 @@
+"""
+Password hashers for KindBite.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, must_update_salt
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with the iteration count taken from settings.PASSWORD_HASH_ITERATIONS.
+
+    Keeps the `pbkdf2_sha256` algorithm name and stores the iterations in each
+    hash, so existing passwords keep verifying. Lower counts are only meant
+    for local load tests; when the setting goes back to the default, cheaper
+    hashes are upgraded on the next successful login. Hashes stronger than the
+    current setting are never rewritten down to it.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_HASH_ITERATIONS or PBKDF2PasswordHasher.iterations
+
+    def must_update(self, encoded):
+        decoded = self.decode(encoded)
+        return (
+            decoded['iterations'] < self.iterations
+            or must_update_salt(decoded['salt'], self.salt_entropy)
+        )
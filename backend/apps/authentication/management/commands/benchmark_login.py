@@ -0,0 +1,102 @@
+"""
+Management command to benchmark login throughput.
+Creates synthetic users inside a transaction, logs them in through the login
+view and rolls everything back.
+"""
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test.utils import override_settings
+from rest_framework.test import APIRequestFactory
+
+from apps.authentication.views import KindBiteTokenObtainPairView
+from apps.users.models import User
+
+
+BENCH_PASSWORD = 'benchmark-password-123'
+
+
+class Command(BaseCommand):
+    help = 'Benchmark logins through the JWT login view (changes are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=20,
+            help='Number of synthetic users to create (default: 20)',
+        )
+        parser.add_argument(
+            '--logins',
+            type=int,
+            default=200,
+            help='Number of logins to perform (default: 200)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=None,
+            help='PBKDF2 iterations for this run (default: PASSWORD_HASH_ITERATIONS or Django default)',
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations'] or settings.PASSWORD_HASH_ITERATIONS
+        with override_settings(PASSWORD_HASH_ITERATIONS=iterations), transaction.atomic():
+            hasher = get_hasher()
+            self.stdout.write(f'🔑 Hasher: {hasher.algorithm} ({hasher.iterations} iterations)')
+
+            started = time.perf_counter()
+            hasher.encode(BENCH_PASSWORD, hasher.salt())
+            hash_seconds = time.perf_counter() - started
+
+            self.stdout.write(f'👥 Creating {options["users"]} synthetic users...')
+            emails = self._seed(options['users'])
+
+            factory = APIRequestFactory()
+            view = KindBiteTokenObtainPairView.as_view()
+            failures = 0
+
+            self.stdout.write(f'🚪 Performing {options["logins"]} logins...')
+            started = time.perf_counter()
+            for i in range(options['logins']):
+                request = factory.post(
+                    '/api/auth/login/',
+                    {'email': emails[i % len(emails)], 'password': BENCH_PASSWORD},
+                    format='json',
+                )
+                if view(request).status_code != 200:
+                    failures += 1
+            elapsed = time.perf_counter() - started
+
+            transaction.set_rollback(True)
+
+        logins = options['logins']
+        per_login = elapsed / logins if logins else 0
+        rate = logins / elapsed if elapsed else 0
+        self.stdout.write(f'   one hash:  {hash_seconds * 1000:.1f}ms')
+        self.stdout.write(f'   per login: {per_login * 1000:.1f}ms ({per_login / hash_seconds:.1f}x one hash)')
+        self.stdout.write(f'   elapsed:   {elapsed:.2f}s ({rate:,.1f} logins/s)')
+        if failures:
+            self.stdout.write(self.style.ERROR(f'✗ {failures} logins failed'))
+        else:
+            self.stdout.write(self.style.SUCCESS('✓ Login benchmark complete (rolled back)'))
+
+    def _seed(self, total):
+        """Create users sharing one password hash; returns their emails."""
+        probe = User(email='probe@benchmark.invalid')
+        probe.set_password(BENCH_PASSWORD)
+        users = User.objects.bulk_create([
+            User(
+                email=f'login-bench-{i}@benchmark.invalid',
+                password=probe.password,
+                first_name='Bench',
+                last_name=str(i),
+                phone='+256700000000',
+                location='benchmark',
+            )
+            for i in range(total)
+        ])
+        return [user.email for user in users]
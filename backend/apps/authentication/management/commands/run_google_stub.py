@@ -0,0 +1,161 @@
+"""
+Management command that runs a local stand-in for Google's OAuth endpoints.
+Serves discovery, JWKS, token and userinfo endpoints and signs ID tokens with
+a throwaway RSA key, so the Google login flow can be exercised without Google.
+
+The authorization code doubles as the account: `alice` logs in as
+alice@example.com, a full email address is used as is, and `invalid` is
+rejected like an expired code.
+"""
+import json
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from jwt.algorithms import RSAAlgorithm
+
+
+class GoogleStub:
+    """Key material and token logic shared by the request handlers."""
+
+    def __init__(self, base_url, client_id):
+        self.base_url = base_url
+        self.client_id = client_id
+        self.kid = uuid.uuid4().hex
+        self.private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+    def discovery(self):
+        return {
+            'issuer': self.base_url,
+            'authorization_endpoint': f'{self.base_url}/o/oauth2/v2/auth',
+            'token_endpoint': f'{self.base_url}/token',
+            'userinfo_endpoint': f'{self.base_url}/userinfo',
+            'jwks_uri': f'{self.base_url}/certs',
+            'id_token_signing_alg_values_supported': ['RS256'],
+        }
+
+    def jwks(self):
+        key = json.loads(RSAAlgorithm.to_jwk(self.private_key.public_key()))
+        key.update({'kid': self.kid, 'use': 'sig', 'alg': 'RS256'})
+        return {'keys': [key]}
+
+    def profile(self, code):
+        email = code if '@' in code else f'{code}@example.com'
+        given_name = email.split('@')[0].split('.')[0].title()
+        return {
+            'sub': str(uuid.uuid5(uuid.NAMESPACE_URL, email).int)[:21],
+            'email': email,
+            'email_verified': True,
+            'given_name': given_name,
+            'family_name': 'Stub',
+            'picture': '',
+        }
+
+    def id_token(self, profile):
+        now = int(time.time())
+        claims = {
+            **profile,
+            'iss': self.base_url,
+            'aud': self.client_id,
+            'iat': now,
+            'exp': now + 3600,
+        }
+        return jwt.encode(claims, self.private_key, algorithm='RS256', headers={'kid': self.kid})
+
+
+def make_handler(stub, verbose):
+    class Handler(BaseHTTPRequestHandler):
+        def _json(self, status, body, max_age=None):
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            if max_age is not None:
+                self.send_header('Cache-Control', f'public, max-age={max_age}')
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == '/.well-known/openid-configuration':
+                return self._json(200, stub.discovery(), max_age=3600)
+            if url.path == '/certs':
+                return self._json(200, stub.jwks(), max_age=3600)
+            if url.path == '/userinfo':
+                token = self.headers.get('Authorization', '').removeprefix('Bearer ')
+                if not token.startswith('stub-'):
+                    return self._json(401, {'error': 'invalid_token'})
+                return self._json(200, stub.profile(token.removeprefix('stub-')))
+            if url.path == '/o/oauth2/v2/auth':
+                query = parse_qs(url.query)
+                redirect_uri = query.get('redirect_uri', [''])[0]
+                params = {'code': query.get('login_hint', ['stub.user'])[0]}
+                if 'state' in query:
+                    params['state'] = query['state'][0]
+                self.send_response(302)
+                self.send_header('Location', f'{redirect_uri}?{urlencode(params)}')
+                self.end_headers()
+                return None
+            return self._json(404, {'error': 'not_found'})
+
+        def do_POST(self):
+            if urlparse(self.path).path != '/token':
+                return self._json(404, {'error': 'not_found'})
+            length = int(self.headers.get('Content-Length', 0))
+            form = parse_qs(self.rfile.read(length).decode())
+            code = form.get('code', [''])[0]
+            if not code or code == 'invalid':
+                return self._json(400, {'error': 'invalid_grant'})
+            if form.get('client_id', [''])[0] != stub.client_id:
+                return self._json(401, {'error': 'invalid_client'})
+            profile = stub.profile(code)
+            return self._json(200, {
+                'access_token': f'stub-{code}',
+                'expires_in': 3599,
+                'token_type': 'Bearer',
+                'scope': 'openid email profile',
+                'id_token': stub.id_token(profile),
+            })
+
+        def log_message(self, format, *args):
+            if verbose:
+                super().log_message(format, *args)
+
+    return Handler
+
+
+class Command(BaseCommand):
+    help = 'Run a local stub of the Google OAuth endpoints for tests and load tests'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+        parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+        parser.add_argument(
+            '--client-id',
+            default=None,
+            help='OAuth client id to accept and use as ID token audience (default: GOOGLE_OAUTH["CLIENT_ID"])',
+        )
+        parser.add_argument('--quiet', action='store_true', help='Do not log requests')
+
+    def handle(self, *args, **options):
+        base_url = f'http://{options["host"]}:{options["port"]}'
+        client_id = options['client_id'] or settings.GOOGLE_OAUTH['CLIENT_ID'] or 'kindbite-stub-client'
+        stub = GoogleStub(base_url, client_id)
+        server = ThreadingHTTPServer(
+            (options['host'], options['port']),
+            make_handler(stub, verbose=not options['quiet']),
+        )
+
+        self.stdout.write(f'🔐 Google OAuth stub listening on {base_url} (client id: {client_id})')
+        self.stdout.write(f'   GOOGLE_DISCOVERY_URL={base_url}/.well-known/openid-configuration')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            self.stdout.write('\n⏹️  Stopping Google OAuth stub')
+        finally:
+            server.server_close()
@@ -4,9 +4,12 @@ Clean, secure authentication handling.
 """
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.settings import api_settings
 from django.contrib.auth import authenticate
+from django.contrib.auth.models import update_last_login
 from apps.users.models import User
 from apps.users.serializers import UserCreateSerializer
+from .tokens import add_user_claims
 
 
 class KindBiteTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -15,17 +18,15 @@ class KindBiteTokenObtainPairSerializer(TokenObtainPairSerializer):
     """
     @classmethod
     def get_token(cls, user):
-        token = super().get_token(user)
-        
-        # Add custom claims
-        token['user_role'] = user.user_role
-        token['full_name'] = user.get_full_name()
-        token['kind_coins'] = user.kind_coins
-        
-        return token
+        return add_user_claims(super().get_token(user), user)
     
     def validate(self, attrs):
-        """Custom validation with better error messages."""
+        """
+        Custom validation with better error messages.
+        Checks the password hash exactly once and issues the token pair itself
+        instead of calling TokenObtainPairSerializer.validate, which would
+        authenticate a second time. The user is available as `self.user`.
+        """
         email = attrs.get('email')
         password = attrs.get('password')
         
@@ -48,8 +49,15 @@ class KindBiteTokenObtainPairSerializer(TokenObtainPairSerializer):
                     code='authorization'
                 )
             
-            attrs['user'] = user
-            return super().validate(attrs)
+            self.user = user
+            refresh = self.get_token(user)
+            if api_settings.UPDATE_LAST_LOGIN:
+                update_last_login(None, user)
+            
+            return {
+                'refresh': str(refresh),
+                'access': str(refresh.access_token),
+            }
         
         raise serializers.ValidationError(
             'Must include "email" and "password".',
@@ -97,8 +105,8 @@ class RegisterSerializer(UserCreateSerializer):
         pass
     
     def validate_email(self, value):
-        """Check if email is already registered."""
-        if User.objects.filter(email=value).exists():
+        """Check if email is already registered (soft-deleted accounts included)."""
+        if User.all_objects.filter(email=value).exists():
             raise serializers.ValidationError(
                 'A user with this email already exists.'
             )
@@ -0,0 +1,15 @@
+"""
+Signal handlers for authentication.
+"""
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_user
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop cached copies of a user after any save (password, role, deactivation) or delete."""
+    invalidate_user(instance.pk)
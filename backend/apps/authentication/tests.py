@@ -0,0 +1,123 @@
+"""
+Tests for the authentication app.
+"""
+import time
+from unittest import mock
+
+import jwt
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from apps.users.models import User
+from . import google
+from .management.commands.run_google_stub import GoogleStub
+
+
+STUB_URL = 'https://google-stub.invalid'
+CLIENT_ID = 'kindbite-test-client'
+GOOGLE_OAUTH = {
+    **settings.GOOGLE_OAUTH,
+    'CLIENT_ID': CLIENT_ID,
+    'CLIENT_SECRET': 'kindbite-test-secret',
+    'DISCOVERY_URL': f'{STUB_URL}/.well-known/openid-configuration',
+}
+
+
+class FakeResponse:
+    def __init__(self, body, max_age=None):
+        self.body = body
+        self.headers = {'Cache-Control': f'max-age={max_age}'} if max_age else {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+@override_settings(GOOGLE_OAUTH=GOOGLE_OAUTH)
+class GoogleCallbackTests(APITestCase):
+    """The callback verifies the ID token from the code exchange against the stubbed JWKS."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.stub = GoogleStub(STUB_URL, CLIENT_ID)
+
+    def setUp(self):
+        cache.delete_many([google.DISCOVERY_CACHE_KEY, google.JWKS_CACHE_KEY])
+        self.id_token = self.stub.id_token(self.stub.profile('alice'))
+        self.session = mock.Mock()
+        self.session.get.side_effect = self.fake_get
+        self.session.post.side_effect = lambda url, **kwargs: FakeResponse({'id_token': self.id_token})
+        patcher = mock.patch.object(google, 'get_session', return_value=self.session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fake_get(self, url, **kwargs):
+        documents = {
+            GOOGLE_OAUTH['DISCOVERY_URL']: self.stub.discovery(),
+            self.stub.discovery()['jwks_uri']: self.stub.jwks(),
+        }
+        return FakeResponse(documents[url], max_age=3600)
+
+    def signed(self, **claims):
+        """An ID token for alice with some claims overridden."""
+        now = int(time.time())
+        payload = {
+            **self.stub.profile('alice'),
+            'iss': STUB_URL,
+            'aud': CLIENT_ID,
+            'iat': now,
+            'exp': now + 3600,
+            **claims,
+        }
+        return jwt.encode(payload, self.stub.private_key, algorithm='RS256', headers={'kid': self.stub.kid})
+
+    def login(self):
+        return self.client.post('/api/auth/google/callback/', {'code': 'alice'}, format='json')
+
+    def test_valid_token_creates_user(self):
+        response = self.login()
+
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertTrue(response.json()['created'])
+        user = User.objects.get(email='alice@example.com')
+        self.assertEqual(user.first_name, 'Alice')
+        self.assertFalse(user.has_usable_password())
+
+    def test_expired_token_is_rejected(self):
+        leeway = GOOGLE_OAUTH['CLOCK_SKEW_SECONDS']
+        self.id_token = self.signed(iat=int(time.time()) - 7200, exp=int(time.time()) - leeway - 60)
+
+        response = self.login()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('expired', response.json()['error'])
+        self.assertFalse(User.all_objects.filter(email='alice@example.com').exists())
+
+    def test_wrong_audience_is_rejected(self):
+        self.id_token = self.signed(aud='someone-elses-client')
+
+        response = self.login()
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Audience', response.json()['error'])
+        self.assertFalse(User.all_objects.filter(email='alice@example.com').exists())
+
+    def test_second_login_reuses_user_and_cached_keys(self):
+        first = self.login()
+        self.session.get.reset_mock()
+
+        second = self.login()
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 200, second.content)
+        self.assertFalse(second.json()['created'])
+        self.assertEqual(second.json()['user']['id'], first.json()['user']['id'])
+        self.assertEqual(User.objects.filter(email='alice@example.com').count(), 1)
+        # Discovery and JWKS come from the cache: the code exchange is the only call
+        self.session.get.assert_not_called()
+        self.assertEqual(self.session.post.call_count, 2)
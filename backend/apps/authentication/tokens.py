@@ -0,0 +1,25 @@
+"""
+JWT issuing helpers shared by every login path (password, registration, Google).
+"""
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+def add_user_claims(token, user):
+    """
+    Add KindBite claims to a token. Access tokens derived from the refresh
+    token inherit them, so clients and role checks can read user_role
+    without another lookup.
+    """
+    token['user_role'] = user.user_role
+    token['full_name'] = user.get_full_name()
+    token['kind_coins'] = user.kind_coins
+    return token
+
+
+def tokens_for_user(user):
+    """Return {'refresh': ..., 'access': ...} token strings carrying the user claims."""
+    refresh = add_user_claims(RefreshToken.for_user(user), user)
+    return {
+        'refresh': str(refresh),
+        'access': str(refresh.access_token),
+    }
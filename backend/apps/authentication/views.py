@@ -2,13 +2,14 @@
 Authentication views for KindBite.
 Clean, secure authentication endpoints.
 """
-import os
 from rest_framework import status, permissions
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth import logout
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.tokens import default_token_generator
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
@@ -21,6 +22,8 @@ from .serializers import (
     PasswordChangeSerializer, PasswordResetRequestSerializer,
     PasswordResetConfirmSerializer, GoogleAuthSerializer
 )
+from . import google
+from .tokens import tokens_for_user
 
 
 class KindBiteTokenObtainPairView(TokenObtainPairView):
@@ -30,20 +33,22 @@ class KindBiteTokenObtainPairView(TokenObtainPairView):
     serializer_class = KindBiteTokenObtainPairSerializer
     
     def post(self, request, *args, **kwargs):
-        """Enhanced login response with user data."""
-        response = super().post(request, *args, **kwargs)
+        """Enhanced login response with user data; credentials are validated once."""
+        serializer = self.get_serializer(data=request.data)
         
-        if response.status_code == 200:
-            serializer = self.get_serializer(data=request.data)
+        try:
             serializer.is_valid(raise_exception=True)
-            user = serializer.user
-            
-            # Add user data to response
-            user_serializer = UserDetailSerializer(user)
-            response.data['user'] = user_serializer.data
-            response.data['message'] = f'Welcome back, {user.get_full_name()}!'
+        except TokenError as e:
+            raise InvalidToken(e.args[0])
+        
+        user = serializer.user
+        data = dict(serializer.validated_data)
         
-        return response
+        # Add user data to response
+        data['user'] = UserDetailSerializer(user).data
+        data['message'] = f'Welcome back, {user.get_full_name()}!'
+        
+        return Response(data, status=status.HTTP_200_OK)
 
 
 @api_view(['POST'])
@@ -57,19 +62,14 @@ def register(request):
     if serializer.is_valid():
         user = serializer.save()
         
-        # Generate tokens for immediate login
-        refresh = RefreshToken.for_user(user)
-        
         # Prepare response data
         user_data = UserDetailSerializer(user).data
         
         return Response({
             'message': f'Welcome to KindBite, {user.get_full_name()}!',
             'user': user_data,
-            'tokens': {
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
-            }
+            # Tokens for immediate login
+            'tokens': tokens_for_user(user)
         }, status=status.HTTP_201_CREATED)
     
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -234,26 +234,30 @@ def google_auth_url(request):
     """
     import urllib.parse
     
-    google_client_id = os.environ.get('GOOGLE_CLIENT_ID', '')
-    # Redirect to frontend, which will extract the code and send it to backend
-    redirect_uri = os.environ.get('GOOGLE_REDIRECT_URI', 'https://kindbite.pythonanywhere.com/')
-    
-    if not google_client_id:
+    config = settings.GOOGLE_OAUTH
+    if not config['CLIENT_ID']:
         return Response({
             'error': 'Google OAuth is not configured.'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
     
-    # Build Google OAuth URL
+    try:
+        authorization_endpoint = google.discovery()['authorization_endpoint']
+    except google.GoogleOAuthError as e:
+        return Response({
+            'error': str(e)
+        }, status=status.HTTP_502_BAD_GATEWAY)
+    
+    # Redirect to frontend, which will extract the code and send it to backend
     params = {
-        'client_id': google_client_id,
-        'redirect_uri': redirect_uri,
+        'client_id': config['CLIENT_ID'],
+        'redirect_uri': config['REDIRECT_URI'],
         'response_type': 'code',
         'scope': 'openid email profile',
         'access_type': 'offline',
         'prompt': 'consent',
     }
     
-    auth_url = f"https://accounts.google.com/o/oauth2/v2/auth?{urllib.parse.urlencode(params)}"
+    auth_url = f"{authorization_endpoint}?{urllib.parse.urlencode(params)}"
     
     return Response({
         'auth_url': auth_url
@@ -265,15 +269,11 @@ def google_auth_url(request):
 def google_auth_callback(request):
     """
     Handle Google OAuth callback and authenticate user.
+    One round trip to Google: the code exchange returns an ID token that is
+    verified locally against the cached JWKS.
     """
-    import requests
-    
-    google_client_id = os.environ.get('GOOGLE_CLIENT_ID', '')
-    google_client_secret = os.environ.get('GOOGLE_CLIENT_SECRET', '')
-    # Note: This should match the redirect_uri used in google_auth_url
-    redirect_uri = os.environ.get('GOOGLE_REDIRECT_URI', 'https://kindbite.pythonanywhere.com/')
-    
-    if not google_client_id or not google_client_secret:
+    config = settings.GOOGLE_OAUTH
+    if not config['CLIENT_ID'] or not config['CLIENT_SECRET']:
         return Response({
             'error': 'Google OAuth is not configured.'
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -285,128 +285,64 @@ def google_auth_callback(request):
             'error': 'Authorization code is required.'
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    # Exchange authorization code for access token
-    token_url = 'https://oauth2.googleapis.com/token'
-    token_data = {
-        'code': code,
-        'client_id': google_client_id,
-        'client_secret': google_client_secret,
-        'redirect_uri': redirect_uri,
-        'grant_type': 'authorization_code',
-    }
-    
     try:
-        token_response = requests.post(token_url, data=token_data)
-        token_response.raise_for_status()
-        token_json = token_response.json()
-        access_token = token_json.get('access_token')
-        
-        if not access_token:
-            return Response({
-                'error': 'Failed to get access token from Google.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Get user info from Google
-        user_info_url = 'https://www.googleapis.com/oauth2/v2/userinfo'
-        headers = {'Authorization': f'Bearer {access_token}'}
-        user_info_response = requests.get(user_info_url, headers=headers)
-        user_info_response.raise_for_status()
-        user_info = user_info_response.json()
-        
-        # Extract user information
-        email = user_info.get('email')
-        first_name = user_info.get('given_name', '')
-        last_name = user_info.get('family_name', '')
-        profile_picture = user_info.get('picture', '')
-        
-        if not email:
-            return Response({
-                'error': 'Email not provided by Google.'
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
-        # Get or create user
-        try:
-            user = User.objects.get(email=email)
-            created = False
-        except User.DoesNotExist:
-            # Create new user using the manager (handles password properly)
-            # Generate a random password for OAuth users (they'll use Google to login)
-            import secrets
-            random_password = secrets.token_urlsafe(32)
-            user = User.objects.create_user(
-                email=email,
-                password=random_password,  # Random password, user won't use it
-                first_name=first_name,
-                last_name=last_name,
-                profile_image=profile_picture,
-                is_active=True,
-                phone='+0000000000',  # Default phone, user can update later
-                location='Unknown',  # Default location, user can update later
-            )
-            created = True
-        
-        # Update user info if user already exists
-        if not created:
-            if first_name and not user.first_name:
-                user.first_name = first_name
-            if last_name and not user.last_name:
-                user.last_name = last_name
-            if profile_picture and not user.profile_image:
-                user.profile_image = profile_picture
-            user.save()
-        
-        # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
-        
-        # Prepare response data
-        user_data = UserDetailSerializer(user).data
-        
+        user_info = google.exchange_code(code)
+    except google.GoogleOAuthError as e:
         return Response({
-            'message': f'Welcome {"back" if not created else "to KindBite"}, {user.get_full_name()}!',
-            'user': user_data,
-            'tokens': {
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
-            },
-            'created': created
-        }, status=status.HTTP_200_OK if not created else status.HTTP_201_CREATED)
-        
-    except requests.RequestException as e:
+            'error': f'Failed to authenticate with Google: {e}'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    # Extract user information
+    email = user_info.get('email')
+    first_name = user_info.get('given_name', '')
+    last_name = user_info.get('family_name', '')
+    profile_picture = user_info.get('picture', '')
+    
+    if not email:
         return Response({
-            'error': f'Failed to authenticate with Google: {str(e)}'
+            'error': 'Email not provided by Google.'
         }, status=status.HTTP_400_BAD_REQUEST)
-    except Exception as e:
+    
+    # OAuth users sign in through Google, so they get an unusable password
+    # (no hashing cost); get_or_create also copes with two concurrent first logins.
+    # It goes through all_objects so a soft-deleted account is found, not re-inserted.
+    user, created = User.all_objects.get_or_create(
+        email=User.objects.normalize_email(email),
+        defaults={
+            'password': make_password(None),
+            'first_name': first_name,
+            'last_name': last_name,
+            'profile_image': profile_picture,
+            'is_active': True,
+            'phone': '+0000000000',  # Default phone, user can update later
+            'location': 'Unknown',  # Default location, user can update later
+        },
+    )
+    
+    if not user.is_active or user.is_deleted:
         return Response({
-            'error': f'An error occurred: {str(e)}'
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+            'error': 'User account is disabled.'
+        }, status=status.HTTP_403_FORBIDDEN)
+    
+    # Fill in profile fields the existing user has not set yet
+    if not created:
+        updates = {
+            'first_name': first_name,
+            'last_name': last_name,
+            'profile_image': profile_picture,
+        }
+        changed = [field for field, value in updates.items() if value and not getattr(user, field)]
+        for field in changed:
+            setattr(user, field, updates[field])
+        if changed:
+            user.save(update_fields=changed + ['updated_at'])
+    
+    # Prepare response data
+    user_data = UserDetailSerializer(user).data
+    
+    return Response({
+        'message': f'Welcome {"back" if not created else "to KindBite"}, {user.get_full_name()}!',
+        'user': user_data,
+        'tokens': tokens_for_user(user),
+        'created': created
+    }, status=status.HTTP_200_OK if not created else status.HTTP_201_CREATED)
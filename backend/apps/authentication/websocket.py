@@ -0,0 +1,36 @@
+"""
+JWT authentication for WebSocket connections.
+Browsers cannot set an Authorization header on WebSockets, so the access token
+is passed in the query string: ws/notifications/?token=<access token>.
+"""
+from urllib.parse import parse_qs
+
+from channels.db import database_sync_to_async
+from channels.middleware import BaseMiddleware
+from django.contrib.auth.models import AnonymousUser
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+
+from .authentication import CachedJWTAuthentication
+
+
+@database_sync_to_async
+def get_user_for_token(raw_token):
+    """Return the user for a valid access token, or AnonymousUser."""
+    authentication = CachedJWTAuthentication()
+    try:
+        validated_token = authentication.get_validated_token(raw_token)
+        return authentication.get_user(validated_token)
+    except (InvalidToken, AuthenticationFailed):
+        return AnonymousUser()
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+    """
+    Populate scope['user'] from the `token` query-string parameter.
+    """
+
+    async def __call__(self, scope, receive, send):
+        query = parse_qs(scope.get('query_string', b'').decode())
+        token = (query.get('token') or [None])[0]
+        scope['user'] = await get_user_for_token(token) if token else AnonymousUser()
+        return await super().__call__(scope, receive, send)
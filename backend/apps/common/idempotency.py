@@ -0,0 +1,175 @@
+"""
+Idempotency-Key support for POST endpoints.
+A retried request with the same key replays the stored response without re-running the view.
+"""
+import hashlib
+import json
+from functools import wraps
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http.request import RawPostDataException
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+
+
+def _find_request(args):
+    """Return the DRF request from function-view or method-view arguments."""
+    for arg in args[:2]:
+        if isinstance(arg, Request):
+            return arg
+    raise TypeError('idempotent views must receive a DRF Request')
+
+
+def _hash_form(digest, request):
+    """
+    Hash a parsed multipart form: its fields, then each upload's name, size and
+    content, streamed chunk by chunk so large files are never held in memory.
+    """
+    digest.update(json.dumps(sorted(request.POST.lists()), default=str).encode())
+    for field in sorted(request.FILES):
+        for upload in request.FILES.getlist(field):
+            digest.update(f'{field}:{upload.name}:{upload.size}'.encode())
+            for chunk in upload.chunks():
+                digest.update(chunk)
+            upload.seek(0)
+
+
+def _fingerprint(request):
+    """Hash the parts of a request that must match for a replay to be valid."""
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(request.path.encode())
+    if request.content_type.startswith('multipart/'):
+        # request.body would read the whole upload into memory and raises
+        # RequestDataTooBig past DATA_UPLOAD_MAX_MEMORY_SIZE
+        _hash_form(digest, request)
+        return digest.hexdigest()
+    try:
+        digest.update(request.body)
+    except RawPostDataException:
+        # The body was already consumed by a parser; hash the parsed form instead
+        _hash_form(digest, request)
+    return digest.hexdigest()
+
+
+def _owner(request):
+    return request.user if request.user.is_authenticated else None
+
+
+def _claim_key(request, key, fingerprint):
+    """
+    Insert an in-progress record for the key.
+    Returns (record, created); an expired record is evicted and re-claimed, and
+    an in-progress claim older than IDEMPOTENCY_CLAIM_LEASE (the process handling
+    it died) is taken over by a request with the same fingerprint.
+    """
+    user = _owner(request)
+    now = timezone.now()
+    IdempotencyKey.objects.filter(user=user, key=key, expires_at__lte=now).delete()
+
+    try:
+        with transaction.atomic():
+            record = IdempotencyKey.objects.create(
+                user=user,
+                key=key,
+                method=request.method,
+                path=request.path[:255],
+                request_fingerprint=fingerprint,
+                claimed_at=now,
+                expires_at=now + settings.IDEMPOTENCY_KEY_TTL,
+            )
+        return record, True
+    except IntegrityError:
+        record = IdempotencyKey.objects.get(user=user, key=key)
+
+    stale = record.claimed_at < now - settings.IDEMPOTENCY_CLAIM_LEASE
+    if not record.is_completed and stale and record.request_fingerprint == fingerprint:
+        # Conditional on the old claim time, so only one retry wins the takeover
+        taken = IdempotencyKey.objects.filter(
+            pk=record.pk, status_code__isnull=True, claimed_at=record.claimed_at
+        ).update(claimed_at=now, updated_at=now)
+        if taken:
+            record.claimed_at = now
+            return record, True
+    return record, False
+
+
+def _release(record):
+    """Drop an in-progress claim so the client can retry, unless another request took it over."""
+    IdempotencyKey.objects.filter(pk=record.pk, claimed_at=record.claimed_at, status_code__isnull=True).delete()
+
+
+def _replay(record, fingerprint):
+    """Build the response for a key that has been seen before."""
+    if record.request_fingerprint != fingerprint:
+        return Response(
+            {'error': f'{IDEMPOTENCY_HEADER} was already used for a different request.'},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+
+    if not record.is_completed:
+        return Response(
+            {'error': 'A request with this Idempotency-Key is still being processed.'},
+            status=status.HTTP_409_CONFLICT
+        )
+
+    return Response(
+        record.response_body,
+        status=record.status_code,
+        headers={REPLAYED_HEADER: 'true'}
+    )
+
+
+def idempotent(view_func):
+    """
+    Make a POST view honour the Idempotency-Key header.
+
+    Requests without the header run normally. The first request with a key
+    stores its response; later requests with the same key (per user) get the
+    stored response back. Server errors are not stored so the client can retry.
+    Apply it below @api_view/@permission_classes, or directly on an APIView method.
+    """
+    @wraps(view_func)
+    def wrapper(*args, **kwargs):
+        request = _find_request(args)
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_func(*args, **kwargs)
+
+        if len(key) > 255:
+            return Response(
+                {'error': f'{IDEMPOTENCY_HEADER} must be at most 255 characters.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        fingerprint = _fingerprint(request)
+        record, created = _claim_key(request, key, fingerprint)
+        if not created:
+            return _replay(record, fingerprint)
+
+        try:
+            response = view_func(*args, **kwargs)
+        except Exception:
+            _release(record)
+            raise
+
+        if response.status_code >= 500:
+            _release(record)
+            return response
+
+        record.status_code = response.status_code
+        record.response_body = json.loads(JSONRenderer().render(response.data) or b'null')
+        record.save(update_fields=['status_code', 'response_body', 'updated_at'])
+        return response
+
+    return wrapper
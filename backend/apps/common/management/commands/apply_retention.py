@@ -0,0 +1,59 @@
+"""
+Management command to apply KindBite's data retention policies.
+Archives old read notifications and idle chat sessions, then hard-deletes
+deactivated chat sessions and soft-deleted notifications and chat rows past
+their grace period, and deletes leaderboard entries of past weeks and months.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.common.retention import apply_policy, default_policies
+
+
+class Command(BaseCommand):
+    help = 'Archive old notifications and chat sessions and purge soft-deleted chat/notification rows in throttled batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Rows per transaction (default: RETENTION["BATCH_SIZE"])',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=None,
+            help='Seconds to pause between batches (default: RETENTION["SLEEP_SECONDS"])',
+        )
+        parser.add_argument(
+            '--max-batches',
+            type=int,
+            default=None,
+            help='Stop each policy after this many batches',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count the rows each policy would handle',
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        total = 0
+        self.stdout.write('🗄️  Applying retention policies...')
+        for policy in default_policies():
+            handled = apply_policy(
+                policy,
+                batch_size=options['batch_size'],
+                sleep=options['sleep'],
+                dry_run=dry_run,
+                max_batches=options['max_batches'],
+            )
+            total += handled
+            if handled:
+                self.stdout.write(f'   {policy.name}: {handled}')
+            if getattr(policy, 'protected', 0):
+                self.stdout.write(f'   ⚠️  {policy.name}: kept {policy.protected} still referenced by other rows')
+
+        verb = 'would be handled' if dry_run else 'handled'
+        self.stdout.write(self.style.SUCCESS(f'✅ {total} rows {verb}'))
@@ -0,0 +1,369 @@
+"""
+Management command to check query-count and latency budgets of every API endpoint.
+
+Seeds the demo data (create_demo_users, create_demo_food) plus bulk volume
+inside a transaction, then requests every GET route in kindbite/urls.py as one
+user of each role and records the query count and p95 latency. Routes without a
+GET handler, or that call external services, are listed as skipped. Results go
+to a JSON report for trend tracking; the command fails when an endpoint exceeds
+its budget or returns a server error. All seeded data is rolled back.
+"""
+import io
+import json
+import logging
+import math
+import re
+import time
+from datetime import time as clock_time, timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLResolver, get_resolver
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.ai_chat.models import ChatMessage, ChatSession
+from apps.foods import dietary, recommendations
+from apps.foods.models import FoodImage, FoodListing, FoodReservation
+from apps.notifications.models import Notification, NotificationTemplate
+from apps.payments.models import KindCoinsTransaction, PaymentIntent, PaymentMethod, Refund, Transaction
+from apps.users.models import User
+
+
+BENCH_LOCATION = 'Kampala, Uganda'
+PROVIDER_ROLES = [choice for choice, _ in FoodListing.ProviderType.choices]
+DIETARY_TAGS = ['Halal', 'Vegan', 'Vegetarian', 'Gluten-Free', 'Dairy-Free', 'Nut-Free']
+
+# Per-endpoint budgets by URL name (path for unnamed routes); others use DEFAULT_BUDGET
+DEFAULT_BUDGET = {'queries': 8, 'p95_ms': 250}
+BUDGETS = {
+    'foodlisting-list': {'queries': 4, 'p95_ms': 250},
+    # Unpaginated feed of every available listing
+    'foodlisting-available': {'queries': 3, 'p95_ms': 500},
+    'foodlisting-recommended': {'queries': 8, 'p95_ms': 250},
+    'my-reservations': {'queries': 3, 'p95_ms': 250},
+    'user-list': {'queries': 3, 'p95_ms': 250},
+    'payment-stats': {'queries': 12, 'p95_ms': 250},
+    'leaderboard': {'queries': 4, 'p95_ms': 250},
+    # One rank lookup per board and period
+    'leaderboard-me': {'queries': 16, 'p95_ms': 250},
+    'health/': {'queries': 0, 'p95_ms': 50},
+}
+# GET routes that call third-party services (Google discovery, Pesapal)
+EXTERNAL_ROUTES = {'google-auth-url', 'pesapal-ipn', 'pesapal-status'}
+# Routes that only serve the frontend
+IGNORED_PREFIXES = ('admin/',)
+IGNORED_NAMES = {'spa-index'}
+
+# URL name -> queryset whose first row fills the route's path parameter
+DETAIL_OBJECTS = {
+    'user-detail': lambda user: User.objects.filter(pk=user.pk),
+    'foodlisting-detail': lambda user: FoodListing.objects.filter(status=FoodListing.Status.AVAILABLE).order_by('id'),
+    'chat-session-detail': lambda user: ChatSession.objects.filter(user=user),
+    'notificationtemplate-detail': lambda user: NotificationTemplate.objects.order_by('id'),
+    'notification-detail': lambda user: Notification.objects.filter(user=user),
+    'paymentmethod-detail': lambda user: PaymentMethod.objects.filter(user=user),
+    'paymentintent-detail': lambda user: PaymentIntent.objects.filter(user=user),
+    'transaction-detail': lambda user: Transaction.objects.filter(user=user),
+    'refund-detail': lambda user: Refund.objects.filter(transaction__user=user),
+}
+
+REGEX_GROUP = re.compile(r'\(\?P<(\w+)>[^)]*\)')
+ROUTE_PARAM = re.compile(r'<(?:\w+:)?(\w+)>')
+
+
+def _routes(patterns, prefix=''):
+    """Yield (path template, name, kwarg names, callback) for every URL pattern."""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _routes(pattern.url_patterns, prefix + str(pattern.pattern))
+        else:
+            template = prefix + str(pattern.pattern).lstrip('^').rstrip('$')
+            yield template.replace('^', ''), pattern.name, list(pattern.pattern.regex.groupindex), pattern.callback
+
+
+def _allows_get(callback):
+    actions = getattr(callback, 'actions', None)
+    if actions is not None:
+        return 'get' in actions
+    view_class = getattr(callback, 'cls', None) or getattr(callback, 'view_class', None)
+    return view_class is None or hasattr(view_class, 'get')
+
+
+def _fill(template, values):
+    path = REGEX_GROUP.sub(lambda match: str(values[match.group(1)]), template)
+    return '/' + ROUTE_PARAM.sub(lambda match: str(values[match.group(1)]), path)
+
+
+def _p95(timings):
+    ordered = sorted(timings)
+    return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+class Command(BaseCommand):
+    help = 'Check per-endpoint query-count and p95 latency budgets for every role (changes are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=20,
+            help='Requests per endpoint and role (default: 20)',
+        )
+        parser.add_argument(
+            '--listings',
+            type=int,
+            default=500,
+            help='Extra listings seeded on top of the demo data (default: 500)',
+        )
+        parser.add_argument(
+            '--no-seed',
+            action='store_true',
+            help='Use the data already in the database instead of seeding',
+        )
+        parser.add_argument(
+            '--report',
+            default='perf-budget-report.json',
+            help='Path of the JSON report (default: perf-budget-report.json)',
+        )
+
+    def handle(self, *args, **options):
+        runs = max(1, options['runs'])
+        request_logger = logging.getLogger('django.request')
+        log_level = request_logger.level
+
+        with transaction.atomic():
+            if not options['no_seed']:
+                self.stdout.write('🌱 Seeding demo data and volume...')
+                self._seed(options['listings'])
+            users = self._users_by_role(create=not options['no_seed'])
+            self.stdout.write(f'⏱️  Requesting every GET endpoint as {len(users)} roles, {runs} runs each...')
+
+            # 4xx responses are expected for roles without access; keep them out of the log
+            request_logger.setLevel(logging.CRITICAL)
+            try:
+                with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                    results, skipped = self._measure(users, runs)
+            finally:
+                request_logger.setLevel(log_level)
+                transaction.set_rollback(True)
+
+        failures = [result for result in results if not result['ok']]
+        report = {
+            'generated_at': timezone.now().isoformat(),
+            'runs': runs,
+            'seeded': not options['no_seed'],
+            'default_budget': DEFAULT_BUDGET,
+            'results': results,
+            'skipped': skipped,
+            'failures': len(failures),
+        }
+        with open(options['report'], 'w', encoding='utf-8') as report_file:
+            json.dump(report, report_file, indent=2)
+
+        for result in results:
+            mark = '✓' if result['ok'] else '✗'
+            self.stdout.write(
+                f'   {mark} {result["role"]:<16} {result["path"]:<48} {result["status"]}  '
+                f'{result["queries"]:>3} queries  p95 {result["p95_ms"]:>7.1f}ms'
+            )
+        self.stdout.write(f'📝 Report written to {options["report"]} ({len(skipped)} routes skipped)')
+        if failures:
+            raise CommandError(f'{len(failures)} endpoint checks exceeded their budget or failed')
+        self.stdout.write(self.style.SUCCESS(f'✅ All {len(results)} endpoint checks within budget (rolled back)'))
+
+    def _measure(self, users, runs):
+        results, skipped = [], []
+        for template, name, kwarg_names, callback in _routes(get_resolver().url_patterns):
+            key = name or template
+            if 'format' in kwarg_names or template.startswith(IGNORED_PREFIXES) or name in IGNORED_NAMES:
+                continue
+            if not _allows_get(callback):
+                skipped.append({'name': key, 'path': '/' + template, 'reason': 'no GET handler'})
+                continue
+            if name in EXTERNAL_ROUTES:
+                skipped.append({'name': key, 'path': '/' + template, 'reason': 'calls an external service'})
+                continue
+
+            budget = BUDGETS.get(key, DEFAULT_BUDGET)
+            for role, user in users.items():
+                values = {}
+                if kwarg_names:
+                    obj = DETAIL_OBJECTS[name](user).first() if name in DETAIL_OBJECTS else None
+                    if obj is None:
+                        skipped.append({'name': key, 'path': '/' + template, 'role': role, 'reason': 'no object to request'})
+                        continue
+                    values = {kwarg: obj.pk for kwarg in kwarg_names}
+                results.append(self._request(key, _fill(template, values), role, user, runs, budget))
+        return results, skipped
+
+    def _request(self, name, path, role, user, runs, budget):
+        client = APIClient(raise_request_exception=False)
+        client.force_authenticate(user=user)
+        timings, queries, status_code = [], 0, None
+        for _ in range(runs):
+            # The log is a bounded deque; once full, CaptureQueriesContext would count nothing
+            connection.queries_log.clear()
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                response = client.get(path)
+                timings.append((time.perf_counter() - started) * 1000)
+            queries = max(queries, len(captured))
+            status_code = response.status_code
+        p95 = _p95(timings)
+        return {
+            'name': name,
+            'path': path,
+            'role': role,
+            'status': status_code,
+            'queries': queries,
+            'p50_ms': round(sorted(timings)[len(timings) // 2], 2),
+            'p95_ms': round(p95, 2),
+            'budget': budget,
+            'ok': status_code < 500 and queries <= budget['queries'] and p95 <= budget['p95_ms'],
+        }
+
+    def _users_by_role(self, create):
+        """One active user per role: the demo user where there is one, else a harness user."""
+        users = {}
+        for role, _ in User.UserRole.choices:
+            user = User.objects.filter(user_role=role, is_active=True).order_by('id').first()
+            if user is None and create:
+                user = User.objects.create(
+                    email=f'perf-{role}@benchmark.invalid',
+                    first_name='Perf',
+                    last_name=role.title(),
+                    phone='+256700000000',
+                    location=BENCH_LOCATION,
+                    user_role=role,
+                )
+            if user is not None:
+                users[role] = user
+        return users
+
+    def _seed(self, total):
+        """Demo users and food, then bulk listings, reservations, notifications, coins, chats and payments."""
+        quiet = io.StringIO()
+        call_command('create_demo_users', stdout=quiet)
+        call_command('create_demo_food', stdout=quiet)
+        users = list(self._users_by_role(create=True).values())
+        providers = [user for user in users if user.user_role in PROVIDER_ROLES]
+        seekers = [user for user in users if user.user_role not in PROVIDER_ROLES]
+        today = timezone.localdate()
+
+        listings = FoodListing.objects.bulk_create([
+            FoodListing(
+                provider=providers[i % len(providers)],
+                restaurant_name=providers[i % len(providers)].business_name or 'Perf Kitchen',
+                name=f'Perf meal {i}',
+                description='Performance budget listing',
+                original_price=Decimal(10000 + i % 40 * 500),
+                discounted_price=Decimal(5000 + i % 20 * 250),
+                quantity=10,
+                available_quantity=10 - i % 11,
+                pickup_window_start=clock_time(12 + i % 6),
+                pickup_window_end=clock_time(18 + i % 4),
+                pickup_date=today + timedelta(days=i % 3),
+                location=BENCH_LOCATION,
+                latitude=Decimal(f'{0.3476 + (i % 100 - 50) / 1000:.6f}'),
+                longitude=Decimal(f'{32.5825 + (i % 70 - 35) / 1000:.6f}'),
+                provider_type=providers[i % len(providers)].user_role,
+                dietary_info=[DIETARY_TAGS[i % len(DIETARY_TAGS)]],
+            )
+            for i in range(total)
+        ])
+        dietary.sync_listing_tags(listings)
+        recommendations.invalidate_listings()
+        FoodImage.objects.bulk_create([
+            FoodImage(food_listing=listing, image_url=f'https://images.benchmark.invalid/{listing.id}.jpg')
+            for listing in listings[::3]
+        ])
+        statuses = [choice for choice, _ in FoodReservation.Status.choices]
+        FoodReservation.objects.bulk_create([
+            FoodReservation(
+                food_listing=listing,
+                seeker=seeker,
+                quantity_reserved=1,
+                status=statuses[(i + j) % len(statuses)],
+            )
+            for i, seeker in enumerate(seekers)
+            for j, listing in enumerate(listings[i::len(seekers)][:50])
+        ], ignore_conflicts=True)
+
+        notification_types = [choice for choice, _ in Notification.NotificationType.choices]
+        Notification.objects.bulk_create([
+            Notification(
+                user=user,
+                notification_type=notification_types[i % len(notification_types)],
+                title=f'Perf notification {i}',
+                message='Performance budget notification',
+                is_read=i % 3 == 0,
+            )
+            for user in users
+            for i in range(200)
+        ])
+        call_command('reconcile_notification_counters', stdout=quiet)
+
+        earning_types = [KindCoinsTransaction.TransactionType.EARNED, KindCoinsTransaction.TransactionType.BONUS]
+        KindCoinsTransaction.objects.bulk_create([
+            KindCoinsTransaction(
+                user=user,
+                transaction_type=earning_types[i % len(earning_types)],
+                amount=10,
+                balance_after=user.kind_coins + 10 * (i + 1),
+                description='Performance budget reward',
+            )
+            for user in users
+            for i in range(30)
+        ])
+
+        sessions = ChatSession.objects.bulk_create([
+            ChatSession(user=user, title='Perf chat') for user in users
+        ])
+        message_types = [ChatMessage.MessageType.USER, ChatMessage.MessageType.AI]
+        ChatMessage.objects.bulk_create([
+            ChatMessage(session=session, message_type=message_types[i % 2], content=f'Perf message {i}')
+            for session in sessions
+            for i in range(20)
+        ])
+
+        intents = PaymentIntent.objects.bulk_create([
+            PaymentIntent(
+                user=user,
+                stripe_payment_intent_id=f'pi_perf_{user.id}_{i}',
+                amount=5000 + i * 100,
+                status=PaymentIntent.Status.SUCCEEDED,
+                description='Performance budget payment',
+            )
+            for user in users
+            for i in range(10)
+        ])
+        PaymentMethod.objects.bulk_create([
+            PaymentMethod(user=user, stripe_payment_method_id=f'pm_perf_{user.id}', card_brand='visa', card_last_four='4242')
+            for user in users
+        ])
+        transactions = Transaction.objects.bulk_create([
+            Transaction(
+                user=intent.user,
+                transaction_type=Transaction.TransactionType.FOOD_PURCHASE,
+                status=Transaction.Status.COMPLETED,
+                amount=intent.amount,
+                net_amount=intent.amount,
+                payment_intent=intent,
+                description=intent.description,
+            )
+            for intent in intents
+        ])
+        Refund.objects.bulk_create([
+            Refund(transaction=payment, stripe_refund_id=f're_perf_{payment.payment_intent_id}', amount=payment.amount)
+            for payment in transactions[::10]
+        ])
+        call_command('rebuild_leaderboards', stdout=quiet)
+        self.stdout.write(
+            f'   {len(users)} roles, {FoodListing.objects.count()} listings, '
+            f'{FoodReservation.objects.count()} reservations'
+        )
@@ -0,0 +1,130 @@
+"""
+Management command to verify that hot per-user queries are served by indexes.
+Runs EXPLAIN QUERY PLAN for each query and fails on full scans or temp sorts.
+"""
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+
+from apps.ai_chat.models import ChatMessage, ChatSession
+from apps.foods.dietary import filter_by_tags
+from apps.foods.models import FoodListing, FoodReservation
+from apps.leaderboards.models import LeaderboardEntry
+from apps.leaderboards.services import board_queryset
+from apps.notifications.models import Notification
+from apps.payments.models import KindCoinsTransaction, PaymentIntent, Transaction
+from apps.users.models import User
+
+
+# Placeholder ids - the plan does not depend on the actual values
+USER_ID = 1
+SESSION_ID = 1
+
+HOT_QUERIES = [
+    ('payment intents by user', lambda: PaymentIntent.objects.filter(user_id=USER_ID)[:20]),
+    ('payment intents by user and status', lambda: PaymentIntent.objects.filter(
+        user_id=USER_ID, status=PaymentIntent.Status.SUCCEEDED
+    )[:20]),
+    ('transactions by user', lambda: Transaction.objects.filter(user_id=USER_ID)[:20]),
+    ('transactions by user and status', lambda: Transaction.objects.filter(
+        user_id=USER_ID, status=Transaction.Status.COMPLETED
+    )[:20]),
+    ('kindcoins transactions by user', lambda: KindCoinsTransaction.objects.filter(user_id=USER_ID)[:20]),
+    ('kindcoins transactions by user and type', lambda: KindCoinsTransaction.objects.filter(
+        user_id=USER_ID, transaction_type=KindCoinsTransaction.TransactionType.EARNED
+    ).values('amount')),
+    ('notifications by user', lambda: Notification.objects.filter(user_id=USER_ID)[:20]),
+    ('unread notifications by user', lambda: Notification.objects.filter(
+        user_id=USER_ID, is_read=False
+    )[:20]),
+    ('notifications by user and type', lambda: Notification.objects.filter(
+        user_id=USER_ID, notification_type=Notification.NotificationType.FOOD_RESERVED
+    )[:20]),
+    ('notification counts by type', lambda: Notification.objects.filter(
+        user_id=USER_ID
+    ).values('notification_type').annotate(count=Count('id')).order_by()),
+    ('listings by dietary tag', lambda: filter_by_tags(
+        FoodListing.objects.filter(status=FoodListing.Status.AVAILABLE).order_by(), 'halal,vegan'
+    ).values('id')),
+    ('reservations by seeker', lambda: FoodReservation.objects.filter(seeker_id=USER_ID)[:20]),
+    ('user directory by role', lambda: User.objects.filter(
+        user_role=User.UserRole.RESTAURANT
+    ).order_by('-date_joined', '-id')[:51]),
+    ('leaderboard top', lambda: board_queryset(
+        LeaderboardEntry.Board.KIND_COINS, 'all'
+    ).filter(score__gt=0)[:10]),
+    ('leaderboard top by role', lambda: board_queryset(
+        LeaderboardEntry.Board.MEALS_SAVED, 'all', role=User.UserRole.RESTAURANT
+    ).filter(score__gt=0)[:10]),
+    ('leaderboard top by location', lambda: board_queryset(
+        LeaderboardEntry.Board.CO2_SAVED, 'all', location='Kampala'
+    ).filter(score__gt=0)[:10]),
+    ('leaderboard rank', lambda: board_queryset(
+        LeaderboardEntry.Board.KIND_COINS, 'all'
+    ).filter(score__gt=100).order_by().values('id')),
+    ('leaderboard rank by role', lambda: board_queryset(
+        LeaderboardEntry.Board.KIND_COINS, 'all', role=User.UserRole.END_USER
+    ).filter(score__gt=100).order_by().values('id')),
+    ('active chat sessions by user', lambda: ChatSession.objects.filter(
+        user_id=USER_ID, is_active=True
+    )[:20]),
+    ('chat messages by session', lambda: ChatMessage.objects.filter(session_id=SESSION_ID)),
+    ('recent chat context', lambda: ChatMessage.objects.filter(
+        session_id=SESSION_ID, message_type__in=['user', 'ai']
+    ).order_by('-created_at')[:6]),
+    ('user chat messages by type', lambda: ChatMessage.objects.filter(
+        session__user_id=USER_ID, message_type=ChatMessage.MessageType.USER
+    ).order_by().values('id')),
+]
+
+
+def explain(queryset):
+    """Return the EXPLAIN QUERY PLAN detail lines for a queryset."""
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[3] for row in cursor.fetchall()]
+
+
+def plan_problems(plan):
+    """Return the plan lines that indicate a full scan or a temp B-tree sort."""
+    return [
+        detail for detail in plan
+        if detail.startswith('SCAN ') or 'USE TEMP B-TREE' in detail
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Fail if any hot query plan contains a full table scan or a temp B-tree sort'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verbose-plans',
+            action='store_true',
+            help='Print the full query plan for every checked query',
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('Query plan checks are only supported on SQLite.')
+
+        failures = []
+        for label, build_queryset in HOT_QUERIES:
+            plan = explain(build_queryset())
+            problems = plan_problems(plan)
+
+            if options['verbose_plans']:
+                self.stdout.write(f'{label}:')
+                for detail in plan:
+                    self.stdout.write(f'    {detail}')
+
+            if problems:
+                failures.append(label)
+                self.stdout.write(self.style.ERROR(f'✗ {label}: {"; ".join(problems)}'))
+            else:
+                self.stdout.write(f'✓ {label}')
+
+        if failures:
+            raise CommandError(f'{len(failures)} hot queries are not fully index-backed.')
+
+        self.stdout.write(self.style.SUCCESS(f'All {len(HOT_QUERIES)} hot queries use indexes'))
@@ -0,0 +1,63 @@
+"""
+Management command that drains the transactional outbox.
+Run it as a long-lived worker process alongside the web server.
+"""
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.common.outbox import dispatch_batch
+
+
+class Command(BaseCommand):
+    help = 'Dispatch pending outbox events (emails, notifications, KindCoins awards)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=settings.OUTBOX['BATCH_SIZE'],
+            help='Number of events claimed per batch',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=settings.OUTBOX['POLL_INTERVAL'],
+            help='Seconds to sleep when the outbox is empty',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Drain the currently due events and exit instead of polling forever',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        total_processed = total_failed = 0
+
+        self.stdout.write('📤 Dispatching outbox events...')
+        if settings.CHANNEL_LAYERS['default']['BACKEND'] == 'channels.layers.InMemoryChannelLayer':
+            self.stderr.write(self.style.WARNING(
+                '⚠️  In-memory channel layer: notifications created here are not pushed to WebSocket '
+                'clients of the web process. Set CHANNEL_REDIS_URL to share one layer.'
+            ))
+        try:
+            while True:
+                processed, failed = dispatch_batch(batch_size)
+                total_processed += processed
+                total_failed += failed
+
+                if processed or failed:
+                    self.stdout.write(f'Processed {processed} events ({failed} failed)')
+                    continue
+
+                if options['once']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Dispatched {total_processed} events, {total_failed} failures')
+        )
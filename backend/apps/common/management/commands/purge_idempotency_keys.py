@@ -0,0 +1,38 @@
+"""
+Management command to evict expired Idempotency-Key records.
+"""
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.common.models import IdempotencyKey
+
+
+class Command(BaseCommand):
+    help = 'Delete Idempotency-Key records whose TTL has expired'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of records deleted per query (keeps SQLite write locks short)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        now = timezone.now()
+        total_deleted = 0
+
+        while True:
+            expired_ids = list(
+                IdempotencyKey.objects.filter(expires_at__lte=now)
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not expired_ids:
+                break
+            deleted, _ = IdempotencyKey.objects.filter(id__in=expired_ids).delete()
+            total_deleted += deleted
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Deleted {total_deleted} expired idempotency keys')
+        )
@@ -0,0 +1,683 @@
+"""
+Management command to generate a large synthetic data set for load testing.
+
+Creates users (role mix, city clusters), listings (meal-time pickup windows,
+popular providers posting more), reservations, ratings, KindCoins, chat
+messages, notifications and payments with chunked bulk_create, each chunk in
+its own transaction. Activity is spread over the last --days days in time
+order, so reservations only target listings that were live at the time and
+KindCoins balances add up. Derived tables (dietary tags, listing ratings,
+impact counters, notification counters, leaderboards) are rebuilt at the end
+with the existing commands. Run it against a dedicated load-test database.
+"""
+import io
+import math
+import random
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from datetime import date, datetime, time as clock_time, timedelta
+from decimal import Decimal
+from itertools import accumulate, islice
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Avg, Count, OuterRef, Subquery
+from django.db.models.functions import Round
+from django.utils import timezone
+
+from apps.ai_chat.models import ChatMessage, ChatSession
+from apps.foods import dietary, recommendations
+from apps.foods.models import FoodImage, FoodListing, FoodRating, FoodReservation
+from apps.notifications.models import Notification
+from apps.payments.models import KindCoinsTransaction, PaymentIntent, Transaction
+from apps.users.models import User, UserProfile
+
+
+EMAIL_DOMAIN = 'load.kindbite.invalid'
+Role = User.UserRole
+
+# (role, share of users)
+ROLE_MIX = [
+    (Role.END_USER, 80.0), (Role.RESTAURANT, 5.0), (Role.HOME, 4.0), (Role.RETAIL, 2.5),
+    (Role.SUPERMARKET, 1.5), (Role.FACTORY, 0.5), (Role.VERIFIER, 1.5), (Role.AMBASSADOR, 2.0),
+    (Role.DONOR, 2.9), (Role.ADMIN, 0.1),
+]
+PROVIDER_ROLES = set(FoodListing.ProviderType.values)
+# (city, latitude, longitude, share of users, spread in degrees)
+CITIES = [
+    ('Kampala', 0.3476, 32.5825, 50, 0.05), ('Wakiso', 0.4044, 32.4594, 10, 0.04),
+    ('Entebbe', 0.0512, 32.4637, 8, 0.03), ('Mukono', 0.3533, 32.7553, 7, 0.03),
+    ('Jinja', 0.4244, 33.2041, 8, 0.03), ('Mbarara', -0.6072, 30.6545, 7, 0.03),
+    ('Gulu', 2.7724, 32.2881, 5, 0.03), ('Mbale', 1.0827, 34.1750, 5, 0.03),
+]
+AREAS = ['Central', 'Market Street', 'Old Road', 'Industrial Area', 'Hill Road', 'Station Road', 'Main Street']
+FIRST_NAMES = [
+    'Nakato', 'Babirye', 'Mukasa', 'Okello', 'Achieng', 'Nansubuga', 'Kato', 'Wasswa', 'Namubiru', 'Atim',
+    'Ssali', 'Akello', 'Opio', 'Nabirye', 'Tumusiime', 'Ainembabazi', 'Mugisha', 'Kyomuhendo', 'Namutebi', 'Odongo',
+]
+LAST_NAMES = [
+    'Ssempala', 'Nambi', 'Kizza', 'Ochieng', 'Byaruhanga', 'Nakitende', 'Lubega', 'Auma', 'Kiggundu', 'Nankya',
+    'Mwesigwa', 'Apio', 'Ssekandi', 'Nalwoga', 'Tumwine', 'Acen', 'Kaggwa', 'Namayanja', 'Ouma', 'Asiimwe',
+]
+BUSINESS_SUFFIXES = {
+    Role.RESTAURANT: ['Kitchen', 'Grill', 'Eatery', 'Cafe'],
+    Role.HOME: ['Home Kitchen', 'Family Meals'],
+    Role.RETAIL: ['Shop', 'Corner Store', 'Bakery'],
+    Role.SUPERMARKET: ['Supermarket', 'Fresh Mart'],
+    Role.FACTORY: ['Foods Ltd', 'Processing'],
+}
+MEALS = {
+    Role.RESTAURANT: [('Rolex', '🌯'), ('Matooke & Beef', '🍲'), ('Chicken Pilau', '🍛'), ('Fish & Chips', '🐟'), ('Beans & Rice', '🍚')],
+    Role.HOME: [('Luwombo', '🍲'), ('Posho & Beans', '🫘'), ('Groundnut Stew', '🥜'), ('Chapati Pack', '🫓')],
+    Role.RETAIL: [('Mandazi Bag', '🍩'), ('Samosa Box', '🥟'), ('Bread Loaves', '🍞'), ('Fruit Bowl', '🍍')],
+    Role.SUPERMARKET: [('Vegetable Box', '🥕'), ('Bakery Surplus', '🥖'), ('Dairy Pack', '🥛'), ('Fruit Crate', '🍌')],
+    Role.FACTORY: [('Juice Cartons', '🧃'), ('Biscuit Cases', '🍪'), ('Flour Sacks', '🌾'), ('Yoghurt Trays', '🥛')],
+}
+# (label, share of listings carrying it)
+DIETARY_LABELS = [('Halal', 0.3), ('Vegetarian', 0.2), ('Vegan', 0.08), ('Gluten-Free', 0.06), ('Dairy-Free', 0.05)]
+# (first start hour, last start hour, share): breakfast, lunch, dinner
+PICKUP_SLOTS = [(7, 9, 15), (11, 13, 30), (17, 20, 55)]
+PAST_RESERVATION_STATUSES = [
+    (FoodReservation.Status.PICKED_UP, 75), (FoodReservation.Status.CANCELLED, 12),
+    (FoodReservation.Status.NO_SHOW, 8), (FoodReservation.Status.CONFIRMED, 5),
+]
+OPEN_RESERVATION_STATUSES = [
+    (FoodReservation.Status.PENDING, 55), (FoodReservation.Status.CONFIRMED, 35),
+    (FoodReservation.Status.CANCELLED, 10),
+]
+NOTIFICATION_MIX = [
+    (Notification.NotificationType.NEW_FOOD_AVAILABLE, 40), (Notification.NotificationType.FOOD_RESERVED, 15),
+    (Notification.NotificationType.RESERVATION_CONFIRMED, 12), (Notification.NotificationType.KINDCOINS_EARNED, 12),
+    (Notification.NotificationType.PICKUP_REMINDER, 10), (Notification.NotificationType.PAYMENT_SUCCESS, 5),
+    (Notification.NotificationType.FOOD_RATED, 3), (Notification.NotificationType.SYSTEM_ANNOUNCEMENT, 2),
+    (Notification.NotificationType.PAYMENT_FAILED, 1),
+]
+PRIORITY_MIX = [
+    (Notification.Priority.LOW, 25), (Notification.Priority.MEDIUM, 60),
+    (Notification.Priority.HIGH, 13), (Notification.Priority.URGENT, 2),
+]
+RATING_MIX = [(5, 45), (4, 30), (3, 13), (2, 7), (1, 5)]
+REVIEWS = ['Great value!', 'Fresh and tasty.', 'Pickup was quick.', 'Portions were generous.', 'A bit cold but good.']
+CHAT_QUESTIONS = [
+    'How do I reserve food?', 'Is this meal halal?', 'How do KindCoins work?',
+    'How long does cooked food stay safe?', 'Where can I pick up near me?',
+]
+CHAT_ANSWERS = [
+    'Open a listing and tap Reserve, then pick it up in the window shown.',
+    'Check the dietary labels on the listing; providers tag halal meals.',
+    'You earn KindCoins for every reservation and can spend them on meals.',
+    'Refrigerate within two hours and eat within a day.',
+    'The map shows listings near you, sorted by distance.',
+]
+
+
+def _picker(rng, weighted):
+    """Return a function drawing k values from [(value, weight), ...]."""
+    values = [value for value, _ in weighted]
+    cum_weights = list(accumulate(weight for _, weight in weighted))
+    return lambda k=1: rng.choices(values, cum_weights=cum_weights, k=k)
+
+
+@contextmanager
+def historical_timestamps(*models):
+    """Let bulk_create keep explicit values for auto_now / auto_now_add fields of the models."""
+    fields = [
+        field for model in models for field in model._meta.concrete_fields
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+@contextmanager
+def fast_sqlite_writes():
+    """Skip fsync per commit on SQLite while loading; a crash mid-load can corrupt the load database."""
+    if connection.vendor != 'sqlite' or connection.in_atomic_block:
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA synchronous')
+        previous = cursor.fetchone()[0]
+        cursor.execute('PRAGMA synchronous = OFF')
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(f'PRAGMA synchronous = {int(previous)}')
+
+
+class Command(BaseCommand):
+    help = 'Generate a large synthetic data set for load testing (users, listings, reservations, ...)'
+
+    def add_arguments(self, parser):
+        counts = [
+            ('users', 10000), ('listings', 50000), ('reservations', 100000), ('ratings', 30000),
+            ('chat-messages', 50000), ('notifications', 200000), ('payments', 20000),
+        ]
+        for name, default in counts:
+            parser.add_argument(f'--{name}', type=int, default=default, help=f'Rows to create (default: {default})')
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=90,
+            help='Days of history the activity is spread over (default: 90)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Rows per bulk_create and transaction (default: 5000)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Random seed, for reproducible data sets (default: 42)',
+        )
+        parser.add_argument(
+            '--password',
+            default='load-test',
+            help='Password of every generated user, for login load tests (default: load-test)',
+        )
+        parser.add_argument(
+            '--skip-derived',
+            action='store_true',
+            help='Do not rebuild listing ratings, impact and notification counters, or leaderboards',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Run even with DEBUG off',
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options['force']:
+            raise CommandError('seed_load writes synthetic rows; use a load-test database with DEBUG=True or pass --force')
+        if options['users'] < 2 or options['listings'] < 1:
+            raise CommandError('--users must be at least 2 and --listings at least 1')
+
+        self.rng = random.Random(options['seed'])
+        self.chunk_size = max(1, options['chunk_size'])
+        self.now = timezone.now()
+        self.start = self.now - timedelta(days=max(1, options['days']))
+        started = time.perf_counter()
+
+        self.stdout.write('🌱 Generating load-test data...')
+        with fast_sqlite_writes(), historical_timestamps(
+            User, UserProfile, FoodListing, FoodImage, FoodReservation, FoodRating, KindCoinsTransaction,
+            ChatSession, ChatMessage, Notification, PaymentIntent, Transaction,
+        ):
+            self._users(options['users'], options['password'])
+            self._listings(options['listings'])
+            self._reservations(options['reservations'])
+            self._ratings(options['ratings'])
+            self._payments(options['payments'])
+            self._chats(options['chat_messages'])
+            self._notifications(options['notifications'])
+        if not options['skip_derived']:
+            self._derived()
+
+        minutes, seconds = divmod(time.perf_counter() - started, 60)
+        self.stdout.write(self.style.SUCCESS(f'✅ Load data generated in {int(minutes)}m {seconds:.0f}s'))
+
+    # Helpers
+
+    def _insert(self, model, rows, label, on_chunk=None):
+        """bulk_create an iterable of unsaved rows in chunks, one transaction per chunk."""
+        started = time.perf_counter()
+        total = 0
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            with transaction.atomic():
+                model.objects.bulk_create(chunk)
+                if on_chunk:
+                    on_chunk(chunk)
+            total += len(chunk)
+        self.stdout.write(f'   {label:<26} {total:>10,} rows  {time.perf_counter() - started:6.1f}s')
+        return total
+
+    def _moment(self, fraction):
+        """The time `fraction` (0..1) of the way through the history window."""
+        return self.start + (self.now - self.start) * min(max(fraction, 0.0), 1.0)
+
+    def _recent_moment(self):
+        """A time in the window, weighted toward the present (activity grows)."""
+        return self._moment(1 - self.rng.random() ** 2)
+
+    def _pareto_cum_weights(self, count, alpha=1.2):
+        """Cumulative heavy-tailed activity weights, so a few rows get most of the traffic."""
+        return list(accumulate(self.rng.paretovariate(alpha) for _ in range(count)))
+
+    # Phases
+
+    def _users(self, total, password):
+        rng = self.rng
+        offset = User.all_objects.filter(email__endswith=f'@{EMAIL_DOMAIN}').count()
+        password_hash = make_password(password)  # hashed once and shared by every generated user
+        pick_role = _picker(rng, ROLE_MIX)
+        pick_city = _picker(rng, [(city, city[3]) for city in CITIES])
+        roles = pick_role(total)
+        if not PROVIDER_ROLES.intersection(roles):
+            roles[0] = Role.RESTAURANT
+        if Role.END_USER not in roles:
+            roles[-1] = Role.END_USER
+        self.seekers, self.providers, self.all_users = [], [], []
+
+        def rows():
+            for i, role in enumerate(roles):
+                n = offset + i
+                city = pick_city()[0]
+                first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                joined = self.start - timedelta(days=rng.uniform(0, 365))
+                user = User(
+                    email=f'load-{n}@{EMAIL_DOMAIN}',
+                    password=password_hash,
+                    first_name=first,
+                    last_name=last,
+                    user_role=role,
+                    phone=f'+2567{n % 10 ** 8:08d}',
+                    location=f'{city[0]}, Uganda',
+                    business_name=f'{first} {rng.choice(BUSINESS_SUFFIXES[role])}' if role in PROVIDER_ROLES else None,
+                    is_verified=role in PROVIDER_ROLES and rng.random() < 0.7,
+                    is_staff=role == Role.ADMIN,
+                    date_joined=joined,
+                    created_at=joined,
+                    updated_at=joined,
+                )
+                user._city = city
+                yield user
+
+        def collect(chunk):
+            profiles = []
+            for user in chunk:
+                self.all_users.append(user.id)
+                if user.user_role in PROVIDER_ROLES:
+                    city = user._city
+                    self.providers.append((
+                        user.id, user.user_role, user.business_name, city[0],
+                        city[1] + rng.gauss(0, city[4]), city[2] + rng.gauss(0, city[4]),
+                    ))
+                elif user.user_role == Role.END_USER:
+                    self.seekers.append(user.id)
+                preferences = []
+                if user.user_role == Role.END_USER and rng.random() < 0.3:
+                    preferences = [label for label, share in DIETARY_LABELS if rng.random() < share * 2]
+                profiles.append(UserProfile(
+                    user_id=user.id,
+                    dietary_preferences=preferences,
+                    created_at=user.created_at,
+                    updated_at=user.created_at,
+                ))
+            UserProfile.objects.bulk_create(profiles)
+
+        self._insert(User, rows(), 'users (+ profiles)', collect)
+        self.seeker_weights = self._pareto_cum_weights(len(self.seekers))
+        self.user_weights = self._pareto_cum_weights(len(self.all_users))
+
+    def _listings(self, total):
+        rng = self.rng
+        pick_slot = _picker(rng, [(slot, slot[2]) for slot in PICKUP_SLOTS])
+        provider_weights = self._pareto_cum_weights(len(self.providers))
+        today = timezone.localdate()
+        # Per-listing columns used by later phases, indexed in creation (time) order
+        self.listing_ids = array('q')
+        self.listing_created = array('d')
+        self.listing_pickup = array('l')
+        self.listing_window = array('h')
+        self.listing_price = array('q')
+        self.listing_quantity = array('h')
+        self.listing_co2 = array('d')
+        self.images = 0
+
+        def rows():
+            providers = rng.choices(self.providers, cum_weights=provider_weights, k=total)
+            for i, (provider_id, role, business_name, city, lat, lng) in enumerate(providers):
+                created = self._moment((i + rng.random()) / total)
+                pickup_date = min(created.date() + timedelta(days=rng.choice((0, 0, 1, 1, 2))), today + timedelta(days=3))
+                first_hour, last_hour, _ = pick_slot()[0]
+                start_minutes = rng.randint(first_hour, last_hour) * 60 + rng.choice((0, 30))
+                end_minutes = min(start_minutes + rng.choice((60, 90, 120, 180)), 23 * 60 + 30)
+                original = max(2000, round(rng.lognormvariate(math.log(15000), 0.5) / 500) * 500)
+                discounted = 0 if role == Role.HOME and rng.random() < 0.1 else round(original * rng.uniform(0.2, 0.7) / 100) * 100
+                quantity = 1 + min(int(rng.expovariate(1 / 8)), 200)
+                if pickup_date < today:
+                    status = FoodListing.Status.COMPLETED if rng.random() < 0.65 else FoodListing.Status.EXPIRED
+                    available = 0
+                else:
+                    status = FoodListing.Status.AVAILABLE if rng.random() < 0.85 else FoodListing.Status.RESERVED
+                    available = rng.randint(1, quantity) if status == FoodListing.Status.AVAILABLE else 0
+                name, emoji = rng.choice(MEALS[role])
+                co2 = min(round(quantity * rng.uniform(0.5, 2.5), 1), 9999.9)
+                yield FoodListing(
+                    provider_id=provider_id,
+                    restaurant_name=business_name,
+                    name=name,
+                    description=f'{name} from {business_name}, packed for pickup.',
+                    original_price=Decimal(original),
+                    discounted_price=Decimal(discounted),
+                    quantity=quantity,
+                    available_quantity=available,
+                    pickup_window_start=clock_time(start_minutes // 60, start_minutes % 60),
+                    pickup_window_end=clock_time(end_minutes // 60, end_minutes % 60),
+                    pickup_date=pickup_date,
+                    location=f'{rng.choice(AREAS)}, {city}, Uganda',
+                    latitude=Decimal(f'{lat + rng.gauss(0, 0.001):.6f}'),
+                    longitude=Decimal(f'{lng + rng.gauss(0, 0.001):.6f}'),
+                    provider_type=role,
+                    dietary_info=[label for label, share in DIETARY_LABELS if rng.random() < share],
+                    image_emoji=emoji,
+                    co2_saved=Decimal(f'{co2:.1f}'),
+                    status=status,
+                    created_at=created,
+                    updated_at=created,
+                )
+
+        def collect(chunk):
+            images = []
+            for listing in chunk:
+                self.listing_ids.append(listing.id)
+                self.listing_created.append(listing.created_at.timestamp())
+                self.listing_pickup.append(listing.pickup_date.toordinal())
+                self.listing_window.append(listing.pickup_window_start.hour * 60 + listing.pickup_window_start.minute)
+                self.listing_price.append(int(listing.discounted_price))
+                self.listing_quantity.append(listing.quantity)
+                self.listing_co2.append(float(listing.co2_saved))
+                if rng.random() < 0.4:
+                    images.append(FoodImage(
+                        food_listing_id=listing.id,
+                        image_url=f'https://images.{EMAIL_DOMAIN}/listings/{listing.id}.jpg',
+                        alt_text=listing.name,
+                        is_primary=True,
+                        created_at=listing.created_at,
+                        updated_at=listing.created_at,
+                    ))
+            FoodImage.objects.bulk_create(images)
+            self.images += len(images)
+            dietary.sync_listing_tags(chunk)
+
+        self._insert(FoodListing, rows(), 'listings (+ images)', collect)
+        self.listing_weights = self._pareto_cum_weights(len(self.listing_ids))
+
+    def _reservations(self, total):
+        """Reservations in time order, each on a listing posted in the two days before it."""
+        rng = self.rng
+        pick_past = _picker(rng, PAST_RESERVATION_STATUSES)
+        pick_open = _picker(rng, OPEN_RESERVATION_STATUSES)
+        today = timezone.localdate().toordinal()
+        tz = timezone.get_current_timezone()
+        window = timedelta(days=2).total_seconds()
+        taken = set()
+        # Picked-up reservations, for ratings and payments
+        self.picked = {'id': array('q'), 'listing': array('q'), 'seeker': array('q'), 'at': array('d'), 'quantity': array('h')}
+        balances = {}
+        ledger = []
+
+        def rows():
+            first = datetime.fromtimestamp(self.listing_created[0], tz=self.now.tzinfo)
+            made = attempts = 0
+            while made < total and attempts < total * 3:
+                attempts += 1
+                reserved_at = first + (self.now - first) * ((made + rng.random()) / total)
+                stamp = reserved_at.timestamp()
+                high = bisect_right(self.listing_created, stamp)
+                # Nothing posted in the window (sparse data): fall back to the latest listing
+                low = min(bisect_left(self.listing_created, stamp - window), high - 1)
+                # Weighted draw among the live listings: popular ones get more reservations
+                base = self.listing_weights[low - 1] if low else 0.0
+                point = rng.uniform(base, self.listing_weights[high - 1])
+                index = min(bisect_left(self.listing_weights, point, low, high), high - 1)
+                seeker = rng.choices(self.seekers, cum_weights=self.seeker_weights)[0]
+                if (index, seeker) in taken:
+                    continue
+                taken.add((index, seeker))
+                quantity = min(self.listing_quantity[index], rng.choice((1, 1, 1, 2, 2, 3)))
+                pickup_date = self.listing_pickup[index]
+                status = pick_past()[0] if pickup_date < today else pick_open()[0]
+                confirmed_at = picked_up_at = None
+                if status in (FoodReservation.Status.CONFIRMED, FoodReservation.Status.PICKED_UP):
+                    confirmed_at = min(reserved_at + timedelta(minutes=rng.randint(2, 120)), self.now)
+                if status == FoodReservation.Status.PICKED_UP:
+                    start = self.listing_window[index]
+                    picked_up_at = min(max(datetime.combine(
+                        date.fromordinal(pickup_date),
+                        clock_time(start // 60, start % 60),
+                        tzinfo=tz,
+                    ) + timedelta(minutes=rng.randint(0, 60)), confirmed_at), self.now)
+                made += 1
+                yield FoodReservation(
+                    food_listing_id=self.listing_ids[index],
+                    seeker_id=seeker,
+                    quantity_reserved=quantity,
+                    status=status,
+                    reserved_at=reserved_at,
+                    confirmed_at=confirmed_at,
+                    picked_up_at=picked_up_at,
+                    # Same reward FoodReservation.save() computes
+                    kindcoins_earned=10 * quantity + int(self.listing_co2[index] * 5),
+                    created_at=reserved_at,
+                    updated_at=picked_up_at or confirmed_at or reserved_at,
+                )
+
+        def collect(chunk):
+            coins = []
+            for reservation in chunk:
+                # Rewards are credited when the reservation is made (see handle_reservation_reward)
+                balance = balances.get(reservation.seeker_id, 0) + reservation.kindcoins_earned
+                balances[reservation.seeker_id] = balance
+                coins.append(KindCoinsTransaction(
+                    user_id=reservation.seeker_id,
+                    transaction_type=KindCoinsTransaction.TransactionType.EARNED,
+                    amount=reservation.kindcoins_earned,
+                    balance_after=balance,
+                    description=f'Reservation #{reservation.id}',
+                    food_reservation_id=reservation.id,
+                    created_at=reservation.reserved_at,
+                    updated_at=reservation.reserved_at,
+                ))
+                if reservation.status == FoodReservation.Status.PICKED_UP:
+                    self.picked['id'].append(reservation.id)
+                    self.picked['listing'].append(reservation.food_listing_id)
+                    self.picked['seeker'].append(reservation.seeker_id)
+                    self.picked['at'].append(reservation.picked_up_at.timestamp())
+                    self.picked['quantity'].append(reservation.quantity_reserved)
+            ledger.append(len(coins))
+            KindCoinsTransaction.objects.bulk_create(coins)
+
+        self.listing_index = {listing_id: i for i, listing_id in enumerate(self.listing_ids)}
+        self._insert(FoodReservation, rows(), 'reservations (+ coins)', collect)
+
+        started = time.perf_counter()
+        users = [User(id=user_id, kind_coins=balance) for user_id, balance in balances.items()]
+        with transaction.atomic():
+            User.objects.bulk_update(users, ['kind_coins'], batch_size=self.chunk_size)
+        self.stdout.write(
+            f'   {"kindcoins balances":<26} {len(users):>10,} rows  {time.perf_counter() - started:6.1f}s'
+            f'  ({sum(ledger):,} ledger rows)'
+        )
+
+    def _ratings(self, total):
+        rng = self.rng
+        pick_rating = _picker(rng, RATING_MIX)
+        picked = self.picked
+        chosen = sorted(rng.sample(range(len(picked['id'])), min(total, len(picked['id']))))
+
+        def rows():
+            for i in chosen:
+                rating = pick_rating()[0]
+                rated_at = datetime.fromtimestamp(picked['at'][i], tz=self.now.tzinfo) + timedelta(hours=rng.uniform(1, 48))
+                rated_at = min(rated_at, self.now)
+                yield FoodRating(
+                    food_listing_id=picked['listing'][i],
+                    reviewer_id=picked['seeker'][i],
+                    reservation_id=picked['id'][i],
+                    rating=rating,
+                    review=rng.choice(REVIEWS) if rng.random() < 0.5 else '',
+                    food_quality=min(5, max(1, rating + rng.choice((-1, 0, 0, 1)))),
+                    pickup_experience=min(5, max(1, rating + rng.choice((-1, 0, 0, 1)))),
+                    value_for_money=min(5, max(1, rating + rng.choice((0, 0, 1)))),
+                    is_verified=rng.random() < 0.1,
+                    created_at=rated_at,
+                    updated_at=rated_at,
+                )
+
+        self._insert(FoodRating, rows(), 'ratings', None)
+
+    def _payments(self, total):
+        """A paid intent and a completed (or failed) transaction per sampled pickup."""
+        rng = self.rng
+        picked = self.picked
+        chosen = sorted(rng.sample(range(len(picked['id'])), min(total, len(picked['id']))))
+
+        def rows():
+            for i in chosen:
+                paid_at = datetime.fromtimestamp(picked['at'][i], tz=self.now.tzinfo)
+                amount = max(self.listing_price[self.listing_index[picked['listing'][i]]] * picked['quantity'][i], 500)
+                succeeded = rng.random() < 0.92
+                intent = PaymentIntent(
+                    user_id=picked['seeker'][i],
+                    stripe_payment_intent_id=f'pi_load_{picked["id"][i]}',
+                    amount=amount,
+                    status=PaymentIntent.Status.SUCCEEDED if succeeded else PaymentIntent.Status.FAILED,
+                    description=f'Reservation #{picked["id"][i]}',
+                    metadata={'food_reservation_id': picked['id'][i]},
+                    created_at=paid_at,
+                    updated_at=paid_at,
+                )
+                intent._reservation_id = picked['id'][i]
+                yield intent
+
+        def collect(chunk):
+            Transaction.objects.bulk_create([
+                Transaction(
+                    user_id=intent.user_id,
+                    transaction_type=Transaction.TransactionType.FOOD_PURCHASE,
+                    status=(
+                        Transaction.Status.COMPLETED if intent.status == PaymentIntent.Status.SUCCEEDED
+                        else Transaction.Status.FAILED
+                    ),
+                    amount=intent.amount,
+                    fee_amount=intent.amount * 3 // 100,
+                    net_amount=intent.amount - intent.amount * 3 // 100,
+                    description=intent.description,
+                    failure_reason='' if intent.status == PaymentIntent.Status.SUCCEEDED else 'card_declined',
+                    payment_intent_id=intent.id,
+                    food_reservation_id=intent._reservation_id,
+                    created_at=intent.created_at,
+                    updated_at=intent.created_at,
+                )
+                for intent in chunk
+            ])
+
+        self._insert(PaymentIntent, rows(), 'payments (+ transactions)', collect)
+
+    def _chats(self, total):
+        """Sessions of 2-12 alternating user/AI messages, mostly from active users."""
+        rng = self.rng
+        sessions = []
+        remaining = total
+        while remaining > 0:
+            size = min(remaining, 2 * rng.randint(1, 6))
+            sessions.append(size)
+            remaining -= size
+        owners = rng.choices(self.all_users, cum_weights=self.user_weights, k=len(sessions))
+        sizes = {}
+
+        def session_rows():
+            for owner, size in zip(owners, sessions):
+                started = self._recent_moment()
+                session = ChatSession(
+                    user_id=owner,
+                    title=f'Chat {started:%Y-%m-%d %H:%M}',
+                    is_active=rng.random() < 0.3,
+                    created_at=started,
+                    updated_at=started + timedelta(seconds=30 * size),
+                )
+                session._size = size
+                yield session
+
+        def collect(chunk):
+            for session in chunk:
+                sizes[session.id] = (session._size, session.created_at)
+
+        self._insert(ChatSession, session_rows(), 'chat sessions', collect)
+
+        def message_rows():
+            for session_id, (size, started) in sizes.items():
+                for i in range(size):
+                    topic = rng.randrange(len(CHAT_QUESTIONS))
+                    sent = started + timedelta(seconds=30 * i)
+                    is_ai = i % 2 == 1
+                    yield ChatMessage(
+                        session_id=session_id,
+                        message_type=ChatMessage.MessageType.AI if is_ai else ChatMessage.MessageType.USER,
+                        content=CHAT_ANSWERS[topic] if is_ai else CHAT_QUESTIONS[topic],
+                        response_time_ms=int(rng.lognormvariate(math.log(1200), 0.4)) if is_ai else None,
+                        tokens_used=rng.randint(40, 400) if is_ai else None,
+                        created_at=sent,
+                        updated_at=sent,
+                    )
+
+        self._insert(ChatMessage, message_rows(), 'chat messages', None)
+
+    def _notifications(self, total):
+        """Notifications for active users; older ones are more likely to have been read."""
+        rng = self.rng
+        pick_type = _picker(rng, NOTIFICATION_MIX)
+        pick_priority = _picker(rng, PRIORITY_MIX)
+        labels = dict(Notification.NotificationType.choices)
+
+        def rows():
+            for user_id in rng.choices(self.all_users, cum_weights=self.user_weights, k=total):
+                created = self._recent_moment()
+                notification_type = pick_type()[0]
+                age_days = (self.now - created).total_seconds() / 86400
+                read = rng.random() < min(0.95, 0.2 + age_days / 7)
+                yield Notification(
+                    user_id=user_id,
+                    notification_type=notification_type,
+                    title=labels[notification_type],
+                    message=f'{labels[notification_type]} on KindBite.',
+                    priority=pick_priority()[0],
+                    is_read=read,
+                    is_sent=True,
+                    sent_at=created,
+                    created_at=created,
+                    updated_at=created,
+                )
+
+        self._insert(Notification, rows(), 'notifications', None)
+
+    def _derived(self):
+        """Recompute what the app maintains on save: ratings, counters, leaderboards."""
+        self.stdout.write('🔁 Rebuilding derived data...')
+        started = time.perf_counter()
+        ratings = FoodRating.objects.filter(food_listing=OuterRef('pk')).order_by().values('food_listing')
+        with transaction.atomic():
+            FoodListing.all_objects.filter(
+                id__in=FoodRating.objects.filter(food_listing_id__gte=self.listing_ids[0]).values('food_listing_id')
+            ).update(
+                rating=Subquery(ratings.annotate(average=Round(Avg('rating'), 1)).values('average')),
+                rating_count=Subquery(ratings.annotate(count=Count('id')).values('count')),
+            )
+        recommendations.invalidate_listings()
+        self.stdout.write(f'   {"listing ratings":<32} {time.perf_counter() - started:7.1f}s')
+
+        quiet = io.StringIO()
+        for command in ('backfill_impact_counters', 'reconcile_notification_counters', 'rebuild_leaderboards'):
+            started = time.perf_counter()
+            call_command(command, stdout=quiet)
+            self.stdout.write(f'   {command:<32} {time.perf_counter() - started:7.1f}s')
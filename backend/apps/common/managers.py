@@ -0,0 +1,28 @@
+"""
+Shared managers for KindBite models.
+"""
+from django.db import models
+
+
+class AliveQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for soft-delete models.
+    """
+    def alive(self):
+        """Rows that have not been soft-deleted."""
+        return self.filter(is_deleted=False)
+
+    def dead(self):
+        """Soft-deleted rows only."""
+        return self.filter(is_deleted=True)
+
+
+class AliveManager(models.Manager.from_queryset(AliveQuerySet)):
+    """
+    Default manager for BaseModel: hides soft-deleted rows.
+    Every query carries `is_deleted = 0`, which lets SQLite pick the partial
+    indexes declared with condition=Q(is_deleted=False) on the hot tables.
+    Use `Model.all_objects` to reach soft-deleted rows.
+    """
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-19 21:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def copy_created_at(apps, schema_editor):
+    IdempotencyKey = apps.get_model('common', 'IdempotencyKey')
+    IdempotencyKey.objects.update(claimed_at=models.F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0002_outboxevent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='idempotencykey',
+            name='claimed_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='When the in-progress request claimed the key'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_created_at, migrations.RunPython.noop),
+    ]
@@ -1,9 +1,12 @@
 """
-Common abstract models for KindBite application.
+Common abstract models and shared infrastructure models for KindBite application.
 Following clean architecture principles.
 """
+from django.conf import settings
 from django.db import models
 
+from .managers import AliveManager
+
 
 class TimeStampedModel(models.Model):
     """
@@ -43,8 +46,82 @@ class SoftDeleteModel(models.Model):
 class BaseModel(TimeStampedModel, SoftDeleteModel):
     """
     Base model combining timestamp and soft delete functionality.
+    `objects` skips soft-deleted rows; `all_objects` sees every row.
     """
+    objects = AliveManager()
+    all_objects = models.Manager()
+
     class Meta:
         abstract = True
 
 
+
+
+class IdempotencyKey(TimeStampedModel):
+    """
+    Stored outcome of a POST request made with an Idempotency-Key header.
+    Replays of the same key return the stored response instead of re-running the view.
+    """
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='idempotency_keys',
+        null=True,
+        blank=True
+    )
+    key = models.CharField(max_length=255)
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=255)
+    request_fingerprint = models.CharField(max_length=64, help_text='SHA-256 of method, path and body')
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True, help_text='Empty while the request is in progress')
+    response_body = models.JSONField(null=True, blank=True)
+    claimed_at = models.DateTimeField(help_text='When the in-progress request claimed the key')
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = 'idempotency_keys'
+        verbose_name = 'Idempotency Key'
+        verbose_name_plural = 'Idempotency Keys'
+        unique_together = ['user', 'key']
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.key})"
+
+    @property
+    def is_completed(self):
+        """Check if the original request has finished and its response is stored."""
+        return self.status_code is not None
+
+
+class OutboxEvent(TimeStampedModel):
+    """
+    Side effect recorded in the same transaction as the state change that caused it.
+    Drained asynchronously by the outbox dispatcher (manage.py dispatch_outbox).
+    """
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        PROCESSING = 'processing', 'Processing'
+        DONE = 'done', 'Done'
+        FAILED = 'failed', 'Failed'
+
+    event_type = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    available_at = models.DateTimeField(help_text='Earliest time the event may be dispatched')
+    claimed_by = models.CharField(max_length=32, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        db_table = 'outbox_events'
+        verbose_name = 'Outbox Event'
+        verbose_name_plural = 'Outbox Events'
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'available_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} #{self.id} ({self.status})"
@@ -0,0 +1,128 @@
+"""
+Transactional outbox for KindBite side effects.
+
+Views call enqueue() inside the transaction that changes state, so the event
+is committed (or rolled back) together with the change. The dispatcher
+(manage.py dispatch_outbox) drains pending events in batches and runs the
+handler registered for each event type, retrying failures with backoff.
+"""
+import logging
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboxEvent
+
+logger = logging.getLogger(__name__)
+
+_handlers = {}
+
+
+def register(event_type, atomic=True):
+    """
+    Decorator registering the handler for an event type.
+
+    Handlers receive the event payload dict and by default run inside the same
+    transaction that marks the event done. Long-running handlers can pass
+    atomic=False; they are called with (payload, event) and manage their own
+    transactions, saving progress in event.payload so a retry can resume.
+    """
+    def decorator(func):
+        if event_type in _handlers:
+            raise ValueError(f'Outbox handler already registered for {event_type}')
+        _handlers[event_type] = (func, atomic)
+        return func
+    return decorator
+
+
+def enqueue(event_type, payload=None, delay=None):
+    """
+    Record an event for asynchronous dispatch.
+    Call it inside the same transaction.atomic() block as the state change.
+    """
+    return OutboxEvent.objects.create(
+        event_type=event_type,
+        payload=payload or {},
+        available_at=timezone.now() + (delay or timedelta(0)),
+    )
+
+
+def _claim_batch(batch_size):
+    """
+    Claim up to batch_size due events for this dispatcher.
+    Events stuck in processing longer than the visibility timeout are reclaimed.
+    """
+    now = timezone.now()
+    stale_before = now - settings.OUTBOX['VISIBILITY_TIMEOUT']
+    due = Q(status=OutboxEvent.Status.PENDING, available_at__lte=now) | Q(
+        status=OutboxEvent.Status.PROCESSING, claimed_at__lt=stale_before
+    )
+    candidate_ids = list(
+        OutboxEvent.objects.filter(due).values_list('id', flat=True)[:batch_size]
+    )
+    if not candidate_ids:
+        return []
+
+    token = uuid.uuid4().hex
+    OutboxEvent.objects.filter(due, id__in=candidate_ids).update(
+        status=OutboxEvent.Status.PROCESSING,
+        claimed_by=token,
+        claimed_at=now,
+    )
+    return list(OutboxEvent.objects.filter(claimed_by=token, status=OutboxEvent.Status.PROCESSING))
+
+
+def _retry_delay(attempts):
+    """Exponential backoff capped at the configured maximum."""
+    base = settings.OUTBOX['RETRY_BASE_DELAY']
+    return min(base * (2 ** (attempts - 1)), settings.OUTBOX['RETRY_MAX_DELAY'])
+
+
+def _process(event):
+    """Run one event's handler; returns True when the event completed."""
+    now = timezone.now()
+    try:
+        if event.event_type not in _handlers:
+            raise LookupError(f'No outbox handler registered for {event.event_type}')
+        handler, atomic = _handlers[event.event_type]
+        if not atomic:
+            handler(event.payload, event)
+        with transaction.atomic():
+            if atomic:
+                handler(event.payload)
+            event.status = OutboxEvent.Status.DONE
+            event.processed_at = timezone.now()
+            event.last_error = ''
+            event.save(update_fields=['status', 'processed_at', 'last_error', 'updated_at'])
+        return True
+    except Exception as e:
+        event.attempts += 1
+        event.last_error = f'{type(e).__name__}: {e}'
+        if event.attempts >= settings.OUTBOX['MAX_ATTEMPTS']:
+            event.status = OutboxEvent.Status.FAILED
+            logger.error('Outbox event %s (%s) failed permanently: %s', event.id, event.event_type, e)
+        else:
+            event.status = OutboxEvent.Status.PENDING
+            event.available_at = now + _retry_delay(event.attempts)
+            logger.warning('Outbox event %s (%s) failed, will retry: %s', event.id, event.event_type, e)
+        event.save(update_fields=['status', 'attempts', 'last_error', 'available_at', 'updated_at'])
+        return False
+
+
+def dispatch_batch(batch_size=None):
+    """
+    Claim and process one batch of due events.
+    Returns (processed, failed) counts.
+    """
+    events = _claim_batch(batch_size or settings.OUTBOX['BATCH_SIZE'])
+    processed = failed = 0
+    for event in events:
+        if _process(event):
+            processed += 1
+        else:
+            failed += 1
+    return processed, failed
@@ -33,6 +33,17 @@ class IsAdminOrReadOnly(permissions.BasePermission):
         )
 
 
+class IsPlatformAdmin(permissions.BasePermission):
+    """
+    Permission for platform admins (staff or admin role) only.
+    """
+    def has_permission(self, request, view):
+        return (
+            request.user.is_authenticated and
+            (request.user.is_staff or request.user.user_role == User.UserRole.ADMIN)
+        )
+
+
 class IsProviderOrReadOnly(permissions.BasePermission):
     """
     Permission for food providers to manage their content.
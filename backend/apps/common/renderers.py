@@ -0,0 +1,37 @@
+"""
+JSON renderer that uses orjson when it is installed.
+
+orjson is optional: without it, or when the response is rendered indented
+(browsable API, `; indent=` in the Accept header), rendering falls back to
+DRF's JSONRenderer. Values orjson does not handle natively (Decimal, lazy
+strings, querysets) and datetimes go through DRF's encoder, so the output
+matches JSONRenderer's.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+LINE_SEPARATORS = ((b'\xe2\x80\xa8', b'\\u2028'), (b'\xe2\x80\xa9', b'\\u2029'))
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer with compact output produced by orjson when available."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(
+            data,
+            default=JSONEncoder().default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+        # Same escaping as JSONRenderer, so responses can be embedded in <script> tags
+        for raw, escaped in LINE_SEPARATORS:
+            if raw in ret:
+                ret = ret.replace(raw, escaped)
+        return ret
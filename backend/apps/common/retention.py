@@ -0,0 +1,255 @@
+"""
+Retention policies for KindBite's fast-growing tables.
+
+Each policy walks its table in primary-key order and handles one small batch
+per transaction: old read notifications and idle chat sessions are copied to
+compact archive tables and removed, deactivated chat sessions and
+soft-deleted notifications and chat rows are hard-deleted once their grace
+period has passed, and leaderboard entries of past weeks and months are
+deleted.
+The engine sleeps between batches so writers on SQLite get the lock back.
+"""
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.ai_chat.models import ArchivedChatSession, ChatMessage, ChatSession
+from apps.leaderboards.models import LeaderboardEntry
+from apps.leaderboards.services import expired_periods
+from apps.notifications.models import ArchivedNotification, Notification
+from apps.notifications.services.counters import record_deleted
+
+
+class RetentionPolicy:
+    """
+    Base class: subclasses select candidate ids and process one batch of them.
+    """
+    name = ''
+
+    def candidate_ids(self, after_id, limit):
+        raise NotImplementedError
+
+    def process(self, ids):
+        """Archive and/or delete the given rows; runs inside a transaction."""
+        raise NotImplementedError
+
+
+class ArchiveReadNotifications(RetentionPolicy):
+    """Move read notifications older than `days` into ArchivedNotification."""
+
+    def __init__(self, days):
+        self.name = f'archive read notifications older than {days} days'
+        self.cutoff = timezone.now() - timedelta(days=days)
+
+    def candidate_ids(self, after_id, limit):
+        return list(
+            Notification.objects.filter(id__gt=after_id, is_read=True, created_at__lt=self.cutoff)
+            .order_by('id').values_list('id', flat=True)[:limit]
+        )
+
+    def process(self, ids):
+        notifications = list(Notification.objects.filter(id__in=ids))
+        ArchivedNotification.objects.bulk_create([
+            ArchivedNotification(
+                original_id=notification.id,
+                user_id=notification.user_id,
+                notification_type=notification.notification_type,
+                title=notification.title,
+                message=notification.message,
+                priority=notification.priority,
+                data=notification.data,
+                food_listing_id=notification.food_listing_id,
+                food_reservation_id=notification.food_reservation_id,
+                created_at=notification.created_at,
+            )
+            for notification in notifications
+        ], ignore_conflicts=True)
+        record_deleted(notifications)
+        Notification.objects.filter(id__in=ids).delete()
+        return len(notifications)
+
+
+class ArchiveIdleChatSessions(RetentionPolicy):
+    """Move chat sessions without messages for `days` into ArchivedChatSession."""
+
+    def __init__(self, days):
+        self.name = f'archive chat sessions idle for {days} days'
+        self.cutoff = timezone.now() - timedelta(days=days)
+
+    def _sessions(self):
+        return ChatSession.objects.annotate(
+            last_activity_at=Coalesce(Max('messages__created_at'), 'created_at')
+        )
+
+    def candidate_ids(self, after_id, limit):
+        return list(
+            self._sessions().filter(id__gt=after_id, last_activity_at__lt=self.cutoff)
+            .order_by('id').values_list('id', flat=True)[:limit]
+        )
+
+    def process(self, ids):
+        messages_by_session = {}
+        messages = (
+            ChatMessage.objects.filter(session_id__in=ids)
+            .prefetch_related('feedback')
+            .order_by('session_id', 'created_at')
+        )
+        for message in messages:
+            messages_by_session.setdefault(message.session_id, []).append({
+                'type': message.message_type,
+                'content': message.content,
+                'created_at': message.created_at.isoformat(),
+                'response_time_ms': message.response_time_ms,
+                'tokens_used': message.tokens_used,
+                'feedback': [
+                    {'user_id': feedback.user_id, 'rating': feedback.rating, 'comment': feedback.comment}
+                    for feedback in message.feedback.all()
+                ],
+            })
+
+        sessions = list(self._sessions().filter(id__in=ids))
+        ArchivedChatSession.objects.bulk_create([
+            ArchivedChatSession(
+                original_id=session.id,
+                user_id=session.user_id,
+                title=session.title,
+                message_count=len(messages_by_session.get(session.id, [])),
+                messages=messages_by_session.get(session.id, []),
+                created_at=session.created_at,
+                last_activity_at=session.last_activity_at,
+            )
+            for session in sessions
+        ], ignore_conflicts=True)
+        ChatSession.objects.filter(id__in=ids).delete()
+        return len(sessions)
+
+
+class PurgeDeactivatedChatSessions(RetentionPolicy):
+    """Hard-delete chat sessions the user deleted (is_active=False) more than `days` ago."""
+
+    def __init__(self, days):
+        self.name = f'purge chat sessions deleted more than {days} days ago'
+        self.cutoff = timezone.now() - timedelta(days=days)
+
+    def candidate_ids(self, after_id, limit):
+        return list(
+            ChatSession.objects.filter(id__gt=after_id, is_active=False, updated_at__lt=self.cutoff)
+            .order_by('id').values_list('id', flat=True)[:limit]
+        )
+
+    def process(self, ids):
+        ChatSession.objects.filter(id__in=ids).delete()
+        return len(ids)
+
+
+class PurgeExpiredLeaderboards(RetentionPolicy):
+    """Delete weekly and monthly leaderboard entries of periods that have ended."""
+    name = 'purge leaderboard entries of past weeks and months'
+
+    def candidate_ids(self, after_id, limit):
+        return list(
+            LeaderboardEntry.objects.filter(expired_periods(), id__gt=after_id)
+            .order_by('id').values_list('id', flat=True)[:limit]
+        )
+
+    def process(self, ids):
+        LeaderboardEntry.objects.filter(id__in=ids).delete()
+        return len(ids)
+
+
+class PurgeSoftDeleted(RetentionPolicy):
+    """
+    Hard-delete rows of a soft-delete model whose deleted_at is older than `days`.
+    Goes through `all_objects`, since the default manager hides soft-deleted rows.
+    Rows that other rows still point at (live or soft-deleted) are kept, never
+    cascaded; they are counted in `protected`.
+    """
+
+    def __init__(self, model, days):
+        self.model = model
+        self.name = f'purge soft-deleted {model._meta.label} older than {days} days'
+        self.cutoff = timezone.now() - timedelta(days=days)
+        self.protected = 0
+
+    def _queryset(self):
+        return self.model.all_objects.filter(is_deleted=True, deleted_at__lt=self.cutoff)
+
+    def candidate_ids(self, after_id, limit):
+        return list(
+            self._queryset().filter(pk__gt=after_id)
+            .order_by('pk').values_list('pk', flat=True)[:limit]
+        )
+
+    def _referenced_ids(self, ids):
+        """Ids among `ids` that rows of any reverse relation still reference."""
+        referenced = set()
+        for relation in self.model._meta.related_objects:
+            field = relation.field
+            referenced.update(
+                relation.related_model._base_manager
+                .filter(**{f'{field.name}__in': ids})
+                .values_list(field.attname, flat=True)
+            )
+        return referenced
+
+    def process(self, ids):
+        referenced = self._referenced_ids(ids)
+        deletable = [pk for pk in ids if pk not in referenced]
+        self.protected += len(ids) - len(deletable)
+        # Re-check the filter: a row may have been restored since it was selected
+        self._queryset().filter(pk__in=deletable).delete()
+        return len(deletable)
+
+
+# Soft-deleted rows of these models are purged, children before parents, so a
+# session's purged messages no longer protect it. Users, listings, reservations,
+# payments and the KindCoins ledger are never purged automatically.
+PURGEABLE_MODELS = (Notification, ChatMessage, ChatSession)
+
+
+def default_policies():
+    """Build the policies configured in settings.RETENTION."""
+    config = settings.RETENTION
+    grace = config['SOFT_DELETE_GRACE_DAYS']
+    policies = [
+        ArchiveReadNotifications(config['READ_NOTIFICATION_DAYS']),
+        ArchiveIdleChatSessions(config['CHAT_SESSION_DAYS']),
+        PurgeDeactivatedChatSessions(grace),
+        PurgeExpiredLeaderboards(),
+    ]
+    for model in PURGEABLE_MODELS:
+        policies.append(PurgeSoftDeleted(model, grace))
+    return policies
+
+
+def apply_policy(policy, batch_size=None, sleep=None, dry_run=False, max_batches=None):
+    """
+    Run one policy batch by batch; returns the number of rows handled.
+    In dry-run mode candidates are only counted.
+    """
+    batch_size = batch_size or settings.RETENTION['BATCH_SIZE']
+    sleep = settings.RETENTION['SLEEP_SECONDS'] if sleep is None else sleep
+    handled = batches = 0
+    after_id = 0
+
+    while max_batches is None or batches < max_batches:
+        ids = policy.candidate_ids(after_id, batch_size)
+        if not ids:
+            break
+        after_id = ids[-1]
+        batches += 1
+
+        if dry_run:
+            handled += len(ids)
+            continue
+
+        with transaction.atomic():
+            handled += policy.process(ids)
+        if sleep:
+            time.sleep(sleep)
+    return handled
@@ -0,0 +1,54 @@
+"""
+Tests for shared KindBite infrastructure.
+"""
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from apps.common.management.commands.check_query_plans import HOT_QUERIES, explain, plan_problems
+
+
+# Index each hot query in check_query_plans must be served by
+EXPECTED_INDEXES = {
+    'payment intents by user': 'payment_int_user_id_01c2fa_idx',
+    'payment intents by user and status': 'payment_int_user_id_2d4a66_idx',
+    'transactions by user': 'transaction_user_id_ced08a_idx',
+    'transactions by user and status': 'transaction_user_id_e49c40_idx',
+    'kindcoins transactions by user': 'kindcoins_t_user_id_afe7a5_idx',
+    'kindcoins transactions by user and type': 'kindcoins_t_user_id_80ad35_idx',
+    'notifications by user': 'notif_user_created_alive_idx',
+    'unread notifications by user': 'notif_user_created_alive_idx',
+    'notifications by user and type': 'notif_user_type_alive_idx',
+    'notification counts by type': 'notif_user_type_alive_idx',
+    'listings by dietary tag': 'food_listing_dietary_tags_dietarytag_id_7335899b',
+    'reservations by seeker': 'reservation_seeker_alive_idx',
+    'user directory by role': 'users_role_joined_alive_idx',
+    'leaderboard top': 'leaderboard_global_idx',
+    'leaderboard top by role': 'leaderboard_role_idx',
+    'leaderboard top by location': 'leaderboard_location_idx',
+    'leaderboard rank': 'leaderboard_global_idx',
+    'leaderboard rank by role': 'leaderboard_role_idx',
+    'active chat sessions by user': 'chat_sessio_user_id_c65971_idx',
+    'chat messages by session': 'chat_messag_session_597c4e_idx',
+    'recent chat context': 'chat_messag_session_597c4e_idx',
+    'user chat messages by type': 'chat_messag_session_4ab29e_idx',
+}
+
+
+@skipUnless(connection.vendor == 'sqlite', 'EXPLAIN QUERY PLAN output is SQLite specific')
+class HotQueryPlanTests(TestCase):
+    """EXPLAIN plan regression tests for the hot per-user queries."""
+
+    def test_every_hot_query_has_an_expected_index(self):
+        self.assertEqual(set(EXPECTED_INDEXES), {label for label, _build in HOT_QUERIES})
+
+    def test_hot_queries_use_their_index(self):
+        for label, build_queryset in HOT_QUERIES:
+            with self.subTest(label):
+                plan = explain(build_queryset())
+                self.assertTrue(
+                    any(f'INDEX {EXPECTED_INDEXES[label]} ' in detail for detail in plan),
+                    f'{label} does not use {EXPECTED_INDEXES[label]}: {plan}',
+                )
+                self.assertEqual(plan_problems(plan), [], f'{label}: {plan}')
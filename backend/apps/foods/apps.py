@@ -11,7 +11,6 @@ class FoodsConfig(AppConfig):
     
     def ready(self):
         """
-        Import signal handlers when the app is ready.
+        Import signal and outbox handlers when the app is ready.
         """
-        # Import signals here if needed
-        pass
\ No newline at end of file
+        from . import handlers, signals  # noqa: F401
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Bulk listing import for providers posting many items at once.
+
+Rows come from a JSON body or a streamed CSV / JSONL upload. They are
+validated with one bound FoodListingCreateUpdateSerializer (fields are set up
+once, not per row) and inserted with bulk_create in chunks, so memory stays
+bounded however large the upload is. Invalid rows are reported by row number
+and do not stop the valid ones. Fields the model fills in save() (provider,
+provider_type, available_quantity) are set here, since bulk_create skips save().
+"""
+import codecs
+import csv
+import json
+
+from django.conf import settings
+from rest_framework import serializers
+
+from . import dietary, recommendations
+from .models import FoodListing
+from .serializers import FoodListingCreateUpdateSerializer
+
+# Separators accepted inside the dietary_info CSV column
+DIETARY_SEPARATORS = (';', '|')
+
+
+class ImportLimitExceeded(ValueError):
+    """Raised when an import has more rows than BULK_IMPORT['MAX_ROWS']."""
+
+
+def _csv_dietary(value):
+    for separator in DIETARY_SEPARATORS:
+        value = value.replace(separator, ',')
+    return [label.strip() for label in value.split(',') if label.strip()]
+
+
+def read_csv(upload):
+    """Yield one dict per CSV row; empty cells are left out so model defaults apply."""
+    reader = csv.DictReader(codecs.iterdecode(upload, 'utf-8-sig'))
+    for row in reader:
+        row = {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+        if 'dietary_info' in row:
+            row['dietary_info'] = _csv_dietary(row['dietary_info'])
+        yield row
+
+
+def read_jsonl(upload):
+    """Yield one dict per non-empty JSONL line; unparsable lines yield the error instead."""
+    for line in codecs.iterdecode(upload, 'utf-8-sig'):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield serializers.ValidationError({'non_field_errors': [f'Invalid JSON: {e}']})
+            continue
+        yield row if isinstance(row, dict) else serializers.ValidationError(
+            {'non_field_errors': ['Each line must be a JSON object.']}
+        )
+
+
+class ListingImporter:
+    """Validate and insert rows for one provider; collects created ids and per-row errors."""
+
+    def __init__(self, provider, chunk_size=None):
+        self.provider = provider
+        self.chunk_size = chunk_size or settings.BULK_IMPORT['CHUNK_SIZE']
+        self.max_rows = settings.BULK_IMPORT['MAX_ROWS']
+        self.serializer = FoodListingCreateUpdateSerializer()
+        # Resolved once instead of per row in FoodListing.save()
+        self.provider_type = provider.user_role if provider.user_role in FoodListing.ProviderType.values else None
+        self.created = []
+        self.errors = []
+        self.rows = 0
+        self._pending = []
+
+    def _build(self, row):
+        if not isinstance(row, dict):
+            raise serializers.ValidationError({'non_field_errors': ['Each row must be an object.']})
+        data = self.serializer.run_validation(row)
+        listing = FoodListing(provider=self.provider, **data)
+        listing.available_quantity = listing.quantity
+        if self.provider_type:
+            listing.provider_type = self.provider_type
+        return listing
+
+    def add(self, row):
+        self.rows += 1
+        if self.rows > self.max_rows:
+            raise ImportLimitExceeded(f'Imports are limited to {self.max_rows} rows.')
+        try:
+            if isinstance(row, serializers.ValidationError):
+                raise row
+            self._pending.append(self._build(row))
+        except serializers.ValidationError as e:
+            self.errors.append({'row': self.rows, 'errors': e.detail})
+            return
+        if len(self._pending) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        listings = FoodListing.objects.bulk_create(self._pending)
+        dietary.sync_listing_tags(listings)
+        self.created.extend(listing.id for listing in listings)
+        self._pending = []
+
+    def run(self, rows):
+        """Import an iterable of rows. Call inside a transaction."""
+        for row in rows:
+            self.add(row)
+        self.flush()
+        if self.created:
+            recommendations.invalidate_listings()
+        return self
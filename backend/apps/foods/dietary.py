@@ -0,0 +1,74 @@
+"""
+Dietary tags: the indexed, normalized form of FoodListing.dietary_info.
+
+dietary_info stays the field clients read and write. Every save that changes
+it (and bulk imports, via sync_listing_tags) mirrors the labels into
+DietaryTag rows and the food_listing_dietary_tags join table, and feed
+filters go through the join table's tag index instead of scanning JSON.
+"""
+from django.db.models import Q
+from django.utils.text import slugify
+
+from .models import DietaryTag, FoodListing
+
+ListingTag = FoodListing.dietary_tags.through
+
+
+def tag_slugs(names):
+    """Distinct slugs for a list of labels, e.g. ['Halal', 'gluten free'] -> {'halal', 'gluten-free'}."""
+    return {slug for slug in (slugify(str(name)) for name in names or ()) if slug}
+
+
+def tag_ids(names):
+    """{slug: tag id} for the labels, creating tags that do not exist yet."""
+    labels = {}
+    for name in names:
+        slug = slugify(str(name))
+        if slug:
+            labels.setdefault(slug, str(name).strip()[:50])
+    if not labels:
+        return {}
+    DietaryTag.objects.bulk_create(
+        [DietaryTag(name=name, slug=slug) for slug, name in labels.items()],
+        ignore_conflicts=True,
+    )
+    return dict(DietaryTag.objects.filter(slug__in=labels).values_list('slug', 'id'))
+
+
+def sync_listing_tags(listings):
+    """Make the listings' tag rows match their dietary_info, writing only the difference."""
+    listings = [listing for listing in listings if listing.pk]
+    if not listings:
+        return
+    ids = tag_ids([name for listing in listings for name in listing.dietary_info or ()])
+    wanted = {
+        (listing.pk, ids[slug])
+        for listing in listings
+        for slug in tag_slugs(listing.dietary_info)
+    }
+    existing = set(
+        ListingTag.objects.filter(foodlisting_id__in=[listing.pk for listing in listings])
+        .values_list('foodlisting_id', 'dietarytag_id')
+    )
+    stale = existing - wanted
+    if stale:
+        condition = Q()
+        for listing_id, tag_id in stale:
+            condition |= Q(foodlisting_id=listing_id, dietarytag_id=tag_id)
+        ListingTag.objects.filter(condition).delete()
+    ListingTag.objects.bulk_create(
+        [ListingTag(foodlisting_id=listing_id, dietarytag_id=tag_id) for listing_id, tag_id in wanted - existing],
+        ignore_conflicts=True,
+    )
+
+
+def filter_by_tags(queryset, param):
+    """
+    Restrict a listing queryset to listings carrying every tag in a
+    comma-separated `dietary` parameter (labels or slugs, case-insensitive).
+    """
+    for slug in tag_slugs(param.split(',')):
+        queryset = queryset.filter(
+            id__in=ListingTag.objects.filter(dietarytag__slug=slug).values('foodlisting_id')
+        )
+    return queryset
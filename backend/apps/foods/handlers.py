@@ -0,0 +1,127 @@
+"""
+Outbox handlers for food reservation events.
+Registered when the foods app is ready; executed by `manage.py dispatch_outbox`.
+"""
+from django.db.models import F
+
+from apps.authentication.authentication import invalidate_user
+from apps.common import outbox
+from apps.notifications.models import Notification
+from apps.notifications.services.digest import coalesce
+from apps.notifications.services.templates import render_or_default
+from apps.payments.models import KindCoinsTransaction
+from apps.users.models import User
+from .models import FoodReservation
+from .services import send_reservation_status_email
+
+
+STATUS_NOTIFICATIONS = {
+    FoodReservation.Status.CONFIRMED: (
+        Notification.NotificationType.RESERVATION_CONFIRMED,
+        'Reservation confirmed',
+        '{listing} from {provider} is confirmed for pickup.',
+    ),
+    FoodReservation.Status.CANCELLED: (
+        Notification.NotificationType.RESERVATION_CANCELLED,
+        'Reservation cancelled',
+        'Your reservation for {listing} from {provider} was cancelled.',
+    ),
+}
+
+
+def _get_reservation(reservation_id):
+    return FoodReservation.objects.select_related(
+        'food_listing', 'food_listing__provider', 'seeker'
+    ).get(id=reservation_id)
+
+
+@outbox.register('reservation.status_email')
+def handle_status_email(payload):
+    """Send the status change email to the seeker."""
+    reservation = _get_reservation(payload['reservation_id'])
+    send_reservation_status_email(reservation, payload['old_status'], payload['new_status'])
+
+
+@outbox.register('reservation.status_notification')
+def handle_status_notification(payload):
+    """Create an in-app notification for the seeker on confirm/cancel."""
+    spec = STATUS_NOTIFICATIONS.get(payload['new_status'])
+    if spec is None:
+        return
+
+    reservation = _get_reservation(payload['reservation_id'])
+    notification_type, title, message = spec
+    listing = reservation.food_listing
+    title, message = render_or_default(
+        notification_type,
+        {'listing': listing.name, 'provider': listing.restaurant_name},
+        title,
+        message,
+    )
+    Notification.objects.create(
+        user=reservation.seeker,
+        notification_type=notification_type,
+        title=title,
+        message=message,
+        food_listing=listing,
+        food_reservation=reservation,
+    )
+
+
+@outbox.register('reservation.created')
+def handle_reservation_created(payload):
+    """Notify the provider that one of their listings was reserved, coalescing bursts."""
+    reservation = _get_reservation(payload['reservation_id'])
+    listing = reservation.food_listing
+    title, message = render_or_default(
+        Notification.NotificationType.FOOD_RESERVED,
+        {
+            'seeker': reservation.seeker.get_full_name(),
+            'quantity': reservation.quantity_reserved,
+            'listing': listing.name,
+        },
+        'New reservation',
+        '{seeker} reserved {quantity} x {listing}.',
+    )
+    coalesce(
+        user_id=listing.provider_id,
+        notification_type=Notification.NotificationType.FOOD_RESERVED,
+        related_id=reservation.id,
+        title=title,
+        message=message,
+        digest_title='{count} new reservations',
+        digest_message='You have {count} new reservations on your listings.',
+        food_listing=listing,
+        food_reservation=reservation,
+    )
+
+
+@outbox.register('kindcoins.reservation_reward')
+def handle_reservation_reward(payload):
+    """
+    Credit the seeker's KindCoins for a reservation and record it in the ledger.
+    Idempotent: a reclaimed or retried event finds the ledger row and pays nothing.
+    """
+    # The row lock serializes concurrent runs of the same event (no-op on SQLite,
+    # where a run that read before another's write commits cannot write itself)
+    reservation = FoodReservation.objects.select_for_update().get(id=payload['reservation_id'])
+    amount = reservation.kindcoins_earned
+    if amount <= 0:
+        return
+    if KindCoinsTransaction.objects.filter(
+        food_reservation=reservation,
+        transaction_type=KindCoinsTransaction.TransactionType.EARNED,
+    ).exists():
+        return
+
+    User.objects.filter(id=reservation.seeker_id).update(kind_coins=F('kind_coins') + amount)
+    invalidate_user(reservation.seeker_id)
+    balance = User.objects.values_list('kind_coins', flat=True).get(id=reservation.seeker_id)
+    KindCoinsTransaction.objects.create(
+        user_id=reservation.seeker_id,
+        transaction_type=KindCoinsTransaction.TransactionType.EARNED,
+        amount=amount,
+        balance_after=balance,
+        description=f'Reservation #{reservation.id}',
+        food_reservation=reservation,
+    )
@@ -0,0 +1,114 @@
+"""
+Read-optimized rows for the high-volume listing endpoints (list, available,
+recommended).
+
+Produces exactly what FoodListingListSerializer returns, but from one
+`.values()` query joined to the provider plus one query for all images,
+without building model instances or running DRF fields per row. Derived
+fields (discount percentage, pickup window text, provider name) are computed
+here; pickup window strings are formatted once per distinct window.
+Keep the keys and formats in step with FoodListingListSerializer.
+"""
+from decimal import Decimal
+
+from django.utils import timezone
+
+from .models import FoodImage, FoodListing
+
+VALUE_FIELDS = (
+    'id', 'name', 'restaurant_name', 'description',
+    'original_price', 'discounted_price',
+    'quantity', 'available_quantity', 'pickup_window_start', 'pickup_window_end', 'pickup_date',
+    'location', 'latitude', 'longitude', 'distance', 'provider_type', 'dietary_info',
+    'image_emoji', 'co2_saved', 'rating', 'rating_count',
+    'status', 'is_active', 'created_at',
+    'provider__first_name', 'provider__last_name', 'provider__business_name',
+)
+IMAGE_FIELDS = ('id', 'food_listing_id', 'image_url', 'alt_text', 'is_primary')
+
+# Quantization exponent per decimal field, matching the serializer's DecimalFields
+DECIMAL_EXPONENTS = {
+    name: Decimal(1).scaleb(-FoodListing._meta.get_field(name).decimal_places)
+    for name in ('original_price', 'discounted_price', 'latitude', 'longitude', 'distance', 'co2_saved', 'rating')
+}
+
+
+def _decimal(row, name):
+    value = row[name]
+    if value is None:
+        return None
+    return f'{value.quantize(DECIMAL_EXPONENTS[name]):f}'
+
+
+def _datetime(value, tz):
+    value = value.astimezone(tz).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def _images(listing_ids):
+    """{listing id: [image dicts]} for the listings, in one query."""
+    images = {}
+    if not listing_ids:
+        return images
+    for image in FoodImage.objects.filter(food_listing_id__in=listing_ids).values(*IMAGE_FIELDS):
+        images.setdefault(image.pop('food_listing_id'), []).append(image)
+    return images
+
+
+def values(queryset):
+    """The listing queryset as `.values()` rows; paginate this, then pass the page to build()."""
+    return queryset.prefetch_related(None).values(*VALUE_FIELDS)
+
+
+def build(rows):
+    """Serialize `.values()` rows into FoodListingListSerializer-shaped dicts."""
+    rows = list(rows)
+    images = _images([row['id'] for row in rows])
+    tz = timezone.get_current_timezone()
+    windows = {}
+    available = FoodListing.Status.AVAILABLE
+    data = []
+    for row in rows:
+        window_key = (row['pickup_window_start'], row['pickup_window_end'])
+        window = windows.get(window_key)
+        if window is None:
+            start, end = window_key
+            window = windows[window_key] = f"{start.strftime('%I:%M %p')} - {end.strftime('%I:%M %p')}"
+        original, discounted = row['original_price'], row['discounted_price']
+        data.append({
+            'id': row['id'],
+            'name': row['name'],
+            'restaurant_name': row['restaurant_name'],
+            'description': row['description'],
+            'original_price': _decimal(row, 'original_price'),
+            'discounted_price': _decimal(row, 'discounted_price'),
+            'discount_percentage': int((1 - (discounted / original)) * 100) if original > 0 else 0,
+            'quantity': row['quantity'],
+            'available_quantity': row['available_quantity'],
+            'pickup_window': window,
+            'pickup_date': row['pickup_date'].isoformat() if row['pickup_date'] else None,
+            'location': row['location'],
+            'latitude': _decimal(row, 'latitude'),
+            'longitude': _decimal(row, 'longitude'),
+            'distance': _decimal(row, 'distance'),
+            'provider_type': row['provider_type'],
+            'dietary_info': row['dietary_info'],
+            'image_emoji': row['image_emoji'],
+            'co2_saved': _decimal(row, 'co2_saved'),
+            'rating': _decimal(row, 'rating'),
+            'rating_count': row['rating_count'],
+            'status': row['status'],
+            'is_available': row['status'] == available and row['available_quantity'] > 0 and row['is_active'],
+            'created_at': _datetime(row['created_at'], tz) if row['created_at'] else None,
+            'provider_name': f"{row['provider__first_name']} {row['provider__last_name']}".strip(),
+            'provider_business_name': row['provider__business_name'],
+            'images': images.get(row['id'], []),
+        })
+    return data
+
+
+def serialize(queryset):
+    """Rows for a whole (already filtered and ordered) listing queryset."""
+    return build(values(queryset))
@@ -0,0 +1,137 @@
+"""
+Management command to benchmark listing feed serialization.
+Creates synthetic providers, listings and images inside a transaction and times
+FoodListingListSerializer + JSONRenderer against the `.values()` rows of
+apps.foods.listing_rows + FastJSONRenderer for several feed sizes, then rolls
+everything back. Both paths must render the same JSON.
+"""
+import json
+import time
+from datetime import time as clock_time, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.common import renderers
+from apps.common.renderers import FastJSONRenderer
+from apps.foods import listing_rows
+from apps.foods.models import FoodImage, FoodListing
+from apps.foods.serializers import FoodListingListSerializer
+from apps.users.models import User
+
+
+BENCH_LOCATION = 'Kampala, serialization-benchmark'
+DIETARY_TAGS = ['Halal', 'Vegan', 'Vegetarian', 'Gluten-Free', 'Dairy-Free', 'Nut-Free']
+PROVIDER_TYPES = [choice for choice, _ in FoodListing.ProviderType.choices]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the listing feed serializer against the .values() fast path (changes are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            default='1000,5000,20000',
+            help='Comma-separated feed sizes to time (default: 1000,5000,20000)',
+        )
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=3,
+            help='Timed runs per size and path; the best is reported (default: 3)',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted({int(size) for size in options['sizes'].split(',') if size.strip()})
+        except ValueError:
+            raise CommandError('--sizes must be a comma-separated list of integers')
+        if not sizes or sizes[0] < 1:
+            raise CommandError('--sizes must be positive')
+
+        engine = 'orjson' if renderers.orjson is not None else 'JSONRenderer fallback, orjson not installed'
+        with transaction.atomic():
+            self.stdout.write(f'🍽️  Creating {sizes[-1]} synthetic listings...')
+            self._seed(sizes[-1])
+            listings = FoodListing.objects.filter(location=BENCH_LOCATION).order_by('-created_at', '-id')
+
+            self.stdout.write(f'⏱️  Best of {options["runs"]} runs per size (fast renderer: {engine})')
+            self.stdout.write(f'   {"listings":>8}  {"serializer":>12}  {"fast path":>12}  {"speedup":>8}')
+            for size in sizes:
+                queryset = listings[:size]
+                slow_ms, slow = self._time(options['runs'], lambda: JSONRenderer().render(
+                    FoodListingListSerializer(
+                        queryset.select_related('provider').prefetch_related('images'), many=True
+                    ).data
+                ))
+                fast_ms, fast = self._time(options['runs'], lambda: FastJSONRenderer().render(
+                    listing_rows.serialize(queryset)
+                ))
+                if json.loads(slow) != json.loads(fast):
+                    transaction.set_rollback(True)
+                    raise CommandError(f'Fast path output differs from the serializer at {size} listings')
+                self.stdout.write(
+                    f'   {size:>8}  {slow_ms:>10.1f}ms  {fast_ms:>10.1f}ms  {slow_ms / fast_ms:>7.1f}x'
+                )
+
+            transaction.set_rollback(True)
+        self.stdout.write(self.style.SUCCESS('✓ Listing serialization benchmark complete (rolled back)'))
+
+    def _time(self, runs, render):
+        best, body = None, None
+        for _ in range(max(1, runs)):
+            started = time.perf_counter()
+            body = render()
+            elapsed = (time.perf_counter() - started) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best, body
+
+    def _seed(self, total):
+        """Create providers, listings and an image for every third listing."""
+        providers = User.objects.bulk_create([
+            User(
+                email=f'serialize-provider-{i}@benchmark.invalid',
+                first_name='Provider',
+                last_name=str(i),
+                phone='+256700000000',
+                location=BENCH_LOCATION,
+                user_role=PROVIDER_TYPES[i % len(PROVIDER_TYPES)],
+                business_name=f'Benchmark Kitchen {i}' if i % 2 else None,
+            )
+            for i in range(max(1, total // 50))
+        ])
+        today = timezone.localdate()
+        listings = FoodListing.objects.bulk_create([
+            FoodListing(
+                provider=providers[i % len(providers)],
+                restaurant_name=f'Provider {i % len(providers)}',
+                name=f'Benchmark meal {i}',
+                description='Serialization benchmark listing',
+                original_price=Decimal(10000 + i % 40 * 500),
+                discounted_price=Decimal(5000 + i % 20 * 250),
+                quantity=10,
+                available_quantity=10 - i % 11,
+                pickup_window_start=clock_time(12 + i % 6),
+                pickup_window_end=clock_time(18 + i % 4, 30),
+                pickup_date=today + timedelta(days=i % 3),
+                location=BENCH_LOCATION,
+                latitude=Decimal(f'{0.3476 + (i % 100 - 50) / 1000:.6f}') if i % 5 else None,
+                longitude=Decimal(f'{32.5825 + (i % 70 - 35) / 1000:.6f}') if i % 5 else None,
+                provider_type=PROVIDER_TYPES[i % len(PROVIDER_TYPES)],
+                dietary_info=[DIETARY_TAGS[i % len(DIETARY_TAGS)]],
+                co2_saved=Decimal('2.5'),
+            )
+            for i in range(total)
+        ])
+        FoodImage.objects.bulk_create([
+            FoodImage(
+                food_listing=listing,
+                image_url=f'https://images.benchmark.invalid/{listing.id}.jpg',
+                alt_text=listing.name,
+                is_primary=True,
+            )
+            for listing in listings[::3]
+        ])
@@ -0,0 +1,143 @@
+"""
+Management command to benchmark recommendation scoring.
+Creates synthetic providers, listings and a seeker with a reservation history
+inside a transaction, times the scoring pass and rolls everything back.
+"""
+import time
+from datetime import time as clock_time, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.foods import recommendations
+from apps.foods.models import FoodListing, FoodReservation
+from apps.users.models import User, UserProfile
+
+
+BENCH_LOCATION = 'Kampala, recommendation-benchmark'
+DIETARY_TAGS = ['Halal', 'Vegan', 'Vegetarian', 'Gluten-Free', 'Dairy-Free', 'Nut-Free']
+PROVIDER_TYPES = [choice for choice, _ in FoodListing.ProviderType.choices]
+# Kampala city centre
+ORIGIN = (0.3476, 32.5825)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark recommendation scoring over many live listings (changes are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--listings',
+            type=int,
+            default=10000,
+            help='Number of synthetic available listings (default: 10000)',
+        )
+        parser.add_argument(
+            '--history',
+            type=int,
+            default=50,
+            help='Past reservations of the benchmark seeker (default: 50)',
+        )
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=50,
+            help='Scoring passes to time (default: 50)',
+        )
+        parser.add_argument(
+            '--budget-ms',
+            type=float,
+            default=50.0,
+            help='Fail if the slowest scoring pass exceeds this (default: 50)',
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.stdout.write(f'🍽️  Creating {options["listings"]} synthetic listings...')
+            seeker = self._seed(options['listings'], options['history'])
+            recommendations.invalidate_listings()
+            recommendations.invalidate_affinity(seeker.id)
+
+            started = time.perf_counter()
+            columns = recommendations.listing_columns()
+            load_seconds = time.perf_counter() - started
+            affinity = recommendations.user_affinity(seeker)
+
+            self.stdout.write(f'🎯 Scoring {len(columns.ids)} listings {options["runs"]} times...')
+            timings = []
+            for run in range(options['runs']):
+                origin = ORIGIN if run % 2 else None
+                started = time.perf_counter()
+                top = recommendations.score_listings(columns, affinity, exclude_provider=seeker.id, origin=origin)
+                timings.append(time.perf_counter() - started)
+
+            transaction.set_rollback(True)
+        recommendations.invalidate_listings()
+        recommendations.invalidate_affinity(seeker.id)
+
+        timings.sort()
+        slowest = timings[-1] * 1000
+        self.stdout.write(f'   column load:  {load_seconds * 1000:.1f}ms (once per listings version)')
+        self.stdout.write(f'   scoring p50:  {timings[len(timings) // 2] * 1000:.1f}ms')
+        self.stdout.write(f'   scoring max:  {slowest:.1f}ms')
+        self.stdout.write(f'   top score:    {top[0][0]:.3f}' if top else '   no recommendations')
+        if slowest > options['budget_ms']:
+            self.stdout.write(self.style.ERROR(f'✗ Scoring exceeded the {options["budget_ms"]:.0f}ms budget'))
+        else:
+            self.stdout.write(self.style.SUCCESS('✓ Recommendation benchmark complete (rolled back)'))
+
+    def _seed(self, total, history):
+        """Create providers, listings and a seeker with preferences and history; returns the seeker."""
+        providers = User.objects.bulk_create([
+            User(
+                email=f'reco-provider-{i}@benchmark.invalid',
+                first_name='Provider',
+                last_name=str(i),
+                phone='+256700000000',
+                location=BENCH_LOCATION,
+                user_role=PROVIDER_TYPES[i % len(PROVIDER_TYPES)],
+            )
+            for i in range(max(1, total // 50))
+        ])
+        seeker = User.objects.create(
+            email='reco-seeker@benchmark.invalid',
+            first_name='Seeker',
+            last_name='Bench',
+            phone='+256700000000',
+            location=BENCH_LOCATION,
+        )
+        UserProfile.objects.create(user=seeker, dietary_preferences=['Halal', 'Gluten-Free'])
+
+        today = timezone.localdate()
+        listings = FoodListing.objects.bulk_create([
+            FoodListing(
+                provider=providers[i % len(providers)],
+                restaurant_name=f'Provider {i % len(providers)}',
+                name=f'Benchmark meal {i}',
+                description='Recommendation benchmark listing',
+                original_price=Decimal(10000 + i % 40 * 500),
+                discounted_price=Decimal(5000 + i % 20 * 250),
+                quantity=10,
+                available_quantity=10,
+                pickup_window_start=clock_time(17),
+                pickup_window_end=clock_time(20),
+                pickup_date=today + timedelta(days=i % 3),
+                location=BENCH_LOCATION,
+                latitude=Decimal(f'{ORIGIN[0] + (i % 100 - 50) / 1000:.6f}'),
+                longitude=Decimal(f'{ORIGIN[1] + (i % 70 - 35) / 1000:.6f}'),
+                provider_type=PROVIDER_TYPES[i % len(PROVIDER_TYPES)],
+                dietary_info=[DIETARY_TAGS[i % len(DIETARY_TAGS)], DIETARY_TAGS[i * 7 % len(DIETARY_TAGS)]],
+            )
+            for i in range(total)
+        ])
+        FoodReservation.objects.bulk_create([
+            FoodReservation(
+                food_listing=listings[i * 37 % len(listings)],
+                seeker=seeker,
+                quantity_reserved=1,
+                status=FoodReservation.Status.PICKED_UP,
+            )
+            for i in range(min(history, len(listings)))
+        ], ignore_conflicts=True)
+        return seeker
@@ -0,0 +1,120 @@
+"""
+Management command to guard the reservation list against N+1 queries.
+Creates synthetic reservations inside a transaction, lists them as a provider,
+a seeker and an admin (with and without ?expand=food_listing), and fails when
+the query count grows with the number of rows or exceeds the budget.
+Everything is rolled back.
+"""
+from datetime import time as clock_time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.foods.models import FoodImage, FoodListing, FoodReservation
+from apps.foods.views import UserReservationsView
+from apps.users.models import User
+
+
+BENCH_LOCATION = 'Kampala, query-count-check'
+# Page count + page rows, and the images prefetch when the listing is expanded
+QUERY_BUDGET = {'': 2, 'food_listing': 3}
+
+
+class Command(BaseCommand):
+    help = 'Fail if listing reservations issues more queries for more rows (changes are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=20,
+            help='Reservations per role in the large run (default: 20, one page)',
+        )
+
+    def handle(self, *args, **options):
+        rows = max(2, options['rows'])
+        failures = []
+        with transaction.atomic():
+            admin = self._user('admin', User.UserRole.ADMIN)
+            provider = self._user('provider', User.UserRole.RESTAURANT)
+            seeker = self._user('seeker', User.UserRole.END_USER)
+
+            self._seed(provider, seeker, 1)
+            small = self._counts(admin, provider, seeker)
+            self._seed(provider, seeker, rows - 1, offset=1)
+            large = self._counts(admin, provider, seeker)
+
+            self.stdout.write(f'🔎 Queries for 1 and {rows} reservations:')
+            for key, queries in large.items():
+                role, expand = key
+                budget = QUERY_BUDGET[expand]
+                ok = queries == small[key] and queries <= budget
+                label = f'{role}{" ?expand=" + expand if expand else ""}'
+                self.stdout.write(f'   {"✓" if ok else "✗"} {label:<34} {small[key]} -> {queries} (budget {budget})')
+                if not ok:
+                    failures.append(label)
+
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(f'Reservation list query count regressed for: {", ".join(failures)}')
+        self.stdout.write(self.style.SUCCESS('✓ Reservation list query counts are constant (rolled back)'))
+
+    def _counts(self, *users):
+        """{(role, expand): queries} for one GET of the reservation list per user and expand value."""
+        factory = APIRequestFactory()
+        view = UserReservationsView.as_view()
+        counts = {}
+        for user in users:
+            for expand in QUERY_BUDGET:
+                request = factory.get('/api/foods/reservations/my/', {'expand': expand} if expand else {})
+                force_authenticate(request, user=user)
+                with CaptureQueriesContext(connection) as queries:
+                    response = view(request)
+                if response.status_code != 200:
+                    raise CommandError(f'Reservation list returned {response.status_code} for {user.user_role}')
+                counts[(user.user_role, expand)] = len(queries)
+        return counts
+
+    def _user(self, name, role):
+        return User.objects.create(
+            email=f'query-check-{name}@benchmark.invalid',
+            first_name='Query',
+            last_name=name.title(),
+            phone='+256700000000',
+            location=BENCH_LOCATION,
+            user_role=role,
+        )
+
+    def _seed(self, provider, seeker, count, offset=0):
+        """Create `count` listings of the provider, each with an image and a reservation by the seeker."""
+        listings = FoodListing.objects.bulk_create([
+            FoodListing(
+                provider=provider,
+                restaurant_name='Query Check Kitchen',
+                name=f'Query check meal {offset + i}',
+                description='Query count check listing',
+                original_price=Decimal('10000'),
+                discounted_price=Decimal('5000'),
+                quantity=5,
+                available_quantity=4,
+                pickup_window_start=clock_time(17),
+                pickup_window_end=clock_time(19),
+                pickup_date=timezone.localdate(),
+                location=BENCH_LOCATION,
+                provider_type=FoodListing.ProviderType.RESTAURANT,
+            )
+            for i in range(count)
+        ])
+        FoodImage.objects.bulk_create([
+            FoodImage(food_listing=listing, image_url=f'https://images.benchmark.invalid/{listing.id}.jpg')
+            for listing in listings
+        ])
+        FoodReservation.objects.bulk_create([
+            FoodReservation(food_listing=listing, seeker=seeker, quantity_reserved=1)
+            for listing in listings
+        ])
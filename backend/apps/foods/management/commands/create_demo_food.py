@@ -60,7 +60,7 @@ class Command(BaseCommand):
                 'pickup_window_end': time(19, 0),    # 7:00 PM
                 'pickup_date': date.today(),
                 'location': 'Kampala, Uganda',
-                'distance': '0.3 km',
+                'distance': 0.3,  # km
                 'provider_type': 'restaurant',
                 'dietary_info': ['Halal', 'Gluten-Free'],
                 'image_emoji': '🍛',
@@ -82,7 +82,7 @@ class Command(BaseCommand):
                 'pickup_window_end': time(20, 0),    # 8:00 PM
                 'pickup_date': date.today(),
                 'location': 'Nakasero, Kampala',
-                'distance': '0.7 km',
+                'distance': 0.7,  # km
                 'provider_type': 'home',
                 'dietary_info': ['Vegetarian', 'Vegan'],
                 'image_emoji': '🥗',
@@ -104,7 +104,7 @@ class Command(BaseCommand):
                 'pickup_window_end': time(18, 0),    # 6:00 PM
                 'pickup_date': date.today(),
                 'location': 'Industrial Area, Kampala',
-                'distance': '2.1 km',
+                'distance': 2.1,  # km
                 'provider_type': 'factory',
                 'dietary_info': ['Contains Gluten'],
                 'image_emoji': '🍞',
@@ -126,7 +126,7 @@ class Command(BaseCommand):
                 'pickup_window_end': time(21, 0),    # 9:00 PM
                 'pickup_date': date.today(),
                 'location': 'Acacia Mall, Kampala',
-                'distance': '1.8 km',
+                'distance': 1.8,  # km
                 'provider_type': 'supermarket',
                 'dietary_info': ['Organic', 'Vegetarian', 'Vegan'],
                 'image_emoji': '🥕',
@@ -148,7 +148,7 @@ class Command(BaseCommand):
                 'pickup_window_end': time(19, 30),    # 7:30 PM
                 'pickup_date': date.today(),
                 'location': 'Kololo, Kampala',
-                'distance': '0.9 km',
+                'distance': 0.9,  # km
                 'provider_type': 'retail',
                 'dietary_info': ['Vegetarian Options'],
                 'image_emoji': '🥪',
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0006_foodlisting_distance'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='foodlisting',
+            name='food_listin_provide_032b02_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='foodlisting',
+            name='food_listin_pickup__2f2fcb_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='foodlisting',
+            name='food_listin_provide_b62718_idx',
+        ),
+        migrations.AddIndex(
+            model_name='foodlisting',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['provider_type', 'status'], name='listing_type_status_alive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='foodlisting',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['pickup_date', 'status'], name='listing_pickup_alive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='foodlisting',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['provider', 'status'], name='listing_provider_alive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='foodreservation',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['seeker', '-reserved_at'], name='reservation_seeker_alive_idx'),
+        ),
+    ]
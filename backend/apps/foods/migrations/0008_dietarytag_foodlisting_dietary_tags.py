@@ -0,0 +1,63 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:50
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def populate_dietary_tags(apps, schema_editor):
+    """Create tags and listing links from every listing's dietary_info."""
+    DietaryTag = apps.get_model('foods', 'DietaryTag')
+    FoodListing = apps.get_model('foods', 'FoodListing')
+    ListingTag = FoodListing.dietary_tags.through
+
+    links = set()
+    labels = {}
+    for listing_id, dietary_info in FoodListing.objects.values_list('id', 'dietary_info').iterator(chunk_size=2000):
+        for name in dietary_info or ():
+            slug = slugify(str(name))
+            if slug:
+                labels.setdefault(slug, str(name).strip()[:50])
+                links.add((listing_id, slug))
+
+    DietaryTag.objects.bulk_create(
+        [DietaryTag(name=name, slug=slug) for slug, name in labels.items()],
+        ignore_conflicts=True,
+    )
+    tag_ids = dict(DietaryTag.objects.values_list('slug', 'id'))
+    ListingTag.objects.bulk_create(
+        [ListingTag(foodlisting_id=listing_id, dietarytag_id=tag_ids[slug]) for listing_id, slug in links],
+        batch_size=2000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0007_remove_foodlisting_food_listin_provide_032b02_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DietaryTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=50)),
+                ('slug', models.SlugField(unique=True)),
+            ],
+            options={
+                'verbose_name': 'Dietary Tag',
+                'verbose_name_plural': 'Dietary Tags',
+                'db_table': 'dietary_tags',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='foodlisting',
+            name='dietary_tags',
+            field=models.ManyToManyField(blank=True, db_table='food_listing_dietary_tags', related_name='listings', to='foods.dietarytag'),
+        ),
+        migrations.RunPython(populate_dietary_tags, migrations.RunPython.noop),
+    ]
@@ -3,11 +3,30 @@ Food models for KindBite application.
 Handles food listings, reservations, and related functionality.
 """
 from django.db import models
+from django.db.models import Q
 from django.core.validators import MinValueValidator, MaxValueValidator
-from apps.common.models import BaseModel
+from apps.common.models import BaseModel, TimeStampedModel
 from apps.users.models import User
 
 
+class DietaryTag(TimeStampedModel):
+    """
+    Normalized dietary label (Halal, Vegan, ...) so listings can be filtered
+    through an index instead of scanning the dietary_info JSON.
+    """
+    name = models.CharField(max_length=50)
+    slug = models.SlugField(max_length=50, unique=True)
+
+    class Meta:
+        db_table = 'dietary_tags'
+        verbose_name = 'Dietary Tag'
+        verbose_name_plural = 'Dietary Tags'
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
 class FoodListing(BaseModel):
     """
     Represents a food listing created by food providers.
@@ -54,6 +73,13 @@ class FoodListing(BaseModel):
     # Categorization
     provider_type = models.CharField(max_length=20, choices=ProviderType.choices)
     dietary_info = models.JSONField(default=list, help_text="Dietary information (Halal, Vegan, etc.)")
+    # Kept in step with dietary_info on save (see apps.foods.dietary); used for filtering
+    dietary_tags = models.ManyToManyField(
+        DietaryTag,
+        related_name='listings',
+        blank=True,
+        db_table='food_listing_dietary_tags',
+    )
     
     # Visual
     image_emoji = models.CharField(max_length=10, default="🍽️", help_text="Emoji representation of food")
@@ -74,15 +100,56 @@ class FoodListing(BaseModel):
         verbose_name = 'Food Listing'
         verbose_name_plural = 'Food Listings'
         ordering = ['-created_at']
+        # Partial: soft-deleted listings stay out of the indexes the default manager uses
         indexes = [
-            models.Index(fields=['provider_type', 'status']),
-            models.Index(fields=['pickup_date', 'status']),
-            models.Index(fields=['provider', 'status']),
+            models.Index(
+                fields=['provider_type', 'status'],
+                name='listing_type_status_alive_idx',
+                condition=Q(is_deleted=False),
+            ),
+            models.Index(
+                fields=['pickup_date', 'status'],
+                name='listing_pickup_alive_idx',
+                condition=Q(is_deleted=False),
+            ),
+            models.Index(
+                fields=['provider', 'status'],
+                name='listing_provider_alive_idx',
+                condition=Q(is_deleted=False),
+            ),
         ]
 
     def __str__(self):
         return f"{self.name} from {self.restaurant_name}"
 
+    # Fields the recommendation engine filters or scores on (see apps.foods.recommendations)
+    RECOMMENDATION_FIELDS = (
+        'status', 'is_active', 'is_deleted', 'available_quantity', 'pickup_date', 'provider_id',
+        'provider_type', 'dietary_info', 'latitude', 'longitude', 'location', 'original_price',
+        'discounted_price',
+    )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so saves that do not touch dietary_info skip the tag sync
+        instance._loaded_dietary_info = instance.__dict__.get('dietary_info')
+        instance._recommendation_state = instance.recommendation_state()
+        return instance
+
+    def recommendation_state(self):
+        """
+        Loaded values of RECOMMENDATION_FIELDS; deferred fields are left out rather than fetched.
+        Recommendations only filter on whether any quantity is left, so reservations that
+        lower available_quantity without selling out do not change the state.
+        """
+        values = self.__dict__
+        return tuple(
+            values[field] > 0 if field == 'available_quantity' and values.get(field) is not None
+            else values.get(field)
+            for field in self.RECOMMENDATION_FIELDS
+        )
+
     def save(self, *args, **kwargs):
         # Set available_quantity to quantity on first save
         if not self.pk:
@@ -146,6 +213,13 @@ class FoodReservation(BaseModel):
         verbose_name_plural = 'Food Reservations'
         ordering = ['-reserved_at']
         unique_together = ['food_listing', 'seeker']  # One reservation per user per listing
+        indexes = [
+            models.Index(
+                fields=['seeker', '-reserved_at'],
+                name='reservation_seeker_alive_idx',
+                condition=Q(is_deleted=False),
+            ),
+        ]
 
     def __str__(self):
         return f"Reservation: {self.seeker.get_full_name()} - {self.food_listing.name}"
@@ -0,0 +1,204 @@
+"""
+Personalized listing recommendations for food seekers.
+
+Available listings are loaded once per process into column lists (ids,
+providers, types, dietary tags, coordinates, discounts) and reused until the
+listings version changes, which happens when a listing is created or saved
+with a change to one of FoodListing.RECOMMENDATION_FIELDS (for available_quantity,
+only selling out or becoming available again counts). Each user's affinity
+(dietary preferences, provider and provider type shares of recent reservations)
+is cached separately and dropped when they reserve or edit their profile.
+Scoring is one pass over the columns and the top K ids are cached per user and
+listings version.
+"""
+import heapq
+import math
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from apps.users.models import UserProfile
+from .models import FoodListing, FoodReservation
+
+VERSION_KEY = 'recommendations:listings-version'
+AFFINITY_KEY = 'recommendations:affinity:{user_id}'
+TOP_KEY = 'recommendations:top:{user_id}:{version}:{origin}'
+
+EARTH_RADIUS_KM = 6371.0
+# Distance at which the proximity score halves
+DISTANCE_SCALE_KM = 5.0
+
+_columns = None
+
+
+def normalize_tags(tags):
+    return frozenset(str(tag).strip().lower() for tag in tags or () if str(tag).strip())
+
+
+def listings_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.add(VERSION_KEY, version, settings.CACHE_VERSION_TIMEOUT)
+        version = cache.get(VERSION_KEY, version)
+    return version
+
+
+def invalidate_listings():
+    """Start a new listings version now and again once the transaction commits."""
+    def bump():
+        cache.set(VERSION_KEY, uuid.uuid4().hex, settings.CACHE_VERSION_TIMEOUT)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def invalidate_affinity(user_id):
+    cache.delete(AFFINITY_KEY.format(user_id=user_id))
+    transaction.on_commit(lambda: cache.delete(AFFINITY_KEY.format(user_id=user_id)))
+
+
+class ListingColumns:
+    """Scoring inputs for every available listing, one list per feature."""
+
+    def __init__(self, version, day):
+        self.version = version
+        self.day = day
+        rows = FoodListing.objects.filter(
+            status=FoodListing.Status.AVAILABLE,
+            is_active=True,
+            pickup_date__gte=day,
+            available_quantity__gt=0,
+        ).values_list(
+            'id', 'provider_id', 'provider_type', 'dietary_info',
+            'latitude', 'longitude', 'location', 'original_price', 'discounted_price',
+        )
+        self.ids, self.providers, self.types, self.tags = [], [], [], []
+        self.lats, self.lngs, self.locations, self.discounts = [], [], [], []
+        for listing_id, provider_id, provider_type, dietary_info, lat, lng, location, original, discounted in rows:
+            self.ids.append(listing_id)
+            self.providers.append(provider_id)
+            self.types.append(provider_type)
+            self.tags.append(normalize_tags(dietary_info))
+            self.lats.append(math.radians(float(lat)) if lat is not None else None)
+            self.lngs.append(math.radians(float(lng)) if lng is not None else None)
+            self.locations.append(location.lower())
+            self.discounts.append(float(1 - discounted / original) if original > 0 else 0.0)
+
+
+def listing_columns():
+    """The process-wide ListingColumns, rebuilt when the version or the day changes."""
+    global _columns
+    version = listings_version()
+    day = timezone.localdate()
+    if _columns is None or _columns.version != version or _columns.day != day:
+        _columns = ListingColumns(version, day)
+    return _columns
+
+
+def _shares(values):
+    total = len(values)
+    shares = {}
+    for value in values:
+        shares[value] = shares.get(value, 0) + 1 / total
+    return shares
+
+
+def user_affinity(user):
+    """
+    {'dietary', 'providers', 'types', 'reserved', 'location'} for a seeker,
+    built from their profile and most recent reservations and cached.
+    """
+    key = AFFINITY_KEY.format(user_id=user.id)
+    affinity = cache.get(key)
+    if affinity is not None:
+        return affinity
+
+    dietary = UserProfile.objects.filter(user_id=user.id).values_list('dietary_preferences', flat=True).first()
+    history = list(
+        FoodReservation.objects.filter(seeker_id=user.id)
+        .exclude(status=FoodReservation.Status.CANCELLED)
+        .values_list('food_listing__provider_id', 'food_listing__provider_type')
+        [:settings.RECOMMENDATIONS['HISTORY_SIZE']]
+    )
+    affinity = {
+        'dietary': normalize_tags(dietary),
+        'providers': _shares([provider_id for provider_id, _ in history]),
+        'types': _shares([provider_type for _, provider_type in history]),
+        # One reservation per listing and seeker, so reserved listings are never recommended
+        'reserved': frozenset(
+            FoodReservation.all_objects.filter(seeker_id=user.id).values_list('food_listing_id', flat=True)
+        ),
+        'location': (user.location or '').split(',')[0].strip().lower(),
+    }
+    cache.set(key, affinity, settings.RECOMMENDATIONS['CACHE_TIMEOUT'])
+    return affinity
+
+
+def _proximity(columns, origin, city):
+    """Per-listing nearness in [0, 1]: decays with distance from origin, else matches the city."""
+    if origin is not None:
+        origin_lat, origin_lng = math.radians(origin[0]), math.radians(origin[1])
+        cos_lat = math.cos(origin_lat)
+        scale = EARTH_RADIUS_KM / DISTANCE_SCALE_KM
+        # Equirectangular approximation; accurate to well under 1% at city distances
+        return [
+            1 / (1 + scale * math.hypot((lng - origin_lng) * cos_lat, lat - origin_lat))
+            if lat is not None and lng is not None else 0.0
+            for lat, lng in zip(columns.lats, columns.lngs)
+        ]
+    if city:
+        return [1.0 if city in location else 0.0 for location in columns.locations]
+    return [0.0] * len(columns.ids)
+
+
+def score_listings(columns, affinity, exclude_provider=None, origin=None, k=None):
+    """
+    Score every listing and return the top k (score, listing_id) pairs.
+    origin is an optional (lat, lng) in degrees; without it, listings whose
+    address mentions the user's city count as near.
+    """
+    weights = settings.RECOMMENDATIONS['WEIGHTS']
+    k = k or settings.RECOMMENDATIONS['TOP_K']
+    dietary = affinity['dietary']
+    providers = affinity['providers']
+    types = affinity['types']
+    reserved = affinity['reserved']
+    city = affinity['location']
+
+    w_dietary = weights['dietary'] / len(dietary) if dietary else 0.0
+    w_provider, w_type = weights['provider'], weights['provider_type']
+    w_distance, w_discount = weights['distance'], weights['discount']
+
+    proximity = _proximity(columns, origin, city)
+
+    scored = (
+        (
+            w_dietary * len(dietary & tags)
+            + w_provider * providers.get(provider_id, 0.0)
+            + w_type * types.get(provider_type, 0.0)
+            + w_distance * near
+            + w_discount * discount,
+            listing_id,
+        )
+        for listing_id, provider_id, provider_type, tags, near, discount in zip(
+            columns.ids, columns.providers, columns.types, columns.tags, proximity, columns.discounts
+        )
+        if listing_id not in reserved and provider_id != exclude_provider
+    )
+    return heapq.nlargest(k, scored)
+
+
+def recommend(user, origin=None):
+    """Top K (score, listing_id) pairs for a user, cached per listings version and origin."""
+    version = listings_version()
+    origin_key = f'{origin[0]:.2f},{origin[1]:.2f}' if origin else '-'
+    key = TOP_KEY.format(user_id=user.id, version=version, origin=origin_key)
+    top = cache.get(key)
+    if top is None:
+        top = score_listings(listing_columns(), user_affinity(user), exclude_provider=user.id, origin=origin)
+        cache.set(key, top, settings.RECOMMENDATIONS['CACHE_TIMEOUT'])
+    return top
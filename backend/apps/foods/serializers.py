@@ -4,7 +4,7 @@ Serializers for Food Management API endpoints.
 from rest_framework import serializers
 from django.utils import timezone
 from datetime import datetime, time
-from .models import FoodListing, FoodReservation, FoodRating, FoodCategory, FoodImage
+from .models import DietaryTag, FoodListing, FoodReservation, FoodRating, FoodCategory, FoodImage
 
 
 class FoodImageSerializer(serializers.ModelSerializer):
@@ -119,6 +119,26 @@ class FoodReservationSerializer(serializers.ModelSerializer):
         ]
 
 
+class FoodListingSummarySerializer(serializers.ModelSerializer):
+    """The listing fields shown next to a reservation; needs no related rows."""
+    pickup_window = serializers.CharField(source='pickup_window_display', read_only=True)
+
+    class Meta:
+        model = FoodListing
+        fields = [
+            'id', 'name', 'restaurant_name', 'image_emoji', 'discounted_price',
+            'pickup_date', 'pickup_window', 'location'
+        ]
+
+
+class FoodReservationListSerializer(FoodReservationSerializer):
+    """
+    Reservation list rows with a summary of the listing. Lists use
+    FoodReservationSerializer instead when called with ?expand=food_listing.
+    """
+    food_listing = FoodListingSummarySerializer(read_only=True)
+
+
 class CreateReservationSerializer(serializers.Serializer):
     """Serializer for creating a reservation."""
     food_listing_id = serializers.IntegerField()
@@ -212,6 +232,14 @@ class FoodCategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'emoji', 'is_active']
 
 
+class DietaryTagSerializer(serializers.ModelSerializer):
+    """Serializer for dietary tags used by the feed filters."""
+
+    class Meta:
+        model = DietaryTag
+        fields = ['id', 'name', 'slug']
+
+
 class FoodStatsSerializer(serializers.Serializer):
     """Serializer for food statistics."""
     total_listings = serializers.IntegerField()
@@ -0,0 +1,38 @@
+"""
+Food reservation services for KindBite application.
+Side-effect helpers executed off the request path by the outbox dispatcher.
+"""
+from apps.notifications.services.email import queue_email
+from .models import FoodReservation
+
+
+STATUS_EMAIL_SUBJECTS = {
+    FoodReservation.Status.CONFIRMED: 'Your KindBite reservation is confirmed',
+    FoodReservation.Status.CANCELLED: 'Your KindBite reservation was cancelled',
+    FoodReservation.Status.PICKED_UP: 'Thanks for rescuing food with KindBite',
+}
+
+
+def send_reservation_status_email(reservation, old_status, new_status):
+    """Queue an email to the seeker about a status change on their reservation."""
+    seeker = reservation.seeker
+    listing = reservation.food_listing
+    subject = STATUS_EMAIL_SUBJECTS.get(new_status, 'Your KindBite reservation was updated')
+    message = (
+        f"Hi {seeker.first_name or seeker.get_full_name()},\n\n"
+        f"Your reservation for {reservation.quantity_reserved} x {listing.name} "
+        f"from {listing.restaurant_name} changed from {old_status} to {new_status}.\n\n"
+        f"Pickup: {listing.pickup_date} {listing.pickup_window_display}\n"
+        f"Location: {listing.location}\n"
+    )
+    if reservation.provider_notes:
+        message += f"\nNotes from the provider: {reservation.provider_notes}\n"
+
+    queue_email(
+        to_email=seeker.email,
+        to_name=seeker.get_full_name(),
+        subject=subject,
+        body=message,
+        email_type='reservation_status',
+        user=seeker,
+    )
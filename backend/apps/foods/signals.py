@@ -0,0 +1,45 @@
+"""
+Signal handlers for foods.
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.users.models import UserProfile
+from . import dietary, recommendations
+from .models import FoodListing, FoodReservation
+
+
+@receiver(post_save, sender=FoodListing)
+def sync_dietary_tags(sender, instance, created, update_fields=None, **kwargs):
+    """Mirror dietary_info into the indexed tag table when it changes."""
+    if update_fields is not None and 'dietary_info' not in update_fields:
+        return
+    if created or instance.dietary_info != getattr(instance, '_loaded_dietary_info', None):
+        dietary.sync_listing_tags([instance])
+        instance._loaded_dietary_info = instance.dietary_info
+
+
+@receiver(post_save, sender=FoodListing)
+def refresh_recommendation_listings(sender, instance, created, update_fields=None, **kwargs):
+    """New listings, and saves that change a field recommendations use, start a new version."""
+    if update_fields is not None and not {
+        FoodListing._meta.get_field(name).attname for name in update_fields
+    } & set(FoodListing.RECOMMENDATION_FIELDS):
+        return
+    state = instance.recommendation_state()
+    if created or state != getattr(instance, '_recommendation_state', None):
+        recommendations.invalidate_listings()
+        instance._recommendation_state = state
+
+
+@receiver(post_save, sender=FoodReservation)
+def refresh_seeker_affinity(sender, instance, created, **kwargs):
+    """A new reservation changes the seeker's provider affinity and reserved listings."""
+    if created:
+        recommendations.invalidate_affinity(instance.seeker_id)
+
+
+@receiver(post_save, sender=UserProfile)
+def refresh_dietary_affinity(sender, instance, **kwargs):
+    """Dietary preferences live on the profile."""
+    recommendations.invalidate_affinity(instance.user_id)
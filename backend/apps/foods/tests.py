@@ -0,0 +1,108 @@
+"""
+Tests for the foods app.
+"""
+from datetime import time as clock_time
+from decimal import Decimal
+
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from apps.users.models import User
+from .models import FoodImage, FoodListing, FoodReservation
+
+
+LOCATION = 'Kampala'
+
+
+def make_user(name, role):
+    return User.objects.create(
+        email=f'{name}@example.com',
+        first_name=name.title(),
+        last_name='Tester',
+        phone='+256700000000',
+        location=LOCATION,
+        user_role=role,
+    )
+
+
+def make_listing(provider, name='Matoke', quantity=5):
+    listing = FoodListing.objects.create(
+        provider=provider,
+        restaurant_name='Test Kitchen',
+        name=name,
+        description='Test listing',
+        original_price=Decimal('10000'),
+        discounted_price=Decimal('5000'),
+        quantity=quantity,
+        pickup_window_start=clock_time(17),
+        pickup_window_end=clock_time(19),
+        pickup_date=timezone.localdate(),
+        location=LOCATION,
+    )
+    FoodImage.objects.create(food_listing=listing, image_url=f'https://images.example.com/{listing.id}.jpg')
+    return listing
+
+
+class ReservationQueryCountTests(APITestCase):
+    """The reservation endpoints issue a fixed number of queries, however many rows they touch."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = make_user('admin', User.UserRole.ADMIN)
+        cls.provider = make_user('provider', User.UserRole.RESTAURANT)
+        cls.seeker = make_user('seeker', User.UserRole.END_USER)
+        for i in range(3):
+            FoodReservation.objects.create(
+                food_listing=make_listing(cls.provider, name=f'Meal {i}'),
+                seeker=cls.seeker,
+                quantity_reserved=1,
+            )
+
+    def list_reservations(self, user, expected_queries, **params):
+        self.client.force_authenticate(user)
+        with self.assertNumQueries(expected_queries):
+            response = self.client.get('/api/foods/reservations/my/', params)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_list(self):
+        # Page count + page rows with listing and seeker joined
+        for user in (self.admin, self.provider, self.seeker):
+            with self.subTest(user.user_role):
+                self.list_reservations(user, 2)
+
+    def test_list_expanded_listing(self):
+        # ... plus one prefetch for the listing images
+        for user in (self.admin, self.provider, self.seeker):
+            with self.subTest(user.user_role):
+                response = self.list_reservations(user, 3, expand='food_listing')
+                rows = response.json()['results']
+                self.assertEqual(len(rows), 3)
+                self.assertEqual(len(rows[0]['food_listing']['images']), 1)
+
+    def test_create(self):
+        listing = make_listing(self.provider, name='Fresh meal')
+        self.client.force_authenticate(self.seeker)
+        # Listing and duplicate checks, savepoint, reservation insert, listing update,
+        # two outbox events, release, then the response's provider and images
+        with self.assertNumQueries(10):
+            response = self.client.post(
+                '/api/foods/reservations/',
+                {'food_listing_id': listing.id, 'quantity_reserved': 2},
+                format='json',
+            )
+        self.assertEqual(response.status_code, 201, response.content)
+
+    def test_status_update(self):
+        reservation = FoodReservation.objects.filter(seeker=self.seeker).first()
+        self.client.force_authenticate(self.provider)
+        # Reservation, listing and provider for the permission check, savepoint, locked
+        # status read, update, two outbox events, release, then images and seeker for the response
+        with self.assertNumQueries(11):
+            response = self.client.patch(
+                f'/api/foods/reservations/{reservation.id}/status/',
+                {'status': FoodReservation.Status.CONFIRMED},
+                format='json',
+            )
+        self.assertEqual(response.status_code, 200, response.content)
+
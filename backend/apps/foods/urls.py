@@ -18,6 +18,7 @@ urlpatterns = [
     path('reservations/my/', views.UserReservationsView.as_view(), name='my-reservations'),
     path('reservations/<int:reservation_id>/status/', views.update_reservation_status, name='update-reservation-status'),
     path('stats/', views.food_stats, name='food-stats'),
+    path('dietary-tags/', views.dietary_tags, name='dietary-tags'),
     path('images/<int:food_listing_id>/upload/', views.upload_food_image, name='upload-food-image'),
     path('images/<int:image_id>/delete/', views.delete_food_image, name='delete-food-image'),
 ]
\ No newline at end of file
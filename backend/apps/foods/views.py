@@ -8,20 +8,33 @@ from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.generics import ListAPIView, CreateAPIView
+from rest_framework.parsers import MultiPartParser
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.db import transaction
 from django.db.models import Q, Sum, Avg, Count
 from datetime import timedelta
+import csv
+import logging
 
-from .models import FoodListing, FoodReservation, FoodRating, FoodCategory, FoodImage
+from apps.common import outbox
+from apps.common.idempotency import idempotent
+from apps.leaderboards.handlers import RESERVATION_STATUS_EVENT as LEADERBOARD_RESERVATION_EVENT
+from apps.notifications.handlers import enqueue_fan_out
+from apps.notifications.models import Notification
+from apps.users import impact
+from apps.users.models import User
+from . import bulk_import, dietary, listing_rows, recommendations
+from .models import DietaryTag, FoodListing, FoodReservation, FoodRating, FoodCategory, FoodImage
 from .serializers import (
     FoodListingListSerializer, FoodListingDetailSerializer, 
-    FoodListingCreateUpdateSerializer, FoodReservationSerializer,
+    FoodListingCreateUpdateSerializer, FoodReservationSerializer, FoodReservationListSerializer,
     CreateReservationSerializer, FoodRatingSerializer, CreateRatingSerializer,
-    FoodCategorySerializer, FoodStatsSerializer, FoodImageSerializer
+    FoodCategorySerializer, FoodStatsSerializer, FoodImageSerializer, DietaryTagSerializer
 )
 
+logger = logging.getLogger(__name__)
+
 
 class FoodListingViewSet(ModelViewSet):
     """
@@ -37,11 +50,11 @@ class FoodListingViewSet(ModelViewSet):
         
         # Admin can see all listings (including inactive ones)
         if user.user_role == 'admin':
-            return FoodListing.objects.all().select_related('provider').prefetch_related('images')
+            queryset = FoodListing.objects.all().select_related('provider').prefetch_related('images')
         
         # Food seekers see only available listings from others
         elif user.user_role == 'end-user':
-            return FoodListing.objects.filter(
+            queryset = FoodListing.objects.filter(
                 status='available',
                 is_active=True,
                 pickup_date__gte=timezone.now().date()
@@ -49,11 +62,17 @@ class FoodListingViewSet(ModelViewSet):
         
         # Food providers see their own listings (only active ones)
         else:
-            return FoodListing.objects.filter(
+            queryset = FoodListing.objects.filter(
                 provider=user,
                 is_active=True
             ).select_related('provider').prefetch_related('images')
 
+        # Dietary filter, e.g. ?dietary=halal,vegan (listings must carry every tag)
+        dietary_param = self.request.query_params.get('dietary')
+        if self.action == 'list' and dietary_param:
+            queryset = dietary.filter_by_tags(queryset, dietary_param)
+        return queryset
+
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
         if self.action == 'list':
@@ -69,9 +88,34 @@ class FoodListingViewSet(ModelViewSet):
         context['request'] = self.request
         return context
 
+    def list(self, request, *args, **kwargs):
+        """Listing feed, serialized from `.values()` rows (see apps.foods.listing_rows)."""
+        queryset = listing_rows.values(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(listing_rows.build(page))
+        return Response(listing_rows.build(queryset))
+
     def perform_create(self, serializer):
-        """Set the provider to current user when creating."""
-        serializer.save(provider=self.request.user)
+        """Set the provider to current user and announce the listing to nearby seekers."""
+        provider = self.request.user
+        with transaction.atomic():
+            listing = serializer.save(provider=provider)
+            # Without a location the audience filter would match every seeker
+            if not provider.location.strip():
+                logger.warning('Provider %s has no location; listing %s not announced', provider.id, listing.id)
+                return
+            enqueue_fan_out(
+                Notification.NotificationType.NEW_FOOD_AVAILABLE,
+                title='New food available',
+                message=f"{listing.name} from {listing.restaurant_name} is available for pickup.",
+                context={'listing': listing.name, 'provider': listing.restaurant_name},
+                data={'food_listing_id': listing.id},
+                food_listing_id=listing.id,
+                roles=[User.UserRole.END_USER],
+                location=provider.location,
+                exclude_user_ids=[provider.id],
+            )
 
     def perform_update(self, serializer):
         """Ensure users can only update their own listings."""
@@ -101,6 +145,10 @@ class FoodListingViewSet(ModelViewSet):
         if provider_type:
             queryset = queryset.filter(provider_type=provider_type)
         
+        dietary_param = request.query_params.get('dietary')
+        if dietary_param:
+            queryset = dietary.filter_by_tags(queryset, dietary_param)
+        
         # Free food filter
         is_free = request.query_params.get('is_free')
         if is_free and is_free.lower() == 'true':
@@ -114,8 +162,107 @@ class FoodListingViewSet(ModelViewSet):
                 Q(description__icontains=search)
             )
         
-        serializer = FoodListingListSerializer(queryset, many=True)
-        return Response(serializer.data)
+        return Response(listing_rows.serialize(queryset))
+
+    @action(detail=False, methods=['get'])
+    def recommended(self, request):
+        """
+        Available listings ranked for the current user by dietary match,
+        reservation history, distance and discount.
+        Optional `lat` and `lng` rank by distance from that point; `limit` caps the results.
+        """
+        try:
+            origin = None
+            if request.query_params.get('lat') or request.query_params.get('lng'):
+                origin = (float(request.query_params['lat']), float(request.query_params['lng']))
+            limit = int(request.query_params.get('limit', 20))
+        except (KeyError, ValueError):
+            return Response(
+                {'error': 'lat and lng must be given together as numbers, and limit as an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        top = recommendations.recommend(request.user, origin=origin)[:max(1, limit)]
+        scores = {listing_id: score for score, listing_id in top}
+        listings = FoodListing.objects.filter(
+            id__in=scores,
+            status='available',
+            is_active=True,
+        )
+        data = sorted(listing_rows.serialize(listings), key=lambda item: scores[item['id']], reverse=True)
+        for item in data:
+            item['recommendation_score'] = round(scores[item['id']], 3)
+        return Response(data)
+
+    @action(detail=False, methods=['post'])
+    @idempotent
+    def bulk(self, request):
+        """
+        Create many listings from a JSON list (or {"listings": [...]}).
+        Valid rows are created; invalid rows come back as per-row errors.
+        """
+        rows = request.data.get('listings') if isinstance(request.data, dict) else request.data
+        if not isinstance(rows, list):
+            return Response(
+                {'error': 'Send a list of listings, or an object with a "listings" list'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return self._import_listings(request, rows)
+
+    @action(detail=False, methods=['post'], url_path='import', parser_classes=[MultiPartParser])
+    @idempotent
+    def import_file(self, request):
+        """
+        Create listings from an uploaded `file`: CSV with a header row
+        (dietary_info separated by ';') or JSONL, one listing per line.
+        """
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'error': 'Upload a CSV or JSONL file as "file"'}, status=status.HTTP_400_BAD_REQUEST)
+        if upload.name.lower().endswith(('.jsonl', '.ndjson')):
+            rows = bulk_import.read_jsonl(upload)
+        else:
+            rows = bulk_import.read_csv(upload)
+        return self._import_listings(request, rows)
+
+    def _import_listings(self, request, rows):
+        provider = request.user
+        if not provider.is_provider:
+            return Response(
+                {'error': 'Only food providers can import listings'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        try:
+            with transaction.atomic():
+                importer = bulk_import.ListingImporter(provider).run(rows)
+                if importer.created and not provider.location.strip():
+                    logger.warning(
+                        'Provider %s has no location; %d imported listings not announced',
+                        provider.id, len(importer.created),
+                    )
+                elif importer.created:
+                    provider_name = provider.business_name or provider.get_full_name()
+                    enqueue_fan_out(
+                        Notification.NotificationType.NEW_FOOD_AVAILABLE,
+                        title='New food available',
+                        message=f"{len(importer.created)} items from {provider_name} are available for pickup.",
+                        context={'count': len(importer.created), 'provider': provider_name},
+                        data={'food_listing_ids': importer.created[:100]},
+                        roles=[User.UserRole.END_USER],
+                        location=provider.location,
+                        exclude_user_ids=[provider.id],
+                    )
+        except (bulk_import.ImportLimitExceeded, UnicodeDecodeError, csv.Error) as e:
+            return Response({'error': f'Could not import listings: {e}'}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {
+                'created': len(importer.created),
+                'ids': importer.created,
+                'errors': importer.errors,
+            },
+            status=status.HTTP_201_CREATED if importer.created else status.HTTP_400_BAD_REQUEST
+        )
 
 
 @method_decorator(csrf_exempt, name='dispatch')
@@ -123,6 +270,7 @@ class CreateReservationView(APIView):
     """Create a food reservation."""
     permission_classes = [permissions.IsAuthenticated]
 
+    @idempotent
     def post(self, request):
         serializer = CreateReservationSerializer(data=request.data, context={'request': request})
         if not serializer.is_valid():
@@ -150,9 +298,9 @@ class CreateReservationView(APIView):
                 
                 food_listing.save()
 
-                # Update user's KindCoins
-                request.user.kind_coins += reservation.kindcoins_earned
-                request.user.save()
+                # KindCoins award and provider notification run off the request path
+                outbox.enqueue('kindcoins.reservation_reward', {'reservation_id': reservation.id})
+                outbox.enqueue('reservation.created', {'reservation_id': reservation.id})
 
                 return Response(
                     FoodReservationSerializer(reservation).data,
@@ -167,25 +315,38 @@ class CreateReservationView(APIView):
 
 
 class UserReservationsView(ListAPIView):
-    """Get user's food reservations."""
-    serializer_class = FoodReservationSerializer
+    """
+    Get user's food reservations.
+    Each row carries a summary of its listing; pass ?expand=food_listing for
+    the full listing (provider names and images included).
+    """
     permission_classes = [permissions.IsAuthenticated]
 
+    def expand_listing(self):
+        return 'food_listing' in self.request.query_params.get('expand', '').split(',')
+
+    def get_serializer_class(self):
+        return FoodReservationSerializer if self.expand_listing() else FoodReservationListSerializer
+
     def get_queryset(self):
         """Get reservations based on user role."""
         user = self.request.user
         
         if user.user_role == 'admin':
             # Admin sees all reservations
-            return FoodReservation.objects.all().select_related('food_listing', 'seeker')
+            queryset = FoodReservation.objects.all()
         elif user.user_role == 'end-user':
             # Food seekers see their own reservations
-            return FoodReservation.objects.filter(seeker=user).select_related('food_listing')
+            queryset = FoodReservation.objects.filter(seeker=user)
         else:
             # Food providers see reservations for their listings
-            return FoodReservation.objects.filter(
-                food_listing__provider=user
-            ).select_related('food_listing', 'seeker')
+            queryset = FoodReservation.objects.filter(food_listing__provider=user)
+
+        # seeker_* and total_saved read the seeker and listing of every row
+        queryset = queryset.select_related('food_listing', 'seeker')
+        if self.expand_listing():
+            queryset = queryset.select_related('food_listing__provider').prefetch_related('food_listing__images')
+        return queryset
 
 
 @api_view(['PATCH'])
@@ -223,7 +384,6 @@ def update_reservation_status(request, reservation_id):
         )
     
     # Update reservation
-    old_status = reservation.status
     reservation.status = new_status
     
     # Set timestamps based on status
@@ -232,20 +392,39 @@ def update_reservation_status(request, reservation_id):
     elif new_status in ['completed', 'picked_up'] and not reservation.picked_up_at:
         reservation.picked_up_at = timezone.now()
     
-    reservation.save()
-    
-    # Send email notification to customer
-    try:
-        from .services import send_reservation_status_email
-        send_reservation_status_email(reservation, old_status, new_status)
-    except Exception as e:
-        print(f"Error sending status update email: {e}")
+    with transaction.atomic():
+        # Re-read the status under a row lock so concurrent updates cannot
+        # count the same pickup twice
+        old_status = FoodReservation.objects.select_for_update().values_list(
+            'status', flat=True
+        ).get(id=reservation.id)
+        reservation.save()
+
+        # Email and in-app notification are dispatched by the outbox worker
+        if old_status != new_status:
+            impact.apply_status_change(reservation, old_status, new_status)
+            event = {
+                'reservation_id': reservation.id,
+                'old_status': old_status,
+                'new_status': new_status,
+            }
+            outbox.enqueue('reservation.status_email', event)
+            outbox.enqueue('reservation.status_notification', event)
+            if FoodReservation.Status.PICKED_UP in (old_status, new_status):
+                outbox.enqueue(LEADERBOARD_RESERVATION_EVENT, event)
     
     # Serialize and return updated reservation
     serializer = FoodReservationSerializer(reservation)
     return Response(serializer.data)
 
 
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def dietary_tags(request):
+    """List dietary tags; pass a tag's slug (or name) as `dietary` to filter the feeds."""
+    return Response(DietaryTagSerializer(DietaryTag.objects.all(), many=True).data)
+
+
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def food_stats(request):
@@ -0,0 +1,4 @@
+"""
+Leaderboards app for KindBite.
+Ranks users and providers by KindCoins, meals saved and CO2 saved.
+"""
@@ -0,0 +1,16 @@
+"""
+Django app configuration for Leaderboards.
+"""
+from django.apps import AppConfig
+
+
+class LeaderboardsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.leaderboards'
+    verbose_name = 'Leaderboards'
+
+    def ready(self):
+        """
+        Import signal and outbox handlers when the app is ready.
+        """
+        from . import handlers, signals  # noqa: F401
@@ -0,0 +1,19 @@
+"""
+Outbox handlers for leaderboard events.
+Registered when the leaderboards app is ready; executed by `manage.py dispatch_outbox`.
+"""
+from apps.common import outbox
+from apps.foods.models import FoodReservation
+from . import services
+
+
+RESERVATION_STATUS_EVENT = 'leaderboards.reservation_status'
+
+
+@outbox.register(RESERVATION_STATUS_EVENT)
+def handle_reservation_status(payload):
+    """Move the seeker's and provider's meals and CO2 scores for a pickup or its reversal."""
+    reservation = FoodReservation.all_objects.select_related('food_listing').get(
+        id=payload['reservation_id']
+    )
+    services.record_reservation_status(reservation, payload['old_status'], payload['new_status'])
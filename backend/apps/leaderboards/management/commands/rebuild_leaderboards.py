@@ -0,0 +1,114 @@
+"""
+Management command to recompute leaderboard entries from their sources.
+All-time KindCoins come from user balances, weekly and monthly KindCoins from
+the ledger, and meals and CO2 from picked-up reservations (credited to both
+seeker and provider). Each board and period is rebuilt in its own transaction.
+"""
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Sum
+
+from apps.foods.models import FoodReservation
+from apps.leaderboards import services
+from apps.leaderboards.models import LeaderboardEntry
+from apps.payments.models import KindCoinsTransaction
+from apps.users.impact import COUNTED_STATUS
+from apps.users.models import User
+
+Board = LeaderboardEntry.Board
+
+
+def _add(scores, rows, fields, score_field):
+    user_field, role_field, location_field = fields
+    for row in rows:
+        key = (row[user_field], row[role_field], row[location_field])
+        scores[key] += float(row[score_field] or 0)
+
+
+def kindcoin_scores(period):
+    scores = defaultdict(float)
+    if period == services.ALL_TIME:
+        rows = User.objects.filter(kind_coins__gt=0).values('id', 'user_role', 'location', 'kind_coins')
+        _add(scores, rows, ('id', 'user_role', 'location'), 'kind_coins')
+        return scores
+
+    start, end = services.period_range(period)
+    rows = (
+        KindCoinsTransaction.objects.filter(
+            transaction_type__in=services.EARNING_TYPES,
+            created_at__gte=start,
+            created_at__lt=end,
+        )
+        .values('user_id', 'user__user_role', 'user__location')
+        .annotate(total=Sum('amount'))
+        .order_by()
+    )
+    _add(scores, rows, ('user_id', 'user__user_role', 'user__location'), 'total')
+    return scores
+
+
+def impact_scores(period):
+    """({user: meals}, {user: co2}) for seekers and providers of picked-up reservations."""
+    reservations = FoodReservation.objects.filter(status=COUNTED_STATUS)
+    if period != services.ALL_TIME:
+        start, end = services.period_range(period)
+        reservations = reservations.filter(picked_up_at__gte=start, picked_up_at__lt=end)
+
+    meals, co2 = defaultdict(float), defaultdict(float)
+    for side in ('seeker', 'food_listing__provider'):
+        fields = (f'{side}_id', f'{side}__user_role', f'{side}__location')
+        rows = list(
+            reservations.values(*fields)
+            .annotate(meals=Sum('quantity_reserved'), co2=Sum('food_listing__co2_saved'))
+            .order_by()
+        )
+        _add(meals, rows, fields, 'meals')
+        _add(co2, rows, fields, 'co2')
+    return meals, co2
+
+
+class Command(BaseCommand):
+    help = 'Recompute leaderboard entries for all-time and the current week and month'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--period',
+            action='append',
+            choices=services.PERIODS,
+            help='Period to rebuild; repeat for several (default: all, week and month)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Entries inserted per query (default: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        periods = options['period'] or services.PERIODS
+
+        self.stdout.write('🏆 Rebuilding leaderboards...')
+        for period in periods:
+            key = services.period_key(period)
+            meals, co2 = impact_scores(period)
+            boards = {
+                Board.KIND_COINS: kindcoin_scores(period),
+                Board.MEALS_SAVED: meals,
+                Board.CO2_SAVED: co2,
+            }
+            for board, scores in boards.items():
+                entries = [
+                    LeaderboardEntry(
+                        board=board, period=key, user_id=user_id,
+                        user_role=role, location=location, score=score,
+                    )
+                    for (user_id, role, location), score in scores.items()
+                ]
+                with transaction.atomic():
+                    LeaderboardEntry.objects.filter(board=board, period=key).delete()
+                    LeaderboardEntry.objects.bulk_create(entries, batch_size=options['batch_size'])
+                self.stdout.write(f'   {board} {key}: {len(entries)} entries')
+
+        self.stdout.write(self.style.SUCCESS('✅ Leaderboards rebuilt'))
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:46
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('board', models.CharField(choices=[('kind_coins', 'KindCoins'), ('meals_saved', 'Meals Saved'), ('co2_saved', 'CO2 Saved')], max_length=20)),
+                ('period', models.CharField(max_length=20)),
+                ('user_role', models.CharField(max_length=20)),
+                ('location', models.CharField(max_length=100)),
+                ('score', models.FloatField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='leaderboard_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Leaderboard Entry',
+                'verbose_name_plural': 'Leaderboard Entries',
+                'db_table': 'leaderboard_entries',
+                'indexes': [models.Index(fields=['board', 'period', '-score', 'user'], name='leaderboard_global_idx'), models.Index(fields=['board', 'period', 'user_role', '-score', 'user'], name='leaderboard_role_idx'), models.Index(fields=['board', 'period', 'location', '-score', 'user'], name='leaderboard_location_idx')],
+                'unique_together': {('board', 'period', 'user')},
+            },
+        ),
+    ]
@@ -0,0 +1,43 @@
+"""
+Leaderboard models for KindBite application.
+"""
+from django.db import models
+
+from apps.common.models import TimeStampedModel
+from apps.users.models import User
+
+
+class LeaderboardEntry(TimeStampedModel):
+    """
+    One user's score on one board for one period.
+
+    Scores are adjusted incrementally from the KindCoins ledger and reservation
+    pickups. user_role and location are copied from the user so role and
+    location boards are index range reads that never touch the users table.
+    period is 'all', 'week:<monday>' or 'month:<yyyy-mm>'.
+    """
+    class Board(models.TextChoices):
+        KIND_COINS = 'kind_coins', 'KindCoins'
+        MEALS_SAVED = 'meals_saved', 'Meals Saved'
+        CO2_SAVED = 'co2_saved', 'CO2 Saved'
+
+    board = models.CharField(max_length=20, choices=Board.choices)
+    period = models.CharField(max_length=20)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='leaderboard_entries')
+    user_role = models.CharField(max_length=20)
+    location = models.CharField(max_length=100)
+    score = models.FloatField(default=0)
+
+    class Meta:
+        db_table = 'leaderboard_entries'
+        verbose_name = 'Leaderboard Entry'
+        verbose_name_plural = 'Leaderboard Entries'
+        unique_together = ['board', 'period', 'user']
+        indexes = [
+            models.Index(fields=['board', 'period', '-score', 'user'], name='leaderboard_global_idx'),
+            models.Index(fields=['board', 'period', 'user_role', '-score', 'user'], name='leaderboard_role_idx'),
+            models.Index(fields=['board', 'period', 'location', '-score', 'user'], name='leaderboard_location_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.board} {self.period}: user {self.user_id} = {self.score}"
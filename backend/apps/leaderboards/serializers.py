@@ -0,0 +1,32 @@
+"""
+Leaderboard serializers for KindBite application.
+"""
+from rest_framework import serializers
+
+from .models import LeaderboardEntry
+
+
+class LeaderboardEntrySerializer(serializers.ModelSerializer):
+    """
+    Serializer for a ranked leaderboard entry.
+    Businesses are shown by business name; no contact details are exposed.
+    """
+    rank = serializers.IntegerField(read_only=True)
+    name = serializers.SerializerMethodField()
+    profile_image = serializers.CharField(source='user.profile_image', read_only=True)
+    score = serializers.SerializerMethodField()
+
+    class Meta:
+        model = LeaderboardEntry
+        fields = ['rank', 'user_id', 'name', 'profile_image', 'user_role', 'location', 'score']
+
+    def get_name(self, obj):
+        user = obj.user
+        if user.is_business_user and user.business_name:
+            return user.business_name
+        return user.get_full_name()
+
+    def get_score(self, obj):
+        if obj.board == LeaderboardEntry.Board.CO2_SAVED:
+            return round(obj.score, 2)
+        return int(obj.score)
@@ -0,0 +1,180 @@
+"""
+Leaderboard scores and rankings.
+
+Each (board, period, user) has one LeaderboardEntry row whose score is moved
+with F() expressions as events arrive: KindCoins ledger rows (signal) and
+reservation pickups (outbox). Boards are read straight off the
+(board, period[, role | location], -score) indexes: the top N is the first N
+index entries, and a user's rank is one plus the number of higher scores,
+counted on the same index without touching the entries themselves.
+`manage.py rebuild_leaderboards` recomputes the current periods from scratch;
+entries of past weeks and months are deleted by `manage.py apply_retention`.
+"""
+from datetime import datetime, time, timedelta
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.payments.models import KindCoinsTransaction
+from apps.users.impact import COUNTED_STATUS, impact_of
+from apps.users.models import User
+from .models import LeaderboardEntry
+
+Board = LeaderboardEntry.Board
+
+ALL_TIME = 'all'
+PERIODS = (ALL_TIME, 'week', 'month')
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 100
+
+# Ledger entries that count towards weekly and monthly KindCoins boards;
+# spending coins does not lower a user's rank for the period
+EARNING_TYPES = {
+    KindCoinsTransaction.TransactionType.EARNED,
+    KindCoinsTransaction.TransactionType.BONUS,
+    KindCoinsTransaction.TransactionType.PENALTY,
+}
+
+
+def period_key(period, moment=None):
+    """Storage key of the period containing `moment` (default: now)."""
+    if period == ALL_TIME:
+        return ALL_TIME
+    day = timezone.localdate(moment or timezone.now())
+    if period == 'week':
+        return f'week:{(day - timedelta(days=day.weekday())).isoformat()}'
+    if period == 'month':
+        return f'month:{day:%Y-%m}'
+    raise ValueError(f'Unknown period: {period}')
+
+
+def expired_periods(moment=None):
+    """Q matching weekly and monthly entries of periods that ended before `moment`."""
+    return (
+        Q(period__startswith='week:', period__lt=period_key('week', moment))
+        | Q(period__startswith='month:', period__lt=period_key('month', moment))
+    )
+
+
+def period_range(period, moment=None):
+    """(start, end) datetimes of the week or month containing `moment`."""
+    day = timezone.localdate(moment or timezone.now())
+    if period == 'week':
+        start = day - timedelta(days=day.weekday())
+        end = start + timedelta(days=7)
+    elif period == 'month':
+        start = day.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1)
+    else:
+        raise ValueError(f'Unknown period: {period}')
+    tz = timezone.get_current_timezone()
+    return (
+        timezone.make_aware(datetime.combine(start, time.min), tz),
+        timezone.make_aware(datetime.combine(end, time.min), tz),
+    )
+
+
+def _ensure_entries(user_ids, board, periods):
+    """Create zero-score entries that do not exist yet, copying role and location."""
+    users = User.all_objects.filter(id__in=user_ids).values_list('id', 'user_role', 'location')
+    LeaderboardEntry.objects.bulk_create(
+        [
+            LeaderboardEntry(board=board, period=period, user_id=user_id, user_role=role, location=location)
+            for user_id, role, location in users
+            for period in periods
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def add_score(user_ids, board, amount, moment=None, periods=PERIODS):
+    """Add `amount` (may be negative) to the users' scores for the periods containing `moment`."""
+    keys = [period_key(period, moment) for period in periods]
+    _ensure_entries(user_ids, board, keys)
+    LeaderboardEntry.objects.filter(board=board, period__in=keys, user_id__in=user_ids).update(
+        score=F('score') + amount,
+        updated_at=timezone.now(),
+    )
+
+
+def set_score(user_id, board, score, period=ALL_TIME):
+    """Overwrite one user's score for a period."""
+    _ensure_entries([user_id], board, [period])
+    LeaderboardEntry.objects.filter(board=board, period=period, user_id=user_id).update(
+        score=score,
+        updated_at=timezone.now(),
+    )
+
+
+def record_coins(ledger_entry):
+    """
+    Apply a KindCoins ledger row: the all-time board follows the balance,
+    weekly and monthly boards add the coins earned in the period.
+    """
+    set_score(ledger_entry.user_id, Board.KIND_COINS, ledger_entry.balance_after)
+    if ledger_entry.transaction_type in EARNING_TYPES:
+        add_score(
+            [ledger_entry.user_id], Board.KIND_COINS, ledger_entry.amount,
+            moment=ledger_entry.created_at, periods=('week', 'month'),
+        )
+
+
+def record_reservation_status(reservation, old_status, new_status):
+    """
+    Credit a pickup to the seeker and the provider on the meals and CO2
+    boards, or take it back when a picked-up reservation changes status.
+    Periods are those of the pickup time, so a reversal hits the same rows.
+    """
+    if (old_status == COUNTED_STATUS) == (new_status == COUNTED_STATUS):
+        return
+    sign = 1 if new_status == COUNTED_STATUS else -1
+    meals, co2, _water = impact_of(reservation)
+    user_ids = [reservation.seeker_id, reservation.food_listing.provider_id]
+    moment = reservation.picked_up_at or reservation.updated_at
+    add_score(user_ids, Board.MEALS_SAVED, sign * meals, moment)
+    add_score(user_ids, Board.CO2_SAVED, sign * co2, moment)
+
+
+def update_user_scope(user_id, user_role, location):
+    """Copy a user's new role or location onto their entries."""
+    LeaderboardEntry.objects.filter(user_id=user_id).exclude(
+        user_role=user_role, location=location
+    ).update(user_role=user_role, location=location, updated_at=timezone.now())
+
+
+def board_queryset(board, period, role=None, location=None):
+    """Entries of one board partition, in rank order."""
+    queryset = LeaderboardEntry.objects.filter(board=board, period=period)
+    if role:
+        queryset = queryset.filter(user_role=role)
+    if location:
+        queryset = queryset.filter(location=location)
+    return queryset.order_by('-score', 'user_id')
+
+
+def top(board, period, role=None, location=None, limit=DEFAULT_LIMIT):
+    """The first `limit` entries with a positive score; ties share a rank."""
+    limit = max(1, min(limit, MAX_LIMIT))
+    entries = list(
+        board_queryset(board, period, role, location)
+        .filter(score__gt=0)
+        .select_related('user')[:limit]
+    )
+    rank = 0
+    previous = None
+    for position, entry in enumerate(entries, start=1):
+        if entry.score != previous:
+            rank = position
+            previous = entry.score
+        entry.rank = rank
+    return entries
+
+
+def rank_of(user_id, board, period, role=None, location=None):
+    """The user's entry annotated with its rank, or None if they have no score yet."""
+    queryset = board_queryset(board, period, role, location)
+    entry = queryset.select_related('user').filter(user_id=user_id).first()
+    if entry is None:
+        return None
+    entry.rank = queryset.filter(score__gt=entry.score).count() + 1
+    return entry
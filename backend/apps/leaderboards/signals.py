@@ -0,0 +1,27 @@
+"""
+Signal handlers for leaderboards.
+"""
+from django.conf import settings
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.payments.models import KindCoinsTransaction
+from . import services
+
+
+SCOPE_FIELDS = {'user_role', 'location'}
+
+
+@receiver(post_save, sender=KindCoinsTransaction)
+def record_kindcoins(sender, instance, created, **kwargs):
+    """Apply each new ledger row to the KindCoins boards in the same transaction."""
+    if created:
+        services.record_coins(instance)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def update_entry_scope(sender, instance, created, update_fields=None, **kwargs):
+    """Keep the role and location copied onto a user's entries current."""
+    if created or (update_fields is not None and not SCOPE_FIELDS & set(update_fields)):
+        return
+    services.update_user_scope(instance.pk, instance.user_role, instance.location)
@@ -0,0 +1,10 @@
+"""
+Leaderboard URL patterns for KindBite application.
+"""
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('', views.leaderboard, name='leaderboard'),
+    path('me/', views.my_ranks, name='leaderboard-me'),
+]
@@ -0,0 +1,68 @@
+"""
+Leaderboard views for KindBite application.
+"""
+from rest_framework import permissions, status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.response import Response
+
+from apps.users.models import User
+from . import services
+from .models import LeaderboardEntry
+from .serializers import LeaderboardEntrySerializer
+
+
+def _board_params(params):
+    """Validate board, period, role and location query parameters; raises ValueError."""
+    board = params.get('board', LeaderboardEntry.Board.KIND_COINS)
+    if board not in LeaderboardEntry.Board.values:
+        raise ValueError(f'board must be one of: {", ".join(LeaderboardEntry.Board.values)}')
+    period = params.get('period', services.ALL_TIME)
+    if period not in services.PERIODS:
+        raise ValueError(f'period must be one of: {", ".join(services.PERIODS)}')
+    role = params.get('role')
+    if role and role not in User.UserRole.values:
+        raise ValueError(f'Unknown role: {role}')
+    return board, period, role, params.get('location')
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def leaderboard(request):
+    """
+    Top users on a board.
+    Query params: board (kind_coins, meals_saved, co2_saved), period (all, week, month),
+    role, location and limit (max 100). Also returns the caller's own rank on the same board.
+    """
+    try:
+        board, period, role, location = _board_params(request.query_params)
+        limit = int(request.query_params.get('limit', services.DEFAULT_LIMIT))
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    key = services.period_key(period)
+    entries = services.top(board, key, role=role, location=location, limit=limit)
+    me = services.rank_of(request.user.id, board, key, role=role, location=location)
+    return Response({
+        'board': board,
+        'period': key,
+        'role': role,
+        'location': location,
+        'results': LeaderboardEntrySerializer(entries, many=True).data,
+        'me': LeaderboardEntrySerializer(me).data if me else None,
+    })
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def my_ranks(request):
+    """The caller's rank and score on every board for the current periods."""
+    ranks = {}
+    for board in LeaderboardEntry.Board.values:
+        ranks[board] = {}
+        for period in services.PERIODS:
+            entry = services.rank_of(request.user.id, board, services.period_key(period))
+            ranks[board][period] = (
+                {'rank': entry.rank, 'score': LeaderboardEntrySerializer(entry).data['score']}
+                if entry else None
+            )
+    return Response(ranks)
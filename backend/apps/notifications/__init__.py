@@ -0,0 +1,4 @@
+"""
+Notifications app for KindBite.
+Handles in-app notifications, preferences, and email delivery.
+"""
@@ -0,0 +1,16 @@
+"""
+Django app configuration for Notifications.
+"""
+from django.apps import AppConfig
+
+
+class NotificationsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.notifications'
+    verbose_name = 'Notifications'
+
+    def ready(self):
+        """
+        Import signal and outbox handlers when the app is ready.
+        """
+        from . import handlers, signals  # noqa: F401
@@ -0,0 +1,79 @@
+"""
+WebSocket consumer for real-time KindBite notifications.
+
+Clients connect to ws/notifications/?token=<access token>, receive new
+notifications as {"type": "notification", "notification": {...}} and send
+{"type": "heartbeat"} periodically to stay marked as online.
+"""
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.utils import timezone
+
+from .heartbeats import heartbeats
+from .models import NotificationChannel
+from .services.push import user_group
+
+# Close code sent when the socket is not authenticated
+UNAUTHORIZED_CLOSE_CODE = 4401
+
+
+def _header(scope, name):
+    for key, value in scope.get('headers', []):
+        if key.decode('latin1').lower() == name:
+            return value.decode('latin1')
+    return ''
+
+
+class NotificationConsumer(AsyncJsonWebsocketConsumer):
+    """
+    Push notifications to an authenticated user's open sockets.
+    """
+
+    async def connect(self):
+        self.user = self.scope.get('user')
+        if self.user is None or not self.user.is_authenticated:
+            await self.close(code=UNAUTHORIZED_CLOSE_CODE)
+            return
+
+        self.group_name = user_group(self.user.id)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self._register_channel()
+        await self.accept()
+
+    async def disconnect(self, code):
+        if not getattr(self, 'group_name', None):
+            return
+        await self.channel_layer.group_discard(self.group_name, self.channel_name)
+        heartbeats.discard(self.channel_name)
+        await self._remove_channel()
+
+    async def receive_json(self, content, **kwargs):
+        message_type = content.get('type') if isinstance(content, dict) else None
+        if message_type == 'heartbeat':
+            if heartbeats.touch(self.channel_name):
+                await database_sync_to_async(heartbeats.flush)()
+            await self.send_json({'type': 'heartbeat_ack'})
+        else:
+            await self.send_json({'type': 'error', 'error': 'Unsupported message type'})
+
+    async def notification_message(self, event):
+        """Handler for the 'notification.message' events sent by push_notifications()."""
+        await self.send_json({'type': 'notification', 'notification': event['notification']})
+
+    @database_sync_to_async
+    def _register_channel(self):
+        client = self.scope.get('client') or [None]
+        NotificationChannel.objects.update_or_create(
+            channel_name=self.channel_name,
+            defaults={
+                'user': self.user,
+                'is_active': True,
+                'last_seen': timezone.now(),
+                'user_agent': _header(self.scope, 'user-agent'),
+                'ip_address': client[0],
+            },
+        )
+
+    @database_sync_to_async
+    def _remove_channel(self):
+        NotificationChannel.objects.filter(channel_name=self.channel_name).delete()
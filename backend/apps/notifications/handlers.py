@@ -0,0 +1,58 @@
+"""
+Outbox handlers for notification events.
+Registered when the notifications app is ready; executed by `manage.py dispatch_outbox`.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from apps.common import outbox
+from .models import Notification
+from .services.digest import DELIVER_EVENT
+from .services.fanout import fan_out
+from .services.push import push_notifications
+
+
+FAN_OUT_EVENT = 'notifications.fan_out'
+
+
+def enqueue_fan_out(notification_type, title, message, **options):
+    """
+    Schedule a broadcast notification.
+    Call it inside the transaction that creates the triggering object.
+    """
+    return outbox.enqueue(FAN_OUT_EVENT, {
+        'notification_type': notification_type,
+        'title': title,
+        'message': message,
+        **options,
+    })
+
+
+@outbox.register(FAN_OUT_EVENT, atomic=False)
+def handle_fan_out(payload, event):
+    """
+    Create the broadcast notifications chunk by chunk.
+    The last recipient id is checkpointed in the event payload, so a retry resumes
+    where the failed attempt stopped instead of notifying anyone twice.
+    """
+    options = dict(payload)
+    after_id = options.pop('after_id', 0)
+
+    def checkpoint(last_user_id):
+        event.payload = {**event.payload, 'after_id': last_user_id}
+        event.save(update_fields=['payload', 'updated_at'])
+
+    fan_out(after_id=after_id, on_chunk=checkpoint, **options)
+
+
+@outbox.register(DELIVER_EVENT)
+def handle_deliver_digest(payload):
+    """Mark a digest as sent once its window has closed and push it unless already read."""
+    digest = Notification.objects.filter(id=payload['notification_id'], is_sent=False).first()
+    if digest is None:
+        return
+    digest.is_sent = True
+    digest.sent_at = timezone.now()
+    digest.save(update_fields=['is_sent', 'sent_at', 'updated_at'])
+    if not digest.is_read:
+        transaction.on_commit(lambda: push_notifications([digest]))
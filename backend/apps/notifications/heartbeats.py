@@ -0,0 +1,54 @@
+"""
+Batched last_seen updates for notification WebSocket channels.
+
+Heartbeats are buffered in memory per process and written with a single
+UPDATE per flush interval instead of one write per heartbeat.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import NotificationChannel
+
+
+class HeartbeatBuffer:
+    """
+    Collect channel names that sent a heartbeat and flush them periodically.
+    """
+
+    def __init__(self, flush_interval=None):
+        self.flush_interval = flush_interval
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def _interval(self):
+        if self.flush_interval is not None:
+            return self.flush_interval
+        return settings.NOTIFICATION_PUSH['HEARTBEAT_FLUSH_INTERVAL']
+
+    def touch(self, channel_name):
+        """Record a heartbeat; returns True when the buffer is due for a flush."""
+        with self._lock:
+            self._pending.add(channel_name)
+            return time.monotonic() - self._last_flush >= self._interval()
+
+    def discard(self, channel_name):
+        with self._lock:
+            self._pending.discard(channel_name)
+
+    def flush(self):
+        """Write last_seen for every buffered channel in one query; returns rows updated."""
+        with self._lock:
+            names, self._pending = self._pending, set()
+            self._last_flush = time.monotonic()
+        if not names:
+            return 0
+        return NotificationChannel.objects.filter(channel_name__in=names).update(
+            last_seen=timezone.now()
+        )
+
+
+heartbeats = HeartbeatBuffer()
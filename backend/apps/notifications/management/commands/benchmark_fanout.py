@@ -0,0 +1,107 @@
+"""
+Management command to benchmark broadcast notification fan-out.
+Creates synthetic users inside a transaction, fans out to them and rolls everything back.
+"""
+import time
+from datetime import time as clock_time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from apps.notifications.models import Notification, NotificationPreference
+from apps.notifications.services.fanout import fan_out
+from apps.users.models import User
+
+
+BENCH_LOCATION = 'fanout-benchmark'
+
+
+class Command(BaseCommand):
+    help = 'Benchmark fan-out of a broadcast notification to many users (changes are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=100000,
+            help='Number of synthetic recipients to create (default: 100000)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Notifications inserted per chunk (default: NOTIFICATION_FANOUT["CHUNK_SIZE"])',
+        )
+        parser.add_argument(
+            '--opted-out-every',
+            type=int,
+            default=10,
+            help='Every Nth user disables in-app notifications (default: 10)',
+        )
+        parser.add_argument(
+            '--quiet-every',
+            type=int,
+            default=20,
+            help='Every Nth user is inside an all-day quiet hours window (default: 20)',
+        )
+
+    def handle(self, *args, **options):
+        total = options['users']
+        with transaction.atomic():
+            self.stdout.write(f'👥 Creating {total} synthetic users...')
+            expected = self._seed(total, options['opted_out_every'], options['quiet_every'])
+
+            self.stdout.write('📣 Fanning out...')
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                created = fan_out(
+                    Notification.NotificationType.SYSTEM_ANNOUNCEMENT,
+                    title='Benchmark announcement',
+                    message='Fan-out benchmark',
+                    location=BENCH_LOCATION,
+                    chunk_size=options['chunk_size'],
+                )
+                elapsed = time.perf_counter() - started
+
+            transaction.set_rollback(True)
+
+        rate = created / elapsed if elapsed else 0
+        self.stdout.write(f'   recipients: {created} (expected {expected})')
+        self.stdout.write(f'   queries:    {len(queries)}')
+        self.stdout.write(f'   elapsed:    {elapsed:.2f}s ({rate:,.0f} notifications/s)')
+        if created != expected:
+            self.stdout.write(self.style.ERROR('✗ Audience size does not match the seeded preferences'))
+        else:
+            self.stdout.write(self.style.SUCCESS('✓ Fan-out benchmark complete (rolled back)'))
+
+    def _seed(self, total, opted_out_every, quiet_every):
+        """Create the users and their preferences; returns the expected audience size."""
+        users = User.objects.bulk_create([
+            User(
+                email=f'fanout-{i}@benchmark.invalid',
+                first_name='Fanout',
+                last_name=str(i),
+                phone='+254700000000',
+                location=BENCH_LOCATION,
+                password='!',
+            )
+            for i in range(total)
+        ], batch_size=2000)
+
+        preferences = []
+        excluded = 0
+        for i, user in enumerate(users):
+            if opted_out_every and i % opted_out_every == 0:
+                preferences.append(NotificationPreference(user=user, in_app_enabled=False))
+                excluded += 1
+            elif quiet_every and i % quiet_every == 1:
+                preferences.append(NotificationPreference(
+                    user=user,
+                    quiet_hours_enabled=True,
+                    quiet_hours_start=clock_time(0, 0),
+                    quiet_hours_end=clock_time(23, 59, 59, 999999),
+                ))
+                excluded += 1
+        NotificationPreference.objects.bulk_create(preferences, batch_size=2000)
+        return total - excluded
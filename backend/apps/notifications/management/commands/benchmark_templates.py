@@ -0,0 +1,64 @@
+"""
+Management command to benchmark notification template rendering.
+Renders personalized pickup reminders with a temporary template (rolled back afterwards).
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.notifications.models import NotificationTemplate
+from apps.notifications.services.templates import get_compiled_template, template_cache
+
+
+class Command(BaseCommand):
+    help = 'Benchmark batch rendering of personalized notification templates'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=100000,
+            help='Number of reminders to render (default: 100000)',
+        )
+
+    def handle(self, *args, **options):
+        count = options['count']
+        contexts = [
+            {
+                'user_name': f'Seeker {i}',
+                'food_name': f'Meal #{i % 250}',
+                'restaurant_name': f'Kitchen {i % 40}',
+                'pickup_time': f'{17 + i % 3}:00',
+                'amount': (i % 50) * 1.5,
+            }
+            for i in range(count)
+        ]
+
+        with transaction.atomic():
+            NotificationTemplate.objects.filter(
+                notification_type=NotificationTemplate.NotificationType.PICKUP_REMINDER
+            ).delete()
+            NotificationTemplate.objects.create(
+                notification_type=NotificationTemplate.NotificationType.PICKUP_REMINDER,
+                title_template='Pickup reminder: {food_name}',
+                message_template=(
+                    'Hi {user_name}, your {food_name} from {restaurant_name} is ready '
+                    'for pickup at {pickup_time}. Amount due: {amount:.2f}.'
+                ),
+                variables_help='user_name, food_name, restaurant_name, pickup_time, amount',
+            )
+            template_cache.clear()
+
+            self.stdout.write(f'📝 Rendering {count} pickup reminders...')
+            started = time.perf_counter()
+            template = get_compiled_template(NotificationTemplate.NotificationType.PICKUP_REMINDER)
+            rendered = template.render_many(contexts)
+            elapsed = time.perf_counter() - started
+
+            transaction.set_rollback(True)
+
+        rate = len(rendered) / elapsed if elapsed else 0
+        self.stdout.write(f'   sample:  {rendered[0][1] if rendered else "-"}')
+        self.stdout.write(f'   elapsed: {elapsed:.2f}s ({rate:,.0f} renders/s)')
+        self.stdout.write(self.style.SUCCESS('✓ Template benchmark complete (rolled back)'))
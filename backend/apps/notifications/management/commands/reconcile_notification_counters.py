@@ -0,0 +1,75 @@
+"""
+Management command to rebuild NotificationCounter rows from the notifications table.
+Fixes drift left by writes that bypassed the counter service (raw updates, restores, bugs).
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.notifications.models import NotificationCounter
+from apps.notifications.services.counters import COUNTER_FIELDS, compute_counters
+from apps.users.models import User
+
+
+def _snapshot(counter):
+    return (counter.total_count, counter.unread_count, counter.by_type, counter.by_priority)
+
+
+class Command(BaseCommand):
+    help = 'Recount notifications per user and repair drifted NotificationCounter rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Users reconciled per transaction (default: 500)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report drifted counters without fixing them',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        dry_run = options['dry_run']
+        checked = drifted = 0
+        last_id = 0
+
+        self.stdout.write('🔢 Reconciling notification counters...')
+        while True:
+            user_ids = list(
+                User.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not user_ids:
+                break
+            last_id = user_ids[-1]
+            checked += len(user_ids)
+
+            with transaction.atomic():
+                existing = {
+                    counter.user_id: counter
+                    for counter in NotificationCounter.objects.select_for_update().filter(user_id__in=user_ids)
+                }
+                expected = compute_counters(user_ids)
+
+                to_update, to_create = [], []
+                for user_id, counter in expected.items():
+                    current = existing.get(user_id)
+                    if current is None:
+                        if counter.total_count:
+                            to_create.append(counter)
+                    elif _snapshot(current) != _snapshot(counter):
+                        counter.updated_at = timezone.now()
+                        to_update.append(counter)
+                drifted += len(to_update) + len(to_create)
+
+                if not dry_run:
+                    NotificationCounter.objects.bulk_create(to_create)
+                    NotificationCounter.objects.bulk_update(to_update, COUNTER_FIELDS)
+
+        verb = 'would be repaired' if dry_run else 'repaired'
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Checked {checked} users; {drifted} counters {verb}'
+        ))
@@ -0,0 +1,49 @@
+"""
+Management command that delivers queued emails in pooled batches.
+Run it as a worker, or with --once from a scheduler.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.notifications.services.email import EmailDispatcher
+
+
+class Command(BaseCommand):
+    help = 'Send queued emails, reusing one mail connection per batch group'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help='Emails claimed per batch')
+        parser.add_argument('--per-connection', type=int, help='Emails sent over each connection')
+        parser.add_argument('--max-connections', type=int, help='Parallel mail connections')
+        parser.add_argument('--interval', type=float, default=2.0, help='Seconds to sleep when the queue is empty')
+        parser.add_argument('--once', action='store_true', help='Drain due emails and exit')
+
+    def handle(self, *args, **options):
+        dispatcher = EmailDispatcher(
+            batch_size=options['batch_size'],
+            messages_per_connection=options['per_connection'],
+            max_connections=options['max_connections'],
+        )
+        total_sent = total_failed = 0
+
+        self.stdout.write('📧 Sending queued emails...')
+        try:
+            while True:
+                started = time.perf_counter()
+                sent, failed = dispatcher.dispatch()
+                total_sent += sent
+                total_failed += failed
+
+                if sent or failed:
+                    elapsed = time.perf_counter() - started
+                    self.stdout.write(f'Sent {sent} emails ({failed} failed) in {elapsed:.2f}s')
+                    continue
+
+                if options['once']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f'Sent {total_sent} emails, {total_failed} failures'))
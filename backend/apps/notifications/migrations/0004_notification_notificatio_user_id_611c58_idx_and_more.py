@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0006_foodlisting_distance'),
+        ('notifications', '0003_remove_notification_notificatio_user_id_a4dd5c_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', '-created_at'], name='notificatio_user_id_611c58_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'notification_type', '-created_at'], name='notificatio_user_id_770179_idx'),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_counters(apps, schema_editor):
+    Notification = apps.get_model('notifications', 'Notification')
+    NotificationCounter = apps.get_model('notifications', 'NotificationCounter')
+    counters = {}
+    rows = (
+        Notification.objects.values('user_id', 'notification_type', 'priority')
+        .annotate(total=Count('id'), unread=Count('id', filter=Q(is_read=False)))
+        .order_by()
+    )
+    for row in rows:
+        counter = counters.setdefault(row['user_id'], NotificationCounter(
+            user_id=row['user_id'], by_type={}, by_priority={}
+        ))
+        counter.total_count += row['total']
+        counter.unread_count += row['unread']
+        for bucket, key in ((counter.by_type, row['notification_type']), (counter.by_priority, row['priority'])):
+            counts = bucket.setdefault(key, {'total': 0, 'unread': 0})
+            counts['total'] += row['total']
+            counts['unread'] += row['unread']
+    NotificationCounter.objects.bulk_create(counters.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0006_notificationchannel_user_and_more'),
+        ('users', '0002_user_users_locatio_bd9f26_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('total_count', models.PositiveIntegerField(default=0)),
+                ('unread_count', models.PositiveIntegerField(default=0)),
+                ('by_type', models.JSONField(blank=True, default=dict)),
+                ('by_priority', models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                'verbose_name': 'Notification Counter',
+                'verbose_name_plural': 'Notification Counters',
+                'db_table': 'notification_counters',
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
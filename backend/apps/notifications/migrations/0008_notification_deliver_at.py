@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0007_notificationcounter'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='deliver_at',
+            field=models.DateTimeField(blank=True, help_text='Deferred push time for digest notifications; empty means push immediately', null=True),
+        ),
+    ]
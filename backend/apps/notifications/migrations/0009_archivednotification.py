@@ -0,0 +1,39 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0008_notification_deliver_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_id', models.BigIntegerField(unique=True)),
+                ('notification_type', models.CharField(max_length=30)),
+                ('title', models.CharField(max_length=200)),
+                ('message', models.TextField()),
+                ('priority', models.CharField(max_length=10)),
+                ('data', models.JSONField(blank=True, default=dict)),
+                ('food_listing_id', models.BigIntegerField(blank=True, null=True)),
+                ('food_reservation_id', models.BigIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Archived Notification',
+                'verbose_name_plural': 'Archived Notifications',
+                'db_table': 'archived_notifications',
+                'indexes': [models.Index(fields=['user', '-created_at'], name='archived_no_user_id_7a2630_idx')],
+            },
+        ),
+    ]
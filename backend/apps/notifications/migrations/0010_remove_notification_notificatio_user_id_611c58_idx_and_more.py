@@ -0,0 +1,32 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0007_remove_foodlisting_food_listin_provide_032b02_idx_and_more'),
+        ('notifications', '0009_archivednotification'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='notificatio_user_id_611c58_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='notificatio_user_id_770179_idx',
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['user', '-created_at'], name='notif_user_created_alive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['user', 'notification_type', '-created_at'], name='notif_user_type_alive_idx'),
+        ),
+    ]
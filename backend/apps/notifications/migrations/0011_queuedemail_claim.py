@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0010_remove_notification_notificatio_user_id_611c58_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='queuedemail',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='queuedemail',
+            name='claimed_by',
+            field=models.CharField(blank=True, help_text='Token of the dispatcher sending it', max_length=32),
+        ),
+    ]
@@ -2,9 +2,13 @@
 Notification models for KindBite application.
 Comprehensive notification system with templates and preferences.
 """
-from django.db import models
+from datetime import timedelta
+
+from django.db import models, transaction
+from django.db.models import Q
+from django.utils import timezone
 from django.contrib.auth import get_user_model
-from apps.common.models import BaseModel
+from apps.common.models import BaseModel, TimeStampedModel
 
 User = get_user_model()
 
@@ -58,6 +62,13 @@ class NotificationTemplate(BaseModel):
     def __str__(self):
         return f"{self.get_notification_type_display()} Template"
 
+    def clean(self):
+        """Reject templates that use variables not listed in variables_help."""
+        from .services.templates import validate_template
+
+        super().clean()
+        validate_template(self.title_template, self.message_template, self.variables_help)
+
 
 class NotificationPreference(BaseModel):
     """
@@ -100,11 +111,41 @@ class NotificationPreference(BaseModel):
     def __str__(self):
         return f"Preferences for {self.user.get_full_name()}"
 
+    def quiet_hours_end_after(self, moment):
+        """
+        If `moment` falls inside the quiet hours, return when they end; otherwise None.
+        Windows whose start is after their end wrap past midnight (e.g. 22:00-07:00).
+        """
+        start, end = self.quiet_hours_start, self.quiet_hours_end
+        if not self.quiet_hours_enabled or start is None or end is None or start == end:
+            return None
+
+        local = timezone.localtime(moment)
+        now = local.time()
+        if start < end:
+            inside = start <= now < end
+        else:
+            inside = now >= start or now < end
+        if not inside:
+            return None
+
+        ends = local.replace(hour=end.hour, minute=end.minute, second=end.second, microsecond=end.microsecond)
+        if ends <= local:
+            ends += timedelta(days=1)
+        return ends
+
 
 class NotificationChannel(BaseModel):
     """
     Notification delivery channels (websocket, push, etc.).
     """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='notification_channels',
+        blank=True,
+        null=True
+    )
     channel_name = models.CharField(max_length=255, unique=True)
     is_active = models.BooleanField(default=True)
     last_seen = models.DateTimeField(blank=True, null=True)
@@ -115,6 +156,9 @@ class NotificationChannel(BaseModel):
         db_table = 'notification_channels'
         verbose_name = 'Notification Channel'
         verbose_name_plural = 'Notification Channels'
+        indexes = [
+            models.Index(fields=['user', 'is_active']),
+        ]
 
     def __str__(self):
         return self.channel_name
@@ -162,6 +206,11 @@ class Notification(BaseModel):
     is_read = models.BooleanField(default=False)
     is_sent = models.BooleanField(default=False)
     sent_at = models.DateTimeField(blank=True, null=True)
+    deliver_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text='Deferred push time for digest notifications; empty means push immediately'
+    )
     data = models.JSONField(blank=True, default=dict)
     action_url = models.URLField(
         blank=True,
@@ -189,16 +238,168 @@ class Notification(BaseModel):
         verbose_name = 'Notification'
         verbose_name_plural = 'Notifications'
         ordering = ['-created_at']
+        # Partial: tombstones stay out of the index and never match the default manager
+        indexes = [
+            models.Index(
+                fields=['user', '-created_at'],
+                name='notif_user_created_alive_idx',
+                condition=Q(is_deleted=False),
+            ),
+            models.Index(
+                fields=['user', 'notification_type', '-created_at'],
+                name='notif_user_type_alive_idx',
+                condition=Q(is_deleted=False),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.user.get_full_name()}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the counted state so saves and deletes can adjust NotificationCounter
+        instance._counter_state = instance.counter_state()
+        return instance
+
+    def counter_state(self):
+        """
+        The (type, priority, is_read, is_deleted) state that NotificationCounter tracks.
+        Soft-deleted rows are hidden by the default manager and are not counted.
+        """
+        return (self.notification_type, self.priority, self.is_read, self.is_deleted)
+
     def mark_as_read(self):
         """Mark notification as read."""
+        from .services.counters import record_changed
+
+        with transaction.atomic():
+            updated = Notification.objects.filter(pk=self.pk, is_read=False).update(is_read=True)
+            if updated:
+                record_changed(
+                    self.user_id,
+                    (self.notification_type, self.priority, False, self.is_deleted),
+                    (self.notification_type, self.priority, True, self.is_deleted),
+                )
         self.is_read = True
-        self.save(update_fields=['is_read'])
+        self._counter_state = self.counter_state()
 
     def mark_as_sent(self):
         """Mark notification as sent."""
         self.is_sent = True
         self.save(update_fields=['is_sent'])
+
+
+class NotificationCounter(TimeStampedModel):
+    """
+    Denormalized notification counts per user, kept in step with Notification writes.
+    by_type and by_priority map each key to {"total": n, "unread": m}.
+    """
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='notification_counter'
+    )
+    total_count = models.PositiveIntegerField(default=0)
+    unread_count = models.PositiveIntegerField(default=0)
+    by_type = models.JSONField(blank=True, default=dict)
+    by_priority = models.JSONField(blank=True, default=dict)
+
+    class Meta:
+        db_table = 'notification_counters'
+        verbose_name = 'Notification Counter'
+        verbose_name_plural = 'Notification Counters'
+
+    def __str__(self):
+        return f"{self.unread_count} unread for user {self.user_id}"
+
+    def unread_breakdown(self, field):
+        """Unread counts by type or priority, omitting keys with nothing unread."""
+        return {
+            key: counts['unread']
+            for key, counts in getattr(self, field).items()
+            if counts.get('unread')
+        }
+
+
+class ArchivedNotification(models.Model):
+    """
+    Compact copy of an old read notification moved out of the hot notifications table.
+    Written by `manage.py apply_retention`.
+    """
+    original_id = models.BigIntegerField(unique=True)
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='archived_notifications'
+    )
+    notification_type = models.CharField(max_length=30)
+    title = models.CharField(max_length=200)
+    message = models.TextField()
+    priority = models.CharField(max_length=10)
+    data = models.JSONField(blank=True, default=dict)
+    food_listing_id = models.BigIntegerField(blank=True, null=True)
+    food_reservation_id = models.BigIntegerField(blank=True, null=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'archived_notifications'
+        verbose_name = 'Archived Notification'
+        verbose_name_plural = 'Archived Notifications'
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f"Archived notification {self.original_id}"
+
+
+class QueuedEmail(BaseModel):
+    """
+    Outgoing email waiting to be delivered by the batched email dispatcher.
+    """
+    class Status(models.TextChoices):
+        QUEUED = 'queued', 'Queued'
+        SENDING = 'sending', 'Sending'
+        SENT = 'sent', 'Sent'
+        FAILED = 'failed', 'Failed'
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        related_name='queued_emails',
+        blank=True,
+        null=True
+    )
+    email_type = models.CharField(max_length=50, blank=True)
+    to_email = models.EmailField()
+    to_name = models.CharField(max_length=200, blank=True)
+    from_email = models.CharField(max_length=254, blank=True)
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True)
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.QUEUED
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField()
+    claimed_by = models.CharField(max_length=32, blank=True, help_text='Token of the dispatcher sending it')
+    claimed_at = models.DateTimeField(blank=True, null=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        db_table = 'queued_emails'
+        verbose_name = 'Queued Email'
+        verbose_name_plural = 'Queued Emails'
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to_email} ({self.status})"
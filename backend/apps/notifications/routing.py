@@ -0,0 +1,10 @@
+"""
+WebSocket URL patterns for notifications.
+"""
+from django.urls import path
+
+from . import consumers
+
+websocket_urlpatterns = [
+    path('ws/notifications/', consumers.NotificationConsumer.as_asgi()),
+]
@@ -2,8 +2,12 @@
 Notification serializers for KindBite application.
 Clean, secure serialization for notification data.
 """
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
+
+from apps.users.models import User
 from .models import Notification, NotificationPreference, NotificationTemplate
+from .services.templates import validate_template
 
 
 class NotificationSerializer(serializers.ModelSerializer):
@@ -28,11 +32,11 @@ class NotificationSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'user', 'user_name', 'notification_type', 'notification_type_display',
             'title', 'message', 'priority', 'priority_display', 'is_read', 'is_sent',
-            'sent_at', 'data', 'action_url', 'food_listing', 'food_reservation',
+            'sent_at', 'deliver_at', 'data', 'action_url', 'food_listing', 'food_reservation',
             'created_at', 'updated_at'
         ]
         read_only_fields = [
-            'id', 'user', 'is_sent', 'sent_at', 'created_at', 'updated_at'
+            'id', 'user', 'is_sent', 'sent_at', 'deliver_at', 'created_at', 'updated_at'
         ]
 
 
@@ -92,6 +96,19 @@ class NotificationTemplateSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
+    def validate(self, data):
+        """Validate template placeholders against variables_help."""
+        instance = self.instance
+        try:
+            validate_template(
+                data.get('title_template', getattr(instance, 'title_template', '')),
+                data.get('message_template', getattr(instance, 'message_template', '')),
+                data.get('variables_help', getattr(instance, 'variables_help', '')),
+            )
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(e.message_dict)
+        return data
+
 
 class NotificationStatsSerializer(serializers.Serializer):
     """
@@ -102,3 +119,22 @@ class NotificationStatsSerializer(serializers.Serializer):
     notifications_by_type = serializers.DictField()
     notifications_by_priority = serializers.DictField()
     recent_notifications = NotificationSerializer(many=True)
+
+
+class AnnouncementSerializer(serializers.Serializer):
+    """
+    Serializer for admin system announcements broadcast to many users.
+    """
+    title = serializers.CharField(max_length=200)
+    message = serializers.CharField()
+    priority = serializers.ChoiceField(
+        choices=Notification.Priority.choices,
+        default=Notification.Priority.MEDIUM
+    )
+    action_url = serializers.URLField(required=False, allow_blank=True, default='')
+    roles = serializers.ListField(
+        child=serializers.ChoiceField(choices=User.UserRole.choices),
+        required=False,
+        help_text='Limit the audience to these roles; all roles when omitted'
+    )
+    location = serializers.CharField(max_length=100, required=False, allow_blank=True)
@@ -0,0 +1,179 @@
+"""
+Denormalized per-user notification counters.
+
+NotificationCounter holds each user's total and unread counts, broken down by
+type and priority, so the badge and stats endpoints read one row by primary
+key instead of counting notifications. Every write that changes a counted
+field goes through this module inside the same transaction, with the counter
+rows locked. Soft-deleted notifications are not counted, matching the default
+manager. `manage.py reconcile_notification_counters` repairs any drift.
+"""
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from ..models import Notification, NotificationCounter
+
+COUNTER_FIELDS = ['total_count', 'unread_count', 'by_type', 'by_priority', 'updated_at']
+
+
+def _bump(bucket, key, total, unread):
+    counts = bucket.setdefault(key, {'total': 0, 'unread': 0})
+    counts['total'] = max(counts['total'] + total, 0)
+    counts['unread'] = max(counts['unread'] + unread, 0)
+    if not counts['total'] and not counts['unread']:
+        del bucket[key]
+
+
+def _save_counters(counters):
+    """
+    Write counters with one parameterized UPDATE run through executemany.
+    Much cheaper than bulk_update's CASE expressions for fan-out sized batches.
+    """
+    if not counters:
+        return
+    fields = [NotificationCounter._meta.get_field(name) for name in COUNTER_FIELDS]
+    quote = connection.ops.quote_name
+    assignments = ', '.join(f'{quote(field.column)} = %s' for field in fields)
+    sql = (
+        f'UPDATE {quote(NotificationCounter._meta.db_table)} SET {assignments} '
+        f'WHERE {quote(NotificationCounter._meta.pk.column)} = %s'
+    )
+    params = [
+        [field.get_db_prep_save(getattr(counter, field.attname), connection) for field in fields]
+        + [counter.pk]
+        for counter in counters
+    ]
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, params)
+
+
+def _locked_counters(user_ids, create_missing=True):
+    """Lock and return {user_id: NotificationCounter}, creating missing rows if asked."""
+    counters = {
+        counter.user_id: counter
+        for counter in NotificationCounter.objects.select_for_update().filter(user_id__in=user_ids)
+    }
+    missing = [user_id for user_id in user_ids if user_id not in counters]
+    if missing and create_missing:
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id) for user_id in missing],
+            ignore_conflicts=True,
+        )
+        counters.update({
+            counter.user_id: counter
+            for counter in NotificationCounter.objects.select_for_update().filter(user_id__in=missing)
+        })
+    return counters
+
+
+def _apply(deltas, create_missing=True):
+    """
+    Apply {user_id: [(type, priority, total_delta, unread_delta), ...]} to the counters.
+    """
+    if not deltas:
+        return
+    now = timezone.now()
+    with transaction.atomic():
+        counters = _locked_counters(list(deltas), create_missing=create_missing)
+        for user_id, changes in deltas.items():
+            counter = counters.get(user_id)
+            if counter is None:
+                continue
+            for notification_type, priority, total, unread in changes:
+                counter.total_count = max(counter.total_count + total, 0)
+                counter.unread_count = max(counter.unread_count + unread, 0)
+                _bump(counter.by_type, notification_type, total, unread)
+                _bump(counter.by_priority, priority, total, unread)
+            counter.updated_at = now
+        _save_counters(list(counters.values()))
+
+
+def record_created(notifications):
+    """Count newly created notifications (single saves and bulk_create chunks)."""
+    deltas = defaultdict(list)
+    for notification in notifications:
+        if notification.is_deleted:
+            continue
+        deltas[notification.user_id].append((
+            notification.notification_type,
+            notification.priority,
+            1,
+            0 if notification.is_read else 1,
+        ))
+    _apply(deltas)
+
+
+def record_deleted(notifications):
+    """Uncount notifications that are being hard-deleted; soft-deleted ones were already uncounted."""
+    deltas = defaultdict(list)
+    for notification in notifications:
+        if notification.is_deleted:
+            continue
+        deltas[notification.user_id].append((
+            notification.notification_type,
+            notification.priority,
+            -1,
+            0 if notification.is_read else -1,
+        ))
+    # Never recreate a counter here: the user may be deleted in the same transaction
+    _apply(deltas, create_missing=False)
+
+
+def record_changed(user_id, old_state, new_state):
+    """
+    Move one notification between buckets; states are (type, priority, is_read, is_deleted).
+    Soft-deleting uncounts the notification and restoring counts it again.
+    """
+    if old_state == new_state:
+        return
+    old_type, old_priority, old_read, old_deleted = old_state
+    new_type, new_priority, new_read, new_deleted = new_state
+    changes = []
+    if not old_deleted:
+        changes.append((old_type, old_priority, -1, 0 if old_read else -1))
+    if not new_deleted:
+        changes.append((new_type, new_priority, 1, 0 if new_read else 1))
+    if changes:
+        _apply({user_id: changes})
+
+
+def mark_all_read(user_id):
+    """Mark every unread notification of a user as read; returns the number updated."""
+    with transaction.atomic():
+        counter = _locked_counters([user_id])[user_id]
+        updated = Notification.objects.filter(user_id=user_id, is_read=False).update(is_read=True)
+        counter.unread_count = 0
+        for bucket in (counter.by_type, counter.by_priority):
+            for counts in bucket.values():
+                counts['unread'] = 0
+        counter.save(update_fields=['unread_count', 'by_type', 'by_priority', 'updated_at'])
+    return updated
+
+
+def get_counter(user_id):
+    """Primary-key read of a user's counter; an unsaved zero counter if none exists yet."""
+    return NotificationCounter.objects.filter(pk=user_id).first() or NotificationCounter(user_id=user_id)
+
+
+def compute_counters(user_ids):
+    """
+    Count notifications from scratch for the given users.
+    Returns {user_id: NotificationCounter} (unsaved) for every id passed in.
+    """
+    counters = {user_id: NotificationCounter(user_id=user_id) for user_id in user_ids}
+    rows = (
+        Notification.objects.filter(user_id__in=user_ids)
+        .values('user_id', 'notification_type', 'priority')
+        .annotate(total=Count('id'), unread=Count('id', filter=Q(is_read=False)))
+        .order_by()
+    )
+    for row in rows:
+        counter = counters[row['user_id']]
+        counter.total_count += row['total']
+        counter.unread_count += row['unread']
+        _bump(counter.by_type, row['notification_type'], row['total'], row['unread'])
+        _bump(counter.by_priority, row['priority'], row['total'], row['unread'])
+    return counters
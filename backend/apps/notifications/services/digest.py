@@ -0,0 +1,88 @@
+"""
+Coalescing of notification bursts into digest rows.
+
+The first notification of a coalesced type opens a digest row whose push is
+deferred until the end of the coalescing window (or the end of the user's
+quiet hours, whichever is later). Further notifications of the same type for
+that user merge into the open row, incrementing `data["count"]` and appending
+to `data["related_ids"]`, instead of creating and pushing a row each. When the
+window closes, the `notifications.deliver_digest` outbox event pushes it once.
+"""
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.common import outbox
+from ..models import Notification
+from .preferences import get_preferences
+
+DELIVER_EVENT = 'notifications.deliver_digest'
+
+
+def _deliver_at(user_id, now):
+    """End of the coalescing window, pushed past the user's quiet hours if needed."""
+    deliver_at = now + settings.NOTIFICATION_DIGEST['WINDOW']
+    quiet_until = get_preferences(user_id).quiet_hours_end_after(deliver_at)
+    if quiet_until is not None:
+        deliver_at = quiet_until
+    return deliver_at
+
+
+def coalesce(user_id, notification_type, related_id, title, message, digest_title,
+             digest_message, **fields):
+    """
+    Record one notification, merging it into the user's open digest for the type.
+
+    title/message describe a single event; digest_title/digest_message are used
+    once two or more events are merged and may contain a `{count}` placeholder.
+    Types not listed in NOTIFICATION_DIGEST['TYPES'] are created and pushed directly.
+    Returns the notification row that now represents the event.
+    """
+    if notification_type not in settings.NOTIFICATION_DIGEST['TYPES']:
+        return Notification.objects.create(
+            user_id=user_id,
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            data={'related_ids': [related_id]},
+            **fields,
+        )
+
+    now = timezone.now()
+    with transaction.atomic():
+        digest = (
+            Notification.objects.select_for_update()
+            .filter(
+                user_id=user_id,
+                notification_type=notification_type,
+                is_read=False,
+                is_sent=False,
+                deliver_at__gt=now,
+            )
+            .order_by('-id')
+            .first()
+        )
+        if digest is None:
+            digest = Notification.objects.create(
+                user_id=user_id,
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                data={'digest': True, 'count': 1, 'related_ids': [related_id]},
+                deliver_at=_deliver_at(user_id, now),
+                **fields,
+            )
+            outbox.enqueue(DELIVER_EVENT, {'notification_id': digest.id}, delay=digest.deliver_at - now)
+            return digest
+
+        count = digest.data.get('count', 1) + 1
+        digest.data = {
+            **digest.data,
+            'count': count,
+            'related_ids': digest.data.get('related_ids', []) + [related_id],
+        }
+        digest.title = digest_title.format(count=count)[:200]
+        digest.message = digest_message.format(count=count)
+        digest.save(update_fields=['title', 'message', 'data', 'updated_at'])
+        return digest
+
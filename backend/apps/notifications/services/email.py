@@ -0,0 +1,167 @@
+"""
+Batched email delivery for KindBite notifications.
+
+Emails are queued as QueuedEmail rows and delivered by EmailDispatcher, which
+groups due messages and sends each group over a single backend connection
+(one SMTP session per group instead of one per message). Each message is sent
+and recorded on its own, so a failure part-way through a group never re-sends
+the messages the server already accepted. Groups are sent by a bounded pool of
+worker threads; database updates stay on the calling thread.
+"""
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db.models import Q
+from django.utils import timezone
+
+from ..models import QueuedEmail
+
+logger = logging.getLogger(__name__)
+
+
+def queue_email(to_email, subject, body, to_name='', html_body='', email_type='', user=None, from_email=None):
+    """Queue an email for the batched dispatcher."""
+    return QueuedEmail.objects.create(
+        user=user,
+        email_type=email_type,
+        to_email=to_email,
+        to_name=to_name,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        subject=subject[:255],
+        body=body,
+        html_body=html_body,
+        next_attempt_at=timezone.now(),
+    )
+
+
+def _build_message(queued):
+    recipient = f'{queued.to_name} <{queued.to_email}>' if queued.to_name else queued.to_email
+    message = EmailMultiAlternatives(
+        subject=queued.subject,
+        body=queued.body,
+        from_email=queued.from_email or settings.DEFAULT_FROM_EMAIL,
+        to=[recipient],
+    )
+    if queued.html_body:
+        message.attach_alternative(queued.html_body, 'text/html')
+    return message
+
+
+def _send_group(group, backend):
+    """
+    Send one group of emails over a single connection, one message at a time.
+    Returns one error (None when sent) per message. After a failure the
+    connection is reopened for the rest of the group. Runs on a worker thread
+    and never touches the database.
+    """
+    connection = get_connection(backend=backend, fail_silently=False)
+    errors = []
+    try:
+        for queued in group:
+            try:
+                connection.send_messages([_build_message(queued)])
+                errors.append(None)
+            except Exception as e:
+                errors.append(f'{type(e).__name__}: {e}')
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+        return errors
+    finally:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+class EmailDispatcher:
+    """
+    Deliver queued emails in batches over pooled connections.
+    """
+
+    def __init__(self, batch_size=None, messages_per_connection=None, max_connections=None, backend=None):
+        config = settings.EMAIL_DISPATCH
+        self.batch_size = batch_size or config['BATCH_SIZE']
+        self.messages_per_connection = messages_per_connection or config['MESSAGES_PER_CONNECTION']
+        self.max_connections = max_connections or config['MAX_CONNECTIONS']
+        self.max_attempts = config['MAX_ATTEMPTS']
+        self.retry_base_delay = config['RETRY_BASE_DELAY']
+        self.backend = backend
+
+    def _claim_batch(self):
+        """
+        Claim up to batch_size due emails for this dispatcher.
+        Emails stuck in SENDING for 10 minutes (crashed worker) are reclaimed.
+        """
+        now = timezone.now()
+        stale_before = now - timedelta(minutes=10)
+        due = Q(status=QueuedEmail.Status.QUEUED, next_attempt_at__lte=now) | Q(
+            status=QueuedEmail.Status.SENDING, claimed_at__lt=stale_before
+        )
+        ids = list(QueuedEmail.objects.filter(due).values_list('id', flat=True)[:self.batch_size])
+        if not ids:
+            return []
+        token = uuid.uuid4().hex
+        QueuedEmail.objects.filter(due, id__in=ids).update(
+            status=QueuedEmail.Status.SENDING,
+            claimed_by=token,
+            claimed_at=now,
+            updated_at=now,
+        )
+        return list(QueuedEmail.objects.filter(claimed_by=token, status=QueuedEmail.Status.SENDING))
+
+    def _mark_sent(self, sent):
+        QueuedEmail.objects.filter(id__in=[queued.id for queued in sent]).update(
+            status=QueuedEmail.Status.SENT,
+            sent_at=timezone.now(),
+            last_error='',
+        )
+
+    def _mark_failed(self, failed):
+        """Schedule a retry with exponential backoff, or give up after max attempts."""
+        now = timezone.now()
+        for queued, error in failed:
+            queued.attempts += 1
+            queued.last_error = error
+            if queued.attempts >= self.max_attempts:
+                queued.status = QueuedEmail.Status.FAILED
+            else:
+                queued.status = QueuedEmail.Status.QUEUED
+                queued.next_attempt_at = now + self.retry_base_delay * (2 ** (queued.attempts - 1))
+        QueuedEmail.objects.bulk_update(
+            [queued for queued, _ in failed], ['attempts', 'last_error', 'status', 'next_attempt_at']
+        )
+        logger.warning('Failed to send %d emails: %s', len(failed), failed[0][1])
+
+    def dispatch(self):
+        """
+        Send one batch of due emails.
+        Returns (sent, failed) counts.
+        """
+        batch = self._claim_batch()
+        if not batch:
+            return 0, 0
+
+        size = self.messages_per_connection
+        groups = [batch[i:i + size] for i in range(0, len(batch), size)]
+        workers = min(self.max_connections, len(groups))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda group: _send_group(group, self.backend), groups))
+
+        sent, failed = [], []
+        for group, group_errors in zip(groups, results):
+            for queued, error in zip(group, group_errors):
+                if error is None:
+                    sent.append(queued)
+                else:
+                    failed.append((queued, error))
+        if sent:
+            self._mark_sent(sent)
+        if failed:
+            self._mark_failed(failed)
+        return len(sent), len(failed)
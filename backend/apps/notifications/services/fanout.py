@@ -0,0 +1,154 @@
+"""
+Bulk notification fan-out for KindBite.
+
+The candidate users (role, location) are paged by primary key. Each page's
+preferences are read with one get_preferences_bulk() call, which is mostly
+cache hits, and opted-out users and users inside their quiet hours are dropped
+before the page is inserted with bulk_create in its own short transaction.
+
+Senders that pass a `context` let an active NotificationTemplate for the type
+personalize the text: each chunk is rendered with CompiledTemplate.render_many()
+over the context plus the recipient's `user_name`. Without a usable template
+every recipient gets the sender's title and message.
+"""
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.users.models import User
+from ..models import Notification
+from .counters import record_created
+from .preferences import get_preferences_bulk
+from .push import push_notifications
+from .templates import TemplateRenderError, get_active_template
+
+logger = logging.getLogger(__name__)
+
+# Per-recipient template variable, added to the sender's context
+RECIPIENT_VARIABLE = 'user_name'
+
+# In-app preference flag that controls each broadcast notification type
+CATEGORY_PREFERENCES = {
+    Notification.NotificationType.NEW_FOOD_AVAILABLE: 'in_app_food_updates',
+    Notification.NotificationType.SYSTEM_ANNOUNCEMENT: 'in_app_system_announcements',
+}
+
+
+def audience(roles=None, location=None, exclude_user_ids=None):
+    """
+    Return the candidate recipient queryset for a broadcast notification,
+    before preferences are applied (see accepts()).
+    """
+    queryset = User.objects.filter(is_active=True)
+    if roles:
+        queryset = queryset.filter(user_role__in=roles)
+    if location:
+        queryset = queryset.filter(location=location)
+    if exclude_user_ids:
+        queryset = queryset.exclude(id__in=exclude_user_ids)
+    return queryset.order_by('id')
+
+
+def accepts(preferences, notification_type, moment):
+    """Whether a user's preferences allow an in-app notification of this type at `moment`."""
+    if not preferences.in_app_enabled:
+        return False
+    category = CATEGORY_PREFERENCES.get(notification_type)
+    if category and not getattr(preferences, category):
+        return False
+    return preferences.quiet_hours_end_after(moment) is None
+
+
+def recipient_template(notification_type, context):
+    """
+    The active template for a fan-out with a sender context, or None when there
+    is no context, no template, or the template uses a variable neither the
+    context nor the recipient provides.
+    """
+    if context is None:
+        return None
+    template = get_active_template(notification_type)
+    if template is None:
+        return None
+    missing = template.variables.difference(context, {RECIPIENT_VARIABLE})
+    if missing:
+        logger.warning(
+            'Notification template %s not used for fan-out: missing %s',
+            notification_type, ', '.join(sorted(missing)),
+        )
+        return None
+    return template
+
+
+def _texts(template, context, title, message, recipients):
+    """(title, message) per recipient row (id, first_name, last_name)."""
+    if template is not None:
+        try:
+            return template.render_many([
+                {**context, RECIPIENT_VARIABLE: f'{first_name} {last_name}'.strip()}
+                for _user_id, first_name, last_name in recipients
+            ])
+        except TemplateRenderError as e:
+            logger.warning('Notification template not used for fan-out chunk: %s', e)
+    return [(title, message)] * len(recipients)
+
+
+def fan_out(notification_type, title, message, priority=Notification.Priority.MEDIUM,
+            data=None, action_url='', food_listing_id=None, roles=None, location=None,
+            exclude_user_ids=None, context=None, after_id=0, chunk_size=None, on_chunk=None):
+    """
+    Create one notification per audience member.
+
+    title and message are the sender's text; with a `context` dict an active
+    template for the type replaces them per recipient (see recipient_template()).
+
+    Recipients with id <= after_id are skipped, so an interrupted fan-out can
+    resume. on_chunk(last_user_id) is called inside each chunk's transaction.
+    Returns the number of notifications created.
+    """
+    chunk_size = chunk_size or settings.NOTIFICATION_FANOUT['CHUNK_SIZE']
+    candidates = audience(
+        roles=roles,
+        location=location,
+        exclude_user_ids=exclude_user_ids,
+    ).values_list('id', 'first_name', 'last_name')
+    template = recipient_template(notification_type, context)
+    now = timezone.now()
+
+    created = 0
+    last_id = after_id
+    while True:
+        candidate_rows = list(candidates.filter(id__gt=last_id)[:chunk_size])
+        if not candidate_rows:
+            return created
+
+        preferences = get_preferences_bulk([row[0] for row in candidate_rows])
+        recipients = [
+            row for row in candidate_rows
+            if accepts(preferences[row[0]], notification_type, now)
+        ]
+        texts = _texts(template, context, title, message, recipients)
+        with transaction.atomic():
+            notifications = Notification.objects.bulk_create([
+                Notification(
+                    user_id=user_id,
+                    notification_type=notification_type,
+                    title=recipient_title,
+                    message=recipient_message,
+                    priority=priority,
+                    data=data or {},
+                    action_url=action_url,
+                    food_listing_id=food_listing_id,
+                )
+                for (user_id, _first_name, _last_name), (recipient_title, recipient_message)
+                in zip(recipients, texts)
+            ], batch_size=chunk_size)
+            record_created(notifications)
+            last_id = candidate_rows[-1][0]
+            if on_chunk:
+                on_chunk(last_id)
+            # bulk_create skips post_save, so count and push the chunk explicitly
+            transaction.on_commit(lambda chunk=notifications: push_notifications(chunk))
+        created += len(recipients)
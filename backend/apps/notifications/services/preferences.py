@@ -0,0 +1,78 @@
+"""
+Read-through cache of NotificationPreference rows keyed by user id.
+
+Sends and preference reads look users up through this module, so a single
+lookup costs a cache hit and a fan-out chunk of thousands costs one `get_many`
+plus at most a handful of chunked queries for the misses. Users without a row
+get an unsaved NotificationPreference carrying the model defaults, so reads
+never INSERT; the row is only created when the user changes something. Entries are dropped by
+the post_save/post_delete signals and again on commit, in the shared cache
+(or, with the development local-memory cache, they expire within
+CACHE_LOCAL_MAX_SECONDS in other processes).
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from ..models import NotificationPreference
+
+CACHE_KEY = 'notifications:preferences:{user_id}'
+
+# Stay below SQLite's 999 bound parameters per query
+QUERY_CHUNK_SIZE = 900
+
+
+def cache_key(user_id):
+    return CACHE_KEY.format(user_id=user_id)
+
+
+def _default(user_id):
+    return NotificationPreference(user_id=user_id)
+
+
+def get_preferences(user_id):
+    """Return the user's preferences, or unsaved defaults when they have no row."""
+    return get_preferences_bulk([user_id])[user_id]
+
+
+def get_preferences_bulk(user_ids):
+    """
+    Return {user_id: NotificationPreference} for every id passed in, with
+    unsaved defaults for users without a row.
+    Cache misses are loaded in chunked `user_id IN (...)` queries and cached.
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    keys = {cache_key(user_id): user_id for user_id in user_ids}
+    found = {keys[key]: preferences for key, preferences in cache.get_many(list(keys)).items()}
+
+    missing = [user_id for user_id in user_ids if user_id not in found]
+    loaded = {}
+    for start in range(0, len(missing), QUERY_CHUNK_SIZE):
+        chunk = missing[start:start + QUERY_CHUNK_SIZE]
+        for preferences in NotificationPreference.objects.filter(user_id__in=chunk):
+            loaded[preferences.user_id] = preferences
+    for user_id in missing:
+        loaded.setdefault(user_id, _default(user_id))
+
+    if loaded:
+        cache.set_many(
+            {cache_key(user_id): preferences for user_id, preferences in loaded.items()},
+            settings.NOTIFICATION_PREFERENCE_CACHE_TIMEOUT,
+        )
+    found.update(loaded)
+    return found
+
+
+def get_or_create_preferences(user_id):
+    """Saved preferences row for a user, for updates. Reads should use get_preferences()."""
+    preferences = get_preferences(user_id)
+    if preferences.pk is None:
+        preferences, _created = NotificationPreference.objects.get_or_create(user_id=user_id)
+    return preferences
+
+
+def invalidate(user_id):
+    """Drop a user's cached preferences now and once the current transaction commits."""
+    key = cache_key(user_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
@@ -0,0 +1,81 @@
+"""
+Real-time notification push over Django Channels.
+
+Each connected WebSocket joins a per-user group. New notifications are sent to
+the groups of users that have an active NotificationChannel, so offline users
+cost one indexed lookup per batch instead of a channel-layer message each.
+"""
+import logging
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.utils import timezone
+
+from ..models import NotificationChannel
+
+logger = logging.getLogger(__name__)
+
+PUSH_MESSAGE_TYPE = 'notification.message'
+
+
+def user_group(user_id):
+    """Channel-layer group that every socket of a user joins."""
+    return f'notifications.user.{user_id}'
+
+
+def serialize_for_push(notification):
+    """Compact payload sent to the client for a new notification."""
+    return {
+        'id': notification.id,
+        'notification_type': notification.notification_type,
+        'title': notification.title,
+        'message': notification.message,
+        'priority': notification.priority,
+        'is_read': notification.is_read,
+        'data': notification.data,
+        'action_url': notification.action_url,
+        'food_listing': notification.food_listing_id,
+        'food_reservation': notification.food_reservation_id,
+        'created_at': notification.created_at.isoformat() if notification.created_at else None,
+    }
+
+
+def connected_user_ids(user_ids):
+    """
+    Return the subset of user_ids with at least one live channel.
+    Channels left behind by a crashed server stop counting once their heartbeats go stale.
+    """
+    seen_after = timezone.now() - settings.NOTIFICATION_PUSH['CHANNEL_STALE_AFTER']
+    return set(
+        NotificationChannel.objects.filter(
+            user_id__in=user_ids, is_active=True, last_seen__gte=seen_after
+        )
+        .values_list('user_id', flat=True)
+        .distinct()
+    )
+
+
+def push_notifications(notifications):
+    """
+    Send notifications to their users' connected sockets.
+    Delivery is best effort: clients still load missed notifications over the REST API.
+    """
+    channel_layer = get_channel_layer()
+    if channel_layer is None or not notifications:
+        return 0
+
+    online = connected_user_ids({notification.user_id for notification in notifications})
+    pushed = 0
+    for notification in notifications:
+        if notification.user_id not in online:
+            continue
+        try:
+            async_to_sync(channel_layer.group_send)(user_group(notification.user_id), {
+                'type': PUSH_MESSAGE_TYPE,
+                'notification': serialize_for_push(notification),
+            })
+            pushed += 1
+        except Exception as e:
+            logger.warning('Failed to push notification %s: %s', notification.id, e)
+    return pushed
@@ -0,0 +1,216 @@
+"""
+Notification template rendering.
+
+Templates use `{variable}` placeholders (optionally with a format spec, e.g.
+`{amount:.2f}`); attribute and index lookups are rejected so a template can
+only read the values it is given. Each NotificationTemplate is parsed once into
+(literal, variable, format spec) parts and cached in an LRU keyed by
+(notification_type, updated_at), so editing a template invalidates its entry
+and renders never re-parse the template text.
+
+Senders call render_or_default() with their built-in text: an active template
+for the type overrides it, and a template that cannot be rendered with the
+sender's context falls back to the built-in text. Broadcast fan-outs look the
+template up once and render every chunk of recipients with render_many().
+"""
+import logging
+import re
+import threading
+from collections import OrderedDict
+from string import Formatter
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
+from ..models import NotificationTemplate
+
+logger = logging.getLogger(__name__)
+
+IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+_formatter = Formatter()
+
+
+class TemplateRenderError(ValueError):
+    """Raised when a template cannot be compiled or a context is missing variables."""
+
+
+def parse_template(text):
+    """
+    Validate a template string and split it into ((literal, variable, format_spec), ...).
+    variable is None for trailing literal text.
+    """
+    try:
+        parsed = list(_formatter.parse(text))
+    except ValueError as e:
+        raise TemplateRenderError(f'Invalid template syntax: {e}') from e
+
+    parts = []
+    for literal, field_name, format_spec, conversion in parsed:
+        if field_name is not None:
+            if not IDENTIFIER.match(field_name):
+                raise TemplateRenderError(
+                    f'Invalid placeholder {{{field_name}}}: use plain variable names like {{user_name}}'
+                )
+            if conversion:
+                raise TemplateRenderError(f'Conversions are not supported in {{{field_name}!{conversion}}}')
+            if format_spec and '{' in format_spec:
+                raise TemplateRenderError(f'Nested placeholders are not supported in {{{field_name}}}')
+        parts.append((literal, field_name, format_spec or ''))
+    return tuple(parts)
+
+
+def template_variables(text):
+    """Return the set of variable names used by a template string."""
+    return {field_name for _literal, field_name, _spec in parse_template(text) if field_name is not None}
+
+
+def _render_parts(parts, context):
+    out = []
+    for literal, field_name, format_spec in parts:
+        out.append(literal)
+        if field_name is not None:
+            out.append(format(context[field_name], format_spec))
+    return ''.join(out)
+
+
+def declared_variables(variables_help):
+    """
+    Parse variables_help into variable names.
+    Accepts comma- or newline-separated entries such as `user_name`, `{food_name}`
+    or `pickup_time: when the pickup window opens`.
+    """
+    names = set()
+    for entry in re.split(r'[,\n]', variables_help or ''):
+        name = entry.split(':', 1)[0].split(' - ', 1)[0].strip().strip('{}').strip()
+        if name:
+            names.add(name)
+    return names
+
+
+def validate_template(title_template, message_template, variables_help):
+    """
+    Check template syntax and that every placeholder is declared in variables_help.
+    Raises django.core.exceptions.ValidationError keyed by field name.
+    """
+    declared = declared_variables(variables_help)
+    errors = {}
+    for field, text in (('title_template', title_template), ('message_template', message_template)):
+        try:
+            undeclared = template_variables(text) - declared
+        except TemplateRenderError as e:
+            errors[field] = str(e)
+            continue
+        if undeclared:
+            errors[field] = (
+                f"Variables not listed in variables_help: {', '.join(sorted(undeclared))}"
+            )
+    if errors:
+        raise ValidationError(errors)
+
+
+class CompiledTemplate:
+    """
+    A title/message template pair, parsed once for repeated rendering.
+    """
+
+    def __init__(self, title_template, message_template, priority):
+        self.priority = priority
+        self.title_parts = parse_template(title_template)
+        self.message_parts = parse_template(message_template)
+        self.variables = frozenset(
+            field_name
+            for _literal, field_name, _spec in self.title_parts + self.message_parts
+            if field_name is not None
+        )
+
+    def render(self, context):
+        """Return (title, message) for one context dict."""
+        missing = self.variables.difference(context)
+        if missing:
+            raise TemplateRenderError(f"Missing template variables: {', '.join(sorted(missing))}")
+        try:
+            return _render_parts(self.title_parts, context), _render_parts(self.message_parts, context)
+        except (TypeError, ValueError) as e:
+            raise TemplateRenderError(f'Could not render template: {e}') from e
+
+    def render_many(self, contexts):
+        """Return a list of (title, message) pairs, one per context dict."""
+        return [self.render(context) for context in contexts]
+
+
+class TemplateCache:
+    """
+    Thread-safe LRU of compiled templates keyed by (notification_type, updated_at).
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _limit(self):
+        return self.maxsize or settings.NOTIFICATION_TEMPLATE_CACHE_SIZE
+
+    def get(self, template):
+        key = (template.notification_type, template.updated_at)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                return compiled
+
+        compiled = CompiledTemplate(template.title_template, template.message_template, template.priority)
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._limit():
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+template_cache = TemplateCache()
+
+
+def _active_template(notification_type):
+    return (
+        NotificationTemplate.objects.filter(notification_type=notification_type, is_active=True)
+        .only('notification_type', 'title_template', 'message_template', 'priority', 'updated_at')
+        .first()
+    )
+
+
+def get_active_template(notification_type):
+    """
+    The compiled active template for a type, or None when it has none.
+    Costs one small query; parsing only happens when the template changed.
+    """
+    template = _active_template(notification_type)
+    return template_cache.get(template) if template is not None else None
+
+
+def get_compiled_template(notification_type):
+    """Like get_active_template(), but a type without a template is an error."""
+    compiled = get_active_template(notification_type)
+    if compiled is None:
+        raise TemplateRenderError(f'No active template for {notification_type}')
+    return compiled
+
+
+def render_or_default(notification_type, context, title, message):
+    """
+    (title, message) from the active template for a type, or the sender's
+    built-in text (formatted with the same context) when there is none or it
+    cannot be rendered with this context.
+    """
+    compiled = get_active_template(notification_type)
+    if compiled is not None:
+        try:
+            return compiled.render(context)
+        except TemplateRenderError as e:
+            logger.warning('Notification template %s not used: %s', notification_type, e)
+    return title.format_map(context), message.format_map(context)
@@ -0,0 +1,41 @@
+"""
+Signal handlers for notifications.
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Notification, NotificationPreference
+from .services import preferences
+from .services.counters import record_changed, record_created
+from .services.push import push_notifications
+
+
+@receiver(post_save, sender=Notification)
+def update_notification_counter(sender, instance, created, **kwargs):
+    """Keep NotificationCounter in step with single-row notification saves."""
+    new_state = instance.counter_state()
+    if created:
+        record_created([instance])
+    else:
+        old_state = getattr(instance, '_counter_state', None)
+        if old_state is not None:
+            record_changed(instance.user_id, old_state, new_state)
+    instance._counter_state = new_state
+
+
+@receiver(post_save, sender=Notification)
+def push_new_notification(sender, instance, created, **kwargs):
+    """
+    Push newly created notifications to connected sockets once the row is committed.
+    Digest rows with a deliver_at are pushed by the outbox when their window closes.
+    """
+    if created and instance.deliver_at is None:
+        transaction.on_commit(lambda: push_notifications([instance]))
+
+
+@receiver(post_save, sender=NotificationPreference)
+@receiver(post_delete, sender=NotificationPreference)
+def invalidate_cached_preferences(sender, instance, **kwargs):
+    """Drop the cached preferences whenever a preference row changes."""
+    preferences.invalidate(instance.user_id)
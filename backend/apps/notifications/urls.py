@@ -15,6 +15,7 @@ urlpatterns = [
     path('preferences/', views.notification_preferences, name='notification-preferences'),
     path('preferences/update/', views.update_notification_preferences, name='update-notification-preferences'),
     path('send/', views.send_notification, name='send-notification'),
+    path('announce/', views.announce, name='announce'),
     
     # Include ViewSet routes
     path('', include(router.urls)),
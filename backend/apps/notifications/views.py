@@ -7,15 +7,21 @@ from rest_framework.decorators import api_view, permission_classes, action
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.generics import ListAPIView, RetrieveUpdateAPIView
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 from datetime import timedelta
 
-from .models import Notification, NotificationPreference, NotificationTemplate
+from apps.common.permissions import IsPlatformAdmin
+from .handlers import enqueue_fan_out
+from .models import Notification, NotificationTemplate
+from .services.counters import get_counter, mark_all_read, record_deleted
+from .services.email import queue_email
+from .services.preferences import get_or_create_preferences, get_preferences
 from .serializers import (
     NotificationSerializer, NotificationCreateSerializer,
     NotificationPreferenceSerializer, NotificationTemplateSerializer,
-    NotificationStatsSerializer
+    NotificationStatsSerializer, AnnouncementSerializer
 )
 
 
@@ -27,7 +33,8 @@ class NotificationViewSet(ModelViewSet):
     
     def get_queryset(self):
         """Get notifications for the current user."""
-        return Notification.objects.filter(user=self.request.user)
+        # user_name reads the user of every row
+        return Notification.objects.filter(user=self.request.user).select_related('user')
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -39,6 +46,12 @@ class NotificationViewSet(ModelViewSet):
         """Set the user to current user when creating."""
         serializer.save(user=self.request.user)
     
+    def perform_destroy(self, instance):
+        """Delete the notification and uncount it."""
+        with transaction.atomic():
+            record_deleted([instance])
+            instance.delete()
+    
     @action(detail=True, methods=['post'])
     def mark_as_read(self, request, pk=None):
         """Mark notification as read."""
@@ -49,10 +62,7 @@ class NotificationViewSet(ModelViewSet):
     @action(detail=False, methods=['post'])
     def mark_all_as_read(self, request):
         """Mark all notifications as read."""
-        Notification.objects.filter(
-            user=request.user,
-            is_read=False
-        ).update(is_read=True)
+        mark_all_read(request.user.id)
         return Response({'message': 'All notifications marked as read'})
     
     @action(detail=False, methods=['get'])
@@ -62,36 +72,30 @@ class NotificationViewSet(ModelViewSet):
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
     
+    @action(detail=False, methods=['get'])
+    def unread_count(self, request):
+        """Badge counts: a single primary-key read of the user's counter row."""
+        counter = get_counter(request.user.id)
+        return Response({
+            'unread_count': counter.unread_count,
+            'unread_by_type': counter.unread_breakdown('by_type'),
+            'unread_by_priority': counter.unread_breakdown('by_priority'),
+        })
+    
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """Get notification statistics."""
-        user = request.user
-        
-        # Basic stats
-        total_notifications = Notification.objects.filter(user=user).count()
-        unread_notifications = Notification.objects.filter(
-            user=user, is_read=False
-        ).count()
-        
-        # Notifications by type
-        notifications_by_type = Notification.objects.filter(user=user).values(
-            'notification_type'
-        ).annotate(count=Count('id'))
-        
-        # Notifications by priority
-        notifications_by_priority = Notification.objects.filter(user=user).values(
-            'priority'
-        ).annotate(count=Count('id'))
+        counter = get_counter(request.user.id)
         
         # Recent notifications (last 10)
-        recent_notifications = Notification.objects.filter(user=user)[:10]
+        recent_notifications = Notification.objects.filter(user=request.user).select_related('user')[:10]
         
         stats_data = {
-            'total_notifications': total_notifications,
-            'unread_notifications': unread_notifications,
-            'notifications_by_type': {item['notification_type']: item['count'] for item in notifications_by_type},
-            'notifications_by_priority': {item['priority']: item['count'] for item in notifications_by_priority},
-            'recent_notifications': NotificationSerializer(recent_notifications, many=True).data
+            'total_notifications': counter.total_count,
+            'unread_notifications': counter.unread_count,
+            'notifications_by_type': {key: counts['total'] for key, counts in counter.by_type.items()},
+            'notifications_by_priority': {key: counts['total'] for key, counts in counter.by_priority.items()},
+            'recent_notifications': recent_notifications
         }
         
         serializer = NotificationStatsSerializer(stats_data)
@@ -106,10 +110,12 @@ class NotificationPreferenceView(RetrieveUpdateAPIView):
     serializer_class = NotificationPreferenceSerializer
     
     def get_object(self):
-        """Get or create notification preferences for current user."""
-        preferences, created = NotificationPreference.objects.get_or_create(
-            user=self.request.user
-        )
+        """Cached preferences for reads; a saved row (created on demand) for updates."""
+        if self.request.method in permissions.SAFE_METHODS:
+            preferences = get_preferences(self.request.user.id)
+        else:
+            preferences = get_or_create_preferences(self.request.user.id)
+        preferences.user = self.request.user
         return preferences
 
 
@@ -122,17 +128,44 @@ class NotificationTemplateViewSet(ModelViewSet):
     permission_classes = [permissions.IsAdminUser]
 
 
+@api_view(['POST'])
+@permission_classes([IsPlatformAdmin])
+def announce(request):
+    """
+    Broadcast a system announcement.
+    The fan-out runs in the outbox dispatcher, so the request returns immediately.
+    """
+    serializer = AnnouncementSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    announcement = serializer.validated_data
+
+    event = enqueue_fan_out(
+        Notification.NotificationType.SYSTEM_ANNOUNCEMENT,
+        title=announcement['title'],
+        message=announcement['message'],
+        priority=announcement['priority'],
+        action_url=announcement['action_url'],
+        roles=announcement.get('roles') or None,
+        location=announcement.get('location') or None,
+    )
+    return Response(
+        {'message': 'Announcement scheduled', 'event_id': event.id},
+        status=status.HTTP_202_ACCEPTED
+    )
+
+
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def send_notification(request):
     """
     Send a notification/email to a user.
+    Platform admins may email any address; other users only their own.
     """
     try:
         notification_type = request.data.get('type')
         recipient_email = request.data.get('recipient_email')
         recipient_name = request.data.get('recipient_name')
-        data = request.data.get('data', {})
+        data = request.data.get('data') or {}
         
         if not notification_type or not recipient_email:
             return Response(
@@ -140,50 +173,61 @@ def send_notification(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        if not isinstance(data, dict):
+            return Response(
+                {'error': 'data must be an object'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        is_admin = IsPlatformAdmin().has_permission(request, None)
+        if not is_admin and recipient_email.strip().lower() != request.user.email.lower():
+            return Response(
+                {'error': 'You can only send notifications to your own email address'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
         # Try to find user by email
-        try:
-            from apps.users.models import User
-            user = User.objects.get(email=recipient_email)
-        except User.DoesNotExist:
-            # Create a notification for non-registered users
-            user = None
+        from apps.users.models import User
+        user = User.objects.filter(email=recipient_email).first()
         
-        # Create notification record
+        subject = f"KindBite: {notification_type.replace('_', ' ').title()}"
+        body_lines = [f"Hi {recipient_name or recipient_email},", ""]
+        body_lines += [f"{key.replace('_', ' ').title()}: {value}" for key, value in data.items()]
+        queued_email = queue_email(
+            to_email=recipient_email,
+            to_name=recipient_name or '',
+            subject=subject,
+            body="\n".join(body_lines),
+            email_type=notification_type,
+            user=user,
+        )
+        
+        # Create notification record for registered users
+        notification = None
         if user:
+            valid_types = Notification.NotificationType.values
             notification = Notification.objects.create(
                 user=user,
-                title=f"Email: {notification_type.replace('_', ' ').title()}",
+                title=subject,
                 message=f"Email sent to {recipient_email}",
-                notification_type='email',
-                is_read=False,
-                metadata={
+                notification_type=(
+                    notification_type if notification_type in valid_types
+                    else Notification.NotificationType.SYSTEM_ANNOUNCEMENT
+                ),
+                data={
                     'email_type': notification_type,
                     'recipient_email': recipient_email,
                     'recipient_name': recipient_name,
-                    'email_data': data
+                    'email_data': data,
+                    'queued_email_id': queued_email.id,
                 }
             )
-        else:
-            # For non-registered users, we'll just log the email
-            notification = None
-        
-        # TODO: Implement actual email sending with your email service
-        # For now, we'll just log the email that would be sent
-        print(f"📧 Email Notification:")
-        print(f"   Type: {notification_type}")
-        print(f"   To: {recipient_name} <{recipient_email}>")
-        print(f"   Data: {data}")
-        
-        # In production, you would integrate with:
-        # - SendGrid
-        # - AWS SES
-        # - Mailgun
-        # - Or any other email service
         
         response_data = {
             'message': 'Email notification queued successfully',
             'email_type': notification_type,
-            'recipient': recipient_email
+            'recipient': recipient_email,
+            'queued_email_id': queued_email.id
         }
         
         if notification:
@@ -204,9 +248,8 @@ def notification_preferences(request):
     """
     Get current user's notification preferences.
     """
-    preferences, created = NotificationPreference.objects.get_or_create(
-        user=request.user
-    )
+    preferences = get_preferences(request.user.id)
+    preferences.user = request.user
     serializer = NotificationPreferenceSerializer(preferences)
     return Response(serializer.data)
 
@@ -217,9 +260,8 @@ def update_notification_preferences(request):
     """
     Update current user's notification preferences.
     """
-    preferences, created = NotificationPreference.objects.get_or_create(
-        user=request.user
-    )
+    preferences = get_or_create_preferences(request.user.id)
+    preferences.user = request.user
     serializer = NotificationPreferenceSerializer(
         preferences,
         data=request.data,
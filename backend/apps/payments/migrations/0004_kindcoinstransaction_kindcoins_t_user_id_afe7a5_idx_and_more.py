@@ -0,0 +1,40 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foods', '0006_foodlisting_distance'),
+        ('payments', '0003_pesapalorder_deleted_at_pesapalorder_is_deleted'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='kindcoinstransaction',
+            index=models.Index(fields=['user', '-created_at'], name='kindcoins_t_user_id_afe7a5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='kindcoinstransaction',
+            index=models.Index(fields=['user', 'transaction_type', '-created_at'], name='kindcoins_t_user_id_80ad35_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paymentintent',
+            index=models.Index(fields=['user', '-created_at'], name='payment_int_user_id_01c2fa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paymentintent',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='payment_int_user_id_2d4a66_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', '-created_at'], name='transaction_user_id_ced08a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='transaction_user_id_e49c40_idx'),
+        ),
+    ]
@@ -78,6 +78,10 @@ class PaymentIntent(BaseModel):
         verbose_name = 'Payment Intent'
         verbose_name_plural = 'Payment Intents'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', 'status', '-created_at']),
+        ]
 
     def __str__(self):
         return f"Payment Intent {self.stripe_payment_intent_id} - {self.user.get_full_name()}"
@@ -147,6 +151,10 @@ class Transaction(BaseModel):
         verbose_name = 'Transaction'
         verbose_name_plural = 'Transactions'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', 'status', '-created_at']),
+        ]
 
     def __str__(self):
         return f"Transaction {self.id} - {self.user.get_full_name()}"
@@ -234,6 +242,10 @@ class KindCoinsTransaction(BaseModel):
         verbose_name = 'KindCoins Transaction'
         verbose_name_plural = 'KindCoins Transactions'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', 'transaction_type', '-created_at']),
+        ]
 
     def __str__(self):
         return f"KindCoins {self.get_transaction_type_display()} - {self.user.get_full_name()}"
@@ -15,6 +15,7 @@ from .models import (
 )
 from .models import PesapalOrder
 from .services.pesapal import PesapalClient
+from apps.common.idempotency import idempotent
 from .serializers import (
     PaymentMethodSerializer, PaymentMethodCreateSerializer,
     PaymentIntentSerializer, PaymentIntentCreateSerializer,
@@ -31,7 +32,7 @@ class PaymentMethodViewSet(ModelViewSet):
     
     def get_queryset(self):
         """Get payment methods for the current user."""
-        return PaymentMethod.objects.filter(user=self.request.user)
+        return PaymentMethod.objects.filter(user=self.request.user).select_related('user')
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -77,7 +78,7 @@ class PaymentIntentViewSet(ModelViewSet):
     
     def get_queryset(self):
         """Get payment intents for the current user."""
-        return PaymentIntent.objects.filter(user=self.request.user)
+        return PaymentIntent.objects.filter(user=self.request.user).select_related('user')
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -111,7 +112,7 @@ class TransactionViewSet(ModelViewSet):
     
     def get_queryset(self):
         """Get transactions for the current user."""
-        return Transaction.objects.filter(user=self.request.user)
+        return Transaction.objects.filter(user=self.request.user).select_related('user')
 
 
 class RefundViewSet(ModelViewSet):
@@ -122,7 +123,7 @@ class RefundViewSet(ModelViewSet):
     
     def get_queryset(self):
         """Get refunds for the current user's transactions."""
-        return Refund.objects.filter(transaction__user=self.request.user)
+        return Refund.objects.filter(transaction__user=self.request.user).select_related('transaction__user')
     
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -140,11 +141,12 @@ class KindCoinsTransactionView(ListAPIView):
     
     def get_queryset(self):
         """Get KindCoins transactions for the current user."""
-        return KindCoinsTransaction.objects.filter(user=self.request.user)
+        return KindCoinsTransaction.objects.filter(user=self.request.user).select_related('user')
 
 
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
+@idempotent
 def create_payment_intent(request):
     """
     Create a new payment intent.
@@ -171,6 +173,7 @@ def create_payment_intent(request):
 
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
+@idempotent
 def process_payment(request):
     """
     Process a payment.
@@ -290,8 +293,8 @@ def payment_stats(request):
     ).aggregate(total=Sum('amount'))['total'] or 0)
     
     # Recent transactions
-    recent_transactions = transactions[:10]
-    recent_kindcoins_transactions = kindcoins_transactions[:10]
+    recent_transactions = transactions.select_related('user')[:10]
+    recent_kindcoins_transactions = kindcoins_transactions.select_related('user')[:10]
     
     stats_data = {
         'total_transactions': total_transactions,
@@ -303,10 +306,9 @@ def payment_stats(request):
         'kindcoins_balance': kindcoins_balance,
         'kindcoins_earned': kindcoins_earned,
         'kindcoins_spent': kindcoins_spent,
-        'recent_transactions': TransactionSerializer(recent_transactions, many=True).data,
-        'recent_kindcoins_transactions': KindCoinsTransactionSerializer(
-            recent_kindcoins_transactions, many=True
-        ).data
+        # Serialized by PaymentStatsSerializer's nested serializers
+        'recent_transactions': recent_transactions,
+        'recent_kindcoins_transactions': recent_kindcoins_transactions,
     }
     
     serializer = PaymentStatsSerializer(stats_data)
@@ -328,6 +330,7 @@ def kindcoins_balance(request):
 # Pesapal Integration
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
+@idempotent
 def pesapal_initiate(request):
     amount = request.data.get('amount')
     currency = (request.data.get('currency') or 'UGX').upper()
@@ -1,8 +1,26 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def restore_search_index(sender, using, **kwargs):
+    """
+    Recreate the users_fts triggers after migrate: SQLite drops them
+    whenever a migration rebuilds the users table.
+    """
+    from django.db import connections
+    from django.db.migrations.recorder import MigrationRecorder
+
+    from .directory import ensure_search_index
+
+    connection = connections[using]
+    applied = MigrationRecorder(connection).applied_migrations()
+    if ('users', '0003_user_users_joined_alive_idx_and_more') in applied:
+        ensure_search_index(connection)
 
 
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.users'
 
-
+    def ready(self):
+        post_migrate.connect(restore_search_index, sender=self)
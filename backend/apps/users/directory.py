@@ -0,0 +1,232 @@
+"""
+Admin user directory: filtering, full-text search and keyset pagination.
+
+Pages are ordered by (-date_joined, -id) and continue from an opaque cursor
+holding the last row's sort key, so every page is an index range scan no
+matter how deep it is. Search uses an SQLite FTS5 index over first name,
+last name, email and business name (`users_fts`, kept in step with the
+users table by triggers); other databases, or SQLite builds without FTS5,
+fall back to icontains lookups.
+"""
+import base64
+import csv
+import json
+import re
+
+from django.db import OperationalError, connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import User
+
+FTS_TABLE = 'users_fts'
+SEARCH_FIELDS = ['first_name', 'last_name', 'email', 'business_name']
+TOKEN = re.compile(r'\w+', re.UNICODE)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+EXPORT_FIELDS = [
+    'id', 'email', 'first_name', 'last_name', 'user_role', 'phone', 'location',
+    'business_name', 'kind_coins', 'is_verified', 'is_active', 'date_joined', 'last_login',
+]
+EXPORT_CHUNK_SIZE = 2000
+
+_CREATE_FTS = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        first_name, last_name, email, business_name,
+        content='users', content_rowid='id', tokenize='unicode61'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, first_name, last_name, email, business_name)
+        VALUES (new.id, new.first_name, new.last_name, new.email, new.business_name);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, first_name, last_name, email, business_name)
+        VALUES ('delete', old.id, old.first_name, old.last_name, old.email, old.business_name);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS users_fts_update
+        AFTER UPDATE OF first_name, last_name, email, business_name ON users BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, first_name, last_name, email, business_name)
+        VALUES ('delete', old.id, old.first_name, old.last_name, old.email, old.business_name);
+        INSERT INTO {FTS_TABLE}(rowid, first_name, last_name, email, business_name)
+        VALUES (new.id, new.first_name, new.last_name, new.email, new.business_name);
+    END""",
+]
+_TRIGGERS = {'users_fts_insert', 'users_fts_delete', 'users_fts_update'}
+
+_fts_available = None
+
+
+class InvalidCursor(ValueError):
+    """Raised for a cursor that was not produced by this module."""
+
+
+def ensure_search_index(using_connection=None):
+    """
+    Create the FTS5 table and its triggers if missing, rebuilding the index
+    when any trigger had to be (re)created. SQLite drops a table's triggers
+    when a migration rebuilds it, so this also runs after every migrate.
+    Returns False when the database cannot provide FTS5.
+    """
+    global _fts_available
+    conn = using_connection or connection
+    if conn.vendor != 'sqlite':
+        return False
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'users'"
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        try:
+            for statement in _CREATE_FTS:
+                cursor.execute(statement)
+        except OperationalError:
+            # SQLite compiled without FTS5
+            _fts_available = False
+            return False
+        if not _TRIGGERS <= existing:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    _fts_available = True
+    return True
+
+
+def fts_available():
+    global _fts_available
+    if _fts_available is None:
+        _fts_available = (
+            connection.vendor == 'sqlite'
+            and FTS_TABLE in connection.introspection.table_names()
+        )
+    return _fts_available
+
+
+def fts_query(text):
+    """Turn free text into an FTS5 query: every word must match as a prefix."""
+    return ' '.join(f'"{token}"*' for token in TOKEN.findall(text))
+
+
+def search(queryset, text):
+    """Restrict a user queryset to rows matching `text` on name, email or business name."""
+    query = fts_query(text)
+    if not query:
+        return queryset
+    if fts_available():
+        return queryset.filter(
+            id__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [query])
+        )
+
+    condition = Q()
+    for token in TOKEN.findall(text):
+        token_condition = Q()
+        for field in SEARCH_FIELDS:
+            token_condition |= Q(**{f'{field}__icontains': token})
+        condition &= token_condition
+    return queryset.filter(condition)
+
+
+def filter_users(params):
+    """
+    Build the directory queryset from query parameters:
+    role, is_verified, location, joined_after, joined_before and search.
+    Raises ValueError for malformed values.
+    """
+    queryset = User.objects.all()
+
+    role = params.get('role')
+    if role:
+        if role not in User.UserRole.values:
+            raise ValueError(f'Unknown role: {role}')
+        queryset = queryset.filter(user_role=role)
+
+    is_verified = params.get('is_verified')
+    if is_verified:
+        if is_verified.lower() not in ('true', 'false'):
+            raise ValueError('is_verified must be true or false')
+        queryset = queryset.filter(is_verified=is_verified.lower() == 'true')
+
+    location = params.get('location')
+    if location:
+        queryset = queryset.filter(location=location)
+
+    for param, lookup in (('joined_after', 'date_joined__gte'), ('joined_before', 'date_joined__lt')):
+        value = params.get(param)
+        if value:
+            moment = parse_datetime(value) or parse_date(value)
+            if moment is None:
+                raise ValueError(f'{param} must be an ISO date or datetime')
+            queryset = queryset.filter(**{lookup: moment})
+
+    text = params.get('search')
+    if text:
+        queryset = search(queryset, text)
+
+    return queryset.order_by('-date_joined', '-id')
+
+
+def encode_cursor(user):
+    raw = json.dumps([user.date_joined.isoformat(), user.id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        date_joined, user_id = json.loads(raw)
+        moment = parse_datetime(date_joined)
+    except (ValueError, TypeError):
+        raise InvalidCursor('Invalid cursor')
+    if moment is None or not isinstance(user_id, int):
+        raise InvalidCursor('Invalid cursor')
+    return moment, user_id
+
+
+def page(queryset, cursor=None, limit=DEFAULT_PAGE_SIZE):
+    """
+    Return (users, next_cursor) for one page of a queryset ordered by (-date_joined, -id).
+    next_cursor is None on the last page.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    if cursor:
+        date_joined, user_id = decode_cursor(cursor)
+        # The leading range keeps this an index range scan on (date_joined, id)
+        queryset = queryset.filter(
+            Q(date_joined__lte=date_joined),
+            Q(date_joined__lt=date_joined) | Q(id__lt=user_id),
+        )
+    users = list(queryset[:limit + 1])
+    if len(users) > limit:
+        users = users[:limit]
+        return users, encode_cursor(users[-1])
+    return users, None
+
+
+class _Echo:
+    """File-like object whose write() returns the line, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+def _export_value(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+def export_rows(queryset, output='csv'):
+    """
+    Yield the queryset as CSV lines or NDJSON records.
+    Rows are read with .iterator() in EXPORT_CHUNK_SIZE chunks, so memory use
+    stays constant however many users match.
+    """
+    rows = queryset.values_list(*EXPORT_FIELDS).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    if output == 'ndjson':
+        for row in rows:
+            record = {field: _export_value(value) for field, value in zip(EXPORT_FIELDS, row)}
+            yield json.dumps(record) + '\n'
+        return
+
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow([_export_value(value) for value in row])
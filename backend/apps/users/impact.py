@@ -0,0 +1,66 @@
+"""
+Per-user environmental impact counters on UserProfile.
+
+A reservation counts towards its seeker's impact once it is picked up: the
+reserved quantity adds to total_meals_saved, the listing's co2_saved to
+total_co2_saved, and water is estimated from CO2 at WATER_LITERS_PER_KG_CO2.
+Counters are adjusted with F() expressions in the same transaction as the
+status change, so profile reads never have to aggregate reservations.
+`manage.py backfill_impact_counters` recomputes them from scratch.
+"""
+from django.db.models import F, Sum, Value
+from django.db.models.functions import Greatest
+
+from apps.foods.models import FoodReservation
+from .models import UserProfile
+
+COUNTED_STATUS = FoodReservation.Status.PICKED_UP
+WATER_LITERS_PER_KG_CO2 = 10.0
+IMPACT_FIELDS = ['total_meals_saved', 'total_co2_saved', 'total_water_saved']
+
+
+def impact_of(reservation):
+    """(meals, co2 kg, water liters) a picked-up reservation contributes."""
+    co2 = float(reservation.food_listing.co2_saved)
+    return reservation.quantity_reserved, co2, co2 * WATER_LITERS_PER_KG_CO2
+
+
+def add_impact(user_id, meals, co2, water):
+    """Atomically add (or, with negative values, subtract) impact on a user's profile."""
+    UserProfile.all_objects.get_or_create(user_id=user_id)
+    UserProfile.all_objects.filter(user_id=user_id).update(
+        total_meals_saved=Greatest(F('total_meals_saved') + meals, Value(0)),
+        total_co2_saved=Greatest(F('total_co2_saved') + co2, Value(0.0)),
+        total_water_saved=Greatest(F('total_water_saved') + water, Value(0.0)),
+    )
+
+
+def apply_status_change(reservation, old_status, new_status):
+    """
+    Count a reservation that moved to picked_up, or uncount one that left it
+    (e.g. a pickup that was cancelled afterwards). Call inside the transaction
+    that saves the new status.
+    """
+    if (old_status == COUNTED_STATUS) == (new_status == COUNTED_STATUS):
+        return
+    sign = 1 if new_status == COUNTED_STATUS else -1
+    meals, co2, water = impact_of(reservation)
+    add_impact(reservation.seeker_id, sign * meals, sign * co2, sign * water)
+
+
+def compute_impact():
+    """
+    {user_id: (meals, co2, water)} for every user with picked-up reservations,
+    computed with a single grouped query.
+    """
+    rows = (
+        FoodReservation.objects.filter(status=COUNTED_STATUS)
+        .values('seeker_id')
+        .annotate(meals=Sum('quantity_reserved'), co2=Sum('food_listing__co2_saved'))
+        .order_by()
+    )
+    totals = {}
+    for row in rows:
+        co2 = float(row['co2'] or 0)
+        totals[row['seeker_id']] = (row['meals'] or 0, co2, co2 * WATER_LITERS_PER_KG_CO2)
+    return totals
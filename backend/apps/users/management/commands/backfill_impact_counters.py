@@ -0,0 +1,74 @@
+"""
+Management command to recompute UserProfile impact counters from picked-up reservations.
+Totals come from one grouped query; profiles are then created or updated in bulk.
+"""
+import math
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from apps.users.impact import IMPACT_FIELDS, compute_impact
+from apps.users.models import UserProfile
+
+
+def _matches(profile, totals):
+    meals, co2, water = totals
+    return (
+        profile.total_meals_saved == meals
+        and math.isclose(profile.total_co2_saved, co2, abs_tol=1e-6)
+        and math.isclose(profile.total_water_saved, water, abs_tol=1e-6)
+    )
+
+
+class Command(BaseCommand):
+    help = 'Recompute meals, CO2 and water saved on user profiles from picked-up reservations'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Profiles written per bulk query (default: 500)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report profiles that would change without writing them',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        dry_run = options['dry_run']
+
+        self.stdout.write('🌱 Recomputing impact counters...')
+        with transaction.atomic():
+            expected = compute_impact()
+
+            to_update = []
+            for profile in UserProfile.all_objects.select_for_update().only('id', 'user_id', *IMPACT_FIELDS):
+                totals = expected.pop(profile.user_id, (0, 0.0, 0.0))
+                if not _matches(profile, totals):
+                    profile.total_meals_saved, profile.total_co2_saved, profile.total_water_saved = totals
+                    profile.updated_at = timezone.now()
+                    to_update.append(profile)
+
+            # Users with pickups but no profile yet
+            to_create = [
+                UserProfile(
+                    user_id=user_id,
+                    total_meals_saved=meals,
+                    total_co2_saved=co2,
+                    total_water_saved=water,
+                )
+                for user_id, (meals, co2, water) in expected.items()
+            ]
+
+            if not dry_run:
+                UserProfile.all_objects.bulk_update(to_update, IMPACT_FIELDS + ['updated_at'], batch_size=batch_size)
+                UserProfile.all_objects.bulk_create(to_create, batch_size=batch_size)
+
+        verb = 'would be' if dry_run else 'were'
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {len(to_update)} profiles {verb} updated and {len(to_create)} {verb} created'
+        ))
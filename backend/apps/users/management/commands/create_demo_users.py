@@ -18,7 +18,7 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         if options['clear']:
             self.stdout.write('🗑️  Clearing existing demo users...')
-            User.objects.filter(email__contains='@kindbite.demo').delete()
+            User.all_objects.filter(email__contains='@kindbite.demo').delete()
 
         self.stdout.write('👥 Creating demo users...')
 
@@ -121,7 +121,7 @@ class Command(BaseCommand):
         for user_data in demo_users:
             email = user_data['email']
             
-            if User.objects.filter(email=email).exists():
+            if User.all_objects.filter(email=email).exists():
                 self.stdout.write(f'⚠️  User {email} already exists, skipping...')
                 continue
 
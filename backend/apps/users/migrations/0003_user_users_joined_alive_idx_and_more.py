@@ -0,0 +1,37 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:40
+
+from django.db import migrations, models
+
+
+def create_search_index(apps, schema_editor):
+    from apps.users.directory import ensure_search_index
+
+    ensure_search_index(schema_editor.connection)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for trigger in ('users_fts_insert', 'users_fts_delete', 'users_fts_update'):
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    schema_editor.execute('DROP TABLE IF EXISTS users_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_user_users_locatio_bd9f26_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['-date_joined', '-id'], name='users_joined_alive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['user_role', '-date_joined', '-id'], name='users_role_joined_alive_idx'),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
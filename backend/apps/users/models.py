@@ -4,13 +4,17 @@ Clean architecture with role-based user system.
 """
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.db import models
+from django.db.models import Q
 from django.core.validators import RegexValidator
+from apps.common.managers import AliveManager
 from apps.common.models import BaseModel
 
 
-class UserManager(BaseUserManager):
+class UserManager(AliveManager, BaseUserManager):
     """
     Custom user manager for email-based authentication.
+    Like BaseModel's default manager it hides soft-deleted users, so they can
+    no longer log in or be looked up; use User.all_objects to reach them.
     """
     def create_user(self, email, password=None, **extra_fields):
         """
@@ -96,6 +100,20 @@ class User(AbstractUser, BaseModel):
         db_table = 'users'
         verbose_name = 'User'
         verbose_name_plural = 'Users'
+        indexes = [
+            models.Index(fields=['location']),
+            # Keyset pagination of the admin user directory
+            models.Index(
+                fields=['-date_joined', '-id'],
+                name='users_joined_alive_idx',
+                condition=Q(is_deleted=False),
+            ),
+            models.Index(
+                fields=['user_role', '-date_joined', '-id'],
+                name='users_role_joined_alive_idx',
+                condition=Q(is_deleted=False),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.get_full_name()} ({self.email})"
@@ -3,6 +3,7 @@ User serializers for KindBite application.
 Clean, secure serialization for user data.
 """
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
 from django.contrib.auth.password_validation import validate_password
 from .models import User, UserProfile, BusinessProfile
 
@@ -82,6 +83,13 @@ class UserCreateSerializer(serializers.ModelSerializer):
             'email', 'first_name', 'last_name', 'password', 'password_confirm',
             'user_role', 'phone', 'location', 'business_name'
         ]
+        # The default manager hides soft-deleted users, whose emails are still taken
+        extra_kwargs = {
+            'email': {'validators': [UniqueValidator(
+                queryset=User.all_objects.all(),
+                message='A user with this email already exists.',
+            )]},
+        }
     
     def validate(self, attrs):
         """Validate password confirmation."""
@@ -11,5 +11,6 @@ urlpatterns = [
     
     # User management endpoints
     path('list/', views.user_list, name='user-list'),
+    path('export/', views.user_export, name='user-export'),
     path('<int:pk>/', views.user_detail, name='user-detail'),
 ]
\ No newline at end of file
@@ -7,6 +7,9 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 from django.contrib.auth import get_user_model
+from django.http import StreamingHttpResponse
+from apps.common.permissions import IsPlatformAdmin
+from . import directory
 from .serializers import UserDetailSerializer, UserUpdateSerializer
 from .models import User
 
@@ -43,20 +46,45 @@ def update_profile(request):
 
 
 @api_view(['GET'])
-@permission_classes([permissions.IsAuthenticated])
+@permission_classes([IsPlatformAdmin])
 def user_list(request):
     """
-    List all users (admin only).
+    Admin user directory, keyset-paginated.
+    Filters: role, is_verified, location, joined_after, joined_before, search.
+    Pass `next_cursor` back as `cursor` for the next page; `limit` is capped at 200.
     """
-    if not request.user.is_staff:
-        return Response(
-            {'error': 'Permission denied'}, 
-            status=status.HTTP_403_FORBIDDEN
-        )
+    try:
+        users = directory.filter_users(request.query_params)
+        limit = int(request.query_params.get('limit', directory.DEFAULT_PAGE_SIZE))
+        results, next_cursor = directory.page(users, request.query_params.get('cursor'), limit)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     
-    users = User.objects.all()
-    serializer = UserDetailSerializer(users, many=True)
-    return Response(serializer.data)
+    return Response({
+        'results': UserDetailSerializer(results, many=True).data,
+        'next_cursor': next_cursor,
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsPlatformAdmin])
+def user_export(request):
+    """
+    Stream the filtered user directory as CSV (default) or NDJSON (`output=ndjson`).
+    Accepts the same filters as the directory.
+    """
+    output = request.query_params.get('output', 'csv')
+    if output not in ('csv', 'ndjson'):
+        return Response({'error': 'output must be csv or ndjson'}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        users = directory.filter_users(request.query_params)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    
+    content_type = 'text/csv' if output == 'csv' else 'application/x-ndjson'
+    response = StreamingHttpResponse(directory.export_rows(users, output), content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="kindbite-users.{output}"'
+    return response
 
 
 @api_view(['GET'])
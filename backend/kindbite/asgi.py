@@ -1,5 +1,6 @@
 """
 ASGI config for KindBite project.
+HTTP is served by Django; WebSockets are routed to Channels consumers.
 """
 
 import os
@@ -7,6 +8,18 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'kindbite.settings')
 
-application = get_asgi_application()
+# Initialise Django before importing consumers that use the ORM
+django_asgi_app = get_asgi_application()
 
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+from channels.security.websocket import AllowedHostsOriginValidator  # noqa: E402
 
+from apps.authentication.websocket import JWTAuthMiddleware  # noqa: E402
+from apps.notifications.routing import websocket_urlpatterns  # noqa: E402
+
+application = ProtocolTypeRouter({
+    'http': django_asgi_app,
+    'websocket': AllowedHostsOriginValidator(
+        JWTAuthMiddleware(URLRouter(websocket_urlpatterns))
+    ),
+})
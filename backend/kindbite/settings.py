@@ -11,9 +11,14 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from pathlib import Path
+import logging
 import os
+import sys
+
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -71,6 +76,7 @@ INSTALLED_APPS = [
     'apps.common',
     'apps.notifications',
     'apps.payments',
+    'apps.leaderboards',
 ]
 
 MIDDLEWARE = [
@@ -107,6 +113,74 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'kindbite.wsgi.application'
+ASGI_APPLICATION = 'kindbite.asgi.application'
+
+# Channel layer for WebSocket notification push.
+# Most notifications are pushed from the dispatch_outbox worker, so the web and
+# worker processes must share one layer: set CHANNEL_REDIS_URL (channels-redis).
+# Without it the in-memory layer is used, which only reaches sockets of its own
+# process (fine for development, tests and WSGI-only deploys without WebSockets).
+CHANNEL_REDIS_URL = os.environ.get('CHANNEL_REDIS_URL', '')
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+if CHANNEL_REDIS_URL:
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels_redis.core.RedisChannelLayer',
+            'CONFIG': {'hosts': [CHANNEL_REDIS_URL]},
+        }
+    }
+else:
+    CHANNEL_LAYERS = {
+        'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}
+    }
+    if not (DEBUG or TESTING):
+        logger.warning(
+            'CHANNEL_REDIS_URL is not set: using the in-memory channel layer, so notifications '
+            'pushed by the outbox worker do not reach WebSocket clients of the web process'
+        )
+
+
+# Cache for hot lookups (authenticated users, notification preferences,
+# recommendation versions). Invalidations must reach every web and worker
+# process, so production should use a shared Redis cache (CACHE_REDIS_URL, uses
+# redis-py). Without it the per-process local-memory cache is used with every
+# entry capped at CACHE_LOCAL_MAX_SECONDS, so a change made in another process
+# is seen within that time.
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL', '')
+if CACHE_REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_REDIS_URL,
+            'KEY_PREFIX': 'kindbite',
+        }
+    }
+    CACHE_LOCAL_MAX_SECONDS = None
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'kindbite',
+            'OPTIONS': {'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', '50000'))},
+        }
+    }
+    CACHE_LOCAL_MAX_SECONDS = int(os.environ.get('CACHE_LOCAL_MAX_SECONDS', '10'))
+    if not (DEBUG or TESTING):
+        logger.warning(
+            'CACHE_REDIS_URL is not set: using the per-process local-memory cache, so '
+            'invalidations reach other processes only after CACHE_LOCAL_MAX_SECONDS'
+        )
+
+
+def _cache_seconds(seconds):
+    """Cache timeout, capped for the per-process cache; None means no expiry."""
+    if CACHE_LOCAL_MAX_SECONDS is None:
+        return seconds
+    return CACHE_LOCAL_MAX_SECONDS if seconds is None else min(seconds, CACHE_LOCAL_MAX_SECONDS)
+
+
+# Timeout of version keys (auth user versions, recommendation listings version)
+CACHE_VERSION_TIMEOUT = _cache_seconds(None)
 
 
 # Database
@@ -138,6 +212,18 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+PASSWORD_HASHERS = [
+    'apps.authentication.hashers.ConfigurablePBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# PBKDF2 iterations for new password hashes. Only honoured with DEBUG on, so load
+# tests can use a cheap hash; production always uses Django's default cost.
+PASSWORD_HASH_ITERATIONS = int(os.environ.get('PASSWORD_HASH_ITERATIONS', '0')) if DEBUG else 0
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -172,12 +258,17 @@ AUTH_USER_MODEL = 'users.User'
 # Django REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.authentication.authentication.CachedJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson-backed when installed (`pip install orjson`), DRF's JSONRenderer otherwise
+    'DEFAULT_RENDERER_CLASSES': [
+        'apps.common.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
 }
@@ -213,6 +304,11 @@ CORS_ALLOW_HEADERS = [
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
+    'idempotency-key',
+]
+
+CORS_EXPOSE_HEADERS = [
+    'idempotent-replayed',
 ]
 
 # CSRF trusted origins for hosted domain
@@ -249,6 +345,103 @@ SIMPLE_JWT = {
     'SLIDING_TOKEN_REFRESH_LIFETIME': timedelta(days=1),
 }
 
+# Seconds an authenticated user stays cached for JWT requests (dropped on every User save)
+AUTH_USER_CACHE_TIMEOUT = _cache_seconds(int(os.environ.get('AUTH_USER_CACHE_SECONDS', '60')))
+
+# Idempotency-Key storage for retried POST requests
+IDEMPOTENCY_KEY_TTL = timedelta(hours=int(os.environ.get('IDEMPOTENCY_KEY_TTL_HOURS', '24')))
+# An in-progress claim older than this (its process died mid-request) is taken over by a retry
+IDEMPOTENCY_CLAIM_LEASE = timedelta(seconds=int(os.environ.get('IDEMPOTENCY_CLAIM_LEASE_SECONDS', '60')))
+
+# Transactional outbox (side effects dispatched by `manage.py dispatch_outbox`)
+OUTBOX = {
+    'BATCH_SIZE': int(os.environ.get('OUTBOX_BATCH_SIZE', '100')),
+    'POLL_INTERVAL': float(os.environ.get('OUTBOX_POLL_INTERVAL', '1.0')),
+    'MAX_ATTEMPTS': int(os.environ.get('OUTBOX_MAX_ATTEMPTS', '8')),
+    'RETRY_BASE_DELAY': timedelta(seconds=int(os.environ.get('OUTBOX_RETRY_BASE_SECONDS', '10'))),
+    'RETRY_MAX_DELAY': timedelta(hours=1),
+    'VISIBILITY_TIMEOUT': timedelta(minutes=5),
+}
+
+# Email Configuration
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+EMAIL_HOST = os.environ.get('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.environ.get('EMAIL_PORT', '25'))
+EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'False').lower() == 'true'
+EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')
+EMAIL_TIMEOUT = int(os.environ.get('EMAIL_TIMEOUT', '10'))
+DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@kindbite.com')
+# Sink for load tests: EMAIL_BACKEND=django.core.mail.backends.filebased.EmailBackend
+EMAIL_FILE_PATH = os.environ.get('EMAIL_FILE_PATH', str(BASE_DIR / 'logs' / 'mail'))
+
+# Batched email delivery (`manage.py send_queued_emails`)
+EMAIL_DISPATCH = {
+    'BATCH_SIZE': int(os.environ.get('EMAIL_DISPATCH_BATCH_SIZE', '500')),
+    'MESSAGES_PER_CONNECTION': int(os.environ.get('EMAIL_DISPATCH_PER_CONNECTION', '100')),
+    'MAX_CONNECTIONS': int(os.environ.get('EMAIL_DISPATCH_MAX_CONNECTIONS', '4')),
+    'MAX_ATTEMPTS': int(os.environ.get('EMAIL_DISPATCH_MAX_ATTEMPTS', '5')),
+    'RETRY_BASE_DELAY': timedelta(seconds=30),
+}
+
+# Data retention (`manage.py apply_retention`, run daily off-peak)
+RETENTION = {
+    'READ_NOTIFICATION_DAYS': int(os.environ.get('RETENTION_READ_NOTIFICATION_DAYS', '90')),
+    'CHAT_SESSION_DAYS': int(os.environ.get('RETENTION_CHAT_SESSION_DAYS', '180')),
+    'SOFT_DELETE_GRACE_DAYS': int(os.environ.get('RETENTION_SOFT_DELETE_GRACE_DAYS', '30')),
+    'BATCH_SIZE': int(os.environ.get('RETENTION_BATCH_SIZE', '500')),
+    'SLEEP_SECONDS': float(os.environ.get('RETENTION_SLEEP_SECONDS', '0.1')),
+}
+
+# Broadcast notification fan-out (runs in the outbox dispatcher)
+NOTIFICATION_FANOUT = {
+    'CHUNK_SIZE': int(os.environ.get('NOTIFICATION_FANOUT_CHUNK_SIZE', '2000')),
+}
+
+# Coalesce bursts of these notification types into one digest row per window
+NOTIFICATION_DIGEST = {
+    'WINDOW': timedelta(minutes=int(os.environ.get('NOTIFICATION_DIGEST_WINDOW_MINUTES', '10'))),
+    'TYPES': [
+        notification_type.strip()
+        for notification_type in os.environ.get('NOTIFICATION_DIGEST_TYPES', 'food_reserved').split(',')
+        if notification_type.strip()
+    ],
+}
+
+# Compiled notification templates kept in memory per process
+NOTIFICATION_TEMPLATE_CACHE_SIZE = int(os.environ.get('NOTIFICATION_TEMPLATE_CACHE_SIZE', '128'))
+
+# Seconds a user's NotificationPreference stays cached (entries are also dropped on save)
+NOTIFICATION_PREFERENCE_CACHE_TIMEOUT = _cache_seconds(int(os.environ.get('NOTIFICATION_PREFERENCE_CACHE_SECONDS', '3600')))
+
+# Bulk listing import (POST /api/foods/listings/bulk/ and /import/)
+BULK_IMPORT = {
+    'MAX_ROWS': int(os.environ.get('BULK_IMPORT_MAX_ROWS', '5000')),
+    'CHUNK_SIZE': int(os.environ.get('BULK_IMPORT_CHUNK_SIZE', '500')),
+}
+
+# Personalized listing recommendations (GET /api/foods/listings/recommended/)
+RECOMMENDATIONS = {
+    'TOP_K': int(os.environ.get('RECOMMENDATIONS_TOP_K', '50')),
+    # Seconds a user's affinity and top-K ids stay cached; both are also dropped on change
+    'CACHE_TIMEOUT': _cache_seconds(int(os.environ.get('RECOMMENDATIONS_CACHE_SECONDS', '600'))),
+    # Recent reservations used for provider and provider type affinity
+    'HISTORY_SIZE': 200,
+    'WEIGHTS': {
+        'dietary': 3.0,
+        'provider': 2.0,
+        'provider_type': 1.0,
+        'distance': 1.5,
+        'discount': 1.0,
+    },
+}
+
+# Real-time notification push
+NOTIFICATION_PUSH = {
+    'HEARTBEAT_FLUSH_INTERVAL': int(os.environ.get('NOTIFICATION_HEARTBEAT_FLUSH_SECONDS', '30')),
+    'CHANNEL_STALE_AFTER': timedelta(seconds=int(os.environ.get('NOTIFICATION_CHANNEL_STALE_SECONDS', '120'))),
+}
+
 # OpenAI Configuration
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY', '')
 OPENAI_MODEL = os.environ.get('OPENAI_MODEL', 'gpt-3.5-turbo')
@@ -274,4 +467,12 @@ GOOGLE_OAUTH = {
     'CLIENT_ID': os.environ.get('GOOGLE_CLIENT_ID', ''),
     'CLIENT_SECRET': os.environ.get('GOOGLE_CLIENT_SECRET', ''),
     'REDIRECT_URI': os.environ.get('GOOGLE_REDIRECT_URI', 'https://kindbite.pythonanywhere.com/'),
+    # Point at `manage.py run_google_stub` (e.g. http://127.0.0.1:8765/.well-known/openid-configuration) for local tests
+    'DISCOVERY_URL': os.environ.get(
+        'GOOGLE_DISCOVERY_URL', 'https://accounts.google.com/.well-known/openid-configuration'
+    ),
+    'TIMEOUT': float(os.environ.get('GOOGLE_OAUTH_TIMEOUT', '5')),
+    'POOL_SIZE': int(os.environ.get('GOOGLE_OAUTH_POOL_SIZE', '10')),
+    'JWKS_CACHE_SECONDS': int(os.environ.get('GOOGLE_JWKS_CACHE_SECONDS', '3600')),
+    'CLOCK_SKEW_SECONDS': int(os.environ.get('GOOGLE_CLOCK_SKEW_SECONDS', '30')),
 }
\ No newline at end of file
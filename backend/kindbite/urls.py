@@ -27,6 +27,7 @@ urlpatterns = [
     path('api/ai-chat/', include('apps.ai_chat.urls')),
     path('api/notifications/', include('apps.notifications.urls')),
     path('api/payments/', include('apps.payments.urls')),
+    path('api/leaderboards/', include('apps.leaderboards.urls')),
     path('health/', lambda request: JsonResponse({'status': 'ok'})),
     # Catch-all route to serve React SPA
     path('', TemplateView.as_view(template_name='index.html'), name='spa-index'),